@@ -1,8 +1,11 @@
 """Base configuration for Topaz automation"""
 import os
 from pathlib import Path
+from typing import Iterator
 from dotenv import load_dotenv
 
+from utils.image_scan import extension_set, scan_image_entries, iter_image_files, list_image_files
+
 # .env 파일 로드
 load_dotenv()
 
@@ -16,17 +19,153 @@ class BaseConfig:
     # 로그 설정
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
     LOG_DIR = PROJECT_ROOT / 'logs'
+    JOURNAL_DIR = LOG_DIR / 'journal'  # 입력 폴더별 작업 저널 (--resume용)
     
     # 처리 대기 시간 설정
     PROCESSING_WAIT_TIME = int(os.getenv('PROCESSING_WAIT_TIME', '5'))
     MAX_WAIT_TIME = int(os.getenv('MAX_WAIT_TIME', '300'))
     
+    # 입력 동작별 대기 시간 프로파일
+    # 내장 이름('safe', 'fast') 또는 장비별 JSON 파일 경로
+    # 지정하지 않으면 --calibrate로 만든 프로파일이 있을 때 그것을 사용
+    CALIBRATED_PROFILE_PATH = Path(os.getenv(
+        'CALIBRATED_PROFILE_PATH',
+        str(PROJECT_ROOT / 'config' / 'delay_profile.json')
+    ))
+    DELAY_PROFILE = os.getenv('DELAY_PROFILE') or (
+        str(CALIBRATED_PROFILE_PATH) if CALIBRATED_PROFILE_PATH.exists() else 'safe'
+    )
+    CALIBRATION_MARGIN = float(os.getenv('CALIBRATION_MARGIN', '0.3'))  # 측정 최대값 대비 여유 30%
+    
+    # 낙관적 입력 실행 (최소 대기 후 사후 조건 확인, 실패 시 재시도)
+    OPTIMISTIC_INPUT = os.getenv('OPTIMISTIC_INPUT', 'false').lower() in ('1', 'true', 'yes')
+    OPTIMISTIC_MAX_ATTEMPTS = int(os.getenv('OPTIMISTIC_MAX_ATTEMPTS', '3'))
+    OPTIMISTIC_INITIAL_SCALE = float(os.getenv('OPTIMISTIC_INITIAL_SCALE', '0.25'))  # 첫 시도 대기 배율
+    
+    # 내용 해시 기반 결과 캐시 (같은 원본이 다른 이름으로 다시 들어오면 이전 결과 재사용)
+    RESULT_CACHE = os.getenv('RESULT_CACHE', 'false').lower() in ('1', 'true', 'yes')
+    RESULT_CACHE_PATH = Path(os.getenv(
+        'RESULT_CACHE_PATH',
+        str(PROJECT_ROOT / 'cache' / 'result_cache.jsonl')
+    ))
+    # 앱 안의 모델/배율 설정을 바꿨다면 이 값을 바꿔 이전 결과를 무효화
+    RESULT_CACHE_TAG = os.getenv('RESULT_CACHE_TAG', '')
+    HASH_WORKERS = int(os.getenv('HASH_WORKERS', '4'))  # 해시 계산 스레드 수
+    
+    # 자동 저장 결과 파일 찾기 (저장 전후 후보 폴더 비교) 및 입력 ↔ 결과 인덱스
+    OUTPUT_INDEX = os.getenv('OUTPUT_INDEX', 'true').lower() in ('1', 'true', 'yes')
+    OUTPUT_INDEX_PATH = Path(os.getenv(
+        'OUTPUT_INDEX_PATH',
+        str(PROJECT_ROOT / 'cache' / 'output_index.jsonl')
+    ))
+    # 원본 폴더/Export 폴더 외에 Topaz가 결과를 저장할 수 있는 폴더 (os.pathsep으로 구분)
+    OUTPUT_SEARCH_DIRS = [Path(p) for p in os.getenv('OUTPUT_SEARCH_DIRS', '').split(os.pathsep) if p]
+    OUTPUT_LOCATE_TIMEOUT = float(os.getenv('OUTPUT_LOCATE_TIMEOUT', '10'))  # 저장 후 결과 파일 대기 (초)
+    
+    # 처리 기록: 처리한 입력/찾은 결과물을 (경로, 크기, 수정 시각)으로 기록해 파일명과 무관하게 제외
+    PROCESSED_MANIFEST = os.getenv('PROCESSED_MANIFEST', 'false').lower() in ('1', 'true', 'yes')
+    PROCESSED_MANIFEST_PATH = Path(os.getenv(
+        'PROCESSED_MANIFEST_PATH',
+        str(PROJECT_ROOT / 'cache' / 'processed_manifest.bin')
+    ))
+    # 이 항목 수를 넘으면 정확한 집합 대신 Bloom filter만 사용 (오탐률 PROCESSED_MANIFEST_FP_RATE)
+    PROCESSED_MANIFEST_MAX_EXACT = int(os.getenv('PROCESSED_MANIFEST_MAX_EXACT', '1000000'))
+    PROCESSED_MANIFEST_FP_RATE = float(os.getenv('PROCESSED_MANIFEST_FP_RATE', '1e-6'))
+    
+    # 유사 이미지(재인코딩/메타데이터만 다른 이미지) 제외
+    DEDUPE = os.getenv('DEDUPE', 'false').lower() in ('1', 'true', 'yes')
+    DEDUPE_THRESHOLD = int(os.getenv('DEDUPE_THRESHOLD', '4'))  # 64비트 dHash 기준 최대 해밍 거리
+    DEDUPE_WORKERS = int(os.getenv('DEDUPE_WORKERS')) if os.getenv('DEDUPE_WORKERS') else None  # None이면 CPU 수
+    
+    # 처리 순서 정책: name(이름순), sjf(짧은 작업 먼저), ljf(긴 작업 먼저), dims(크기별 묶음)
+    # 예상 처리 시간 = 기본 시간 + 메가픽셀 × 메가픽셀당 시간 (헤더에서 해상도만 읽음)
+    SCHEDULE_POLICY = os.getenv('SCHEDULE_POLICY', '')  # 비우면 스케줄러 사용 안 함 (이름순)
+    SCHEDULE_BASE_SECONDS = float(os.getenv('SCHEDULE_BASE_SECONDS', '30'))
+    SCHEDULE_SECONDS_PER_MP = float(os.getenv('SCHEDULE_SECONDS_PER_MP', '1.0'))
+    
+    # 입력 사전 검사: 손상/미지원 파일을 GUI에서 열기 전에 프로세스 풀에서 걸러냄
+    PREFLIGHT = os.getenv('PREFLIGHT', 'false').lower() in ('1', 'true', 'yes')
+    PREFLIGHT_WORKERS = int(os.getenv('PREFLIGHT_WORKERS')) if os.getenv('PREFLIGHT_WORKERS') else None  # None이면 CPU 수
+    PREFLIGHT_MIN_SIDE = int(os.getenv('PREFLIGHT_MIN_SIDE', '16'))  # 최소 너비/높이 (픽셀)
+    # 제외할 PIL 색상 모드 (쉼표 구분, 예: "1,P,CMYK")
+    PREFLIGHT_REJECT_MODES = tuple(m.strip() for m in os.getenv('PREFLIGHT_REJECT_MODES', '').split(',') if m.strip())
+    
+    # 입력 사전 정규화: 규칙에 걸리는 파일을 GUI보다 먼저 8비트 RGB로 변환해 그 파일을 열게 함
+    NORMALIZE = os.getenv('NORMALIZE', 'false').lower() in ('1', 'true', 'yes')
+    NORMALIZE_DIR = Path(os.getenv('NORMALIZE_DIR', str(PROJECT_ROOT / 'cache' / 'normalized')))
+    NORMALIZE_MAX_MEGAPIXELS = float(os.getenv('NORMALIZE_MAX_MEGAPIXELS', '0'))  # 0이면 축소 안 함
+    NORMALIZE_MAX_BIT_DEPTH = int(os.getenv('NORMALIZE_MAX_BIT_DEPTH', '8'))
+    # RGB로 변환할 PIL 색상 모드 (쉼표 구분)
+    NORMALIZE_COLOR_MODES = tuple(
+        m.strip() for m in os.getenv('NORMALIZE_COLOR_MODES', 'CMYK,LAB,YCbCr').split(',') if m.strip()
+    )
+    NORMALIZE_FORMAT = os.getenv('NORMALIZE_FORMAT', 'png')  # png 또는 tiff
+    NORMALIZE_WORKERS = int(os.getenv('NORMALIZE_WORKERS')) if os.getenv('NORMALIZE_WORKERS') else None
+    
+    # 결과물 후처리 (검증, 체크섬, 시각 복사, 최종 위치 이동)를 GUI 루프와 겹쳐 스레드 풀에서 실행
+    POSTPROCESS = os.getenv('POSTPROCESS', 'false').lower() in ('1', 'true', 'yes')
+    POSTPROCESS_WORKERS = int(os.getenv('POSTPROCESS_WORKERS', '2'))
+    POSTPROCESS_DEST_DIR = Path(os.getenv('POSTPROCESS_DEST_DIR')) if os.getenv('POSTPROCESS_DEST_DIR') else None
+    POSTPROCESS_CHECKSUM = os.getenv('POSTPROCESS_CHECKSUM', 'true').lower() in ('1', 'true', 'yes')
+    POSTPROCESS_COPY_TIMES = os.getenv('POSTPROCESS_COPY_TIMES', 'true').lower() in ('1', 'true', 'yes')
+    
+    # 단계별 재시도 (열기/처리 대기/저장/다이얼로그 닫기) 및 앱 재시작 서킷 브레이커
+    RETRY = os.getenv('RETRY', 'false').lower() in ('1', 'true', 'yes')
+    RETRY_ATTEMPTS = int(os.getenv('RETRY_ATTEMPTS', '3'))  # 단계별 기본 최대 시도 횟수
+    # 단계별 최대 시도 횟수 (예: "open=3,wait=2,save=2,close_dialog=3")
+    RETRY_STEP_ATTEMPTS = {
+        name.strip(): int(value)
+        for name, _, value in (item.partition('=') for item in os.getenv('RETRY_STEP_ATTEMPTS', '').split(','))
+        if name.strip() and value.strip()
+    }
+    RETRY_BASE_DELAY = float(os.getenv('RETRY_BASE_DELAY', '1.0'))  # 첫 재시도 전 대기 (초, 이후 2배씩)
+    RETRY_MAX_DELAY = float(os.getenv('RETRY_MAX_DELAY', '15.0'))
+    CIRCUIT_BREAKER_THRESHOLD = int(os.getenv('CIRCUIT_BREAKER_THRESHOLD', '3'))  # 연속 실패 K번이면 앱 재시작
+    CIRCUIT_BREAKER_MAX_RESTARTS = int(os.getenv('CIRCUIT_BREAKER_MAX_RESTARTS', '5'))  # 실행당 최대 재시작 횟수
+    
+    # 앱 멈춤 감시 (PROCESS_NAME 프로세스의 CPU 시간/생존 여부 + 윈도우 응답 확인)
+    WATCHDOG = os.getenv('WATCHDOG', 'false').lower() in ('1', 'true', 'yes')
+    WATCHDOG_INTERVAL = float(os.getenv('WATCHDOG_INTERVAL', '1.0'))  # 확인 주기 (초)
+    WATCHDOG_HANG_SECONDS = float(os.getenv('WATCHDOG_HANG_SECONDS', '5'))  # CPU 사용 없이 무응답이면 멈춤
+    WATCHDOG_BUSY_HANG_SECONDS = float(os.getenv('WATCHDOG_BUSY_HANG_SECONDS', '60'))  # CPU 사용 중 무응답이면 멈춤
+    WATCHDOG_PROBE_TIMEOUT = float(os.getenv('WATCHDOG_PROBE_TIMEOUT', '0.5'))  # 윈도우 응답 확인 제한 시간 (초)
+    
+    # Export 완료 감지 방식: time(고정 대기), ocr, template, process(CPU/쓰기 I/O 유휴)
+    COMPLETION_PROBE = os.getenv('COMPLETION_PROBE', 'time')
+    COMPLETION_POLL_INTERVAL = float(os.getenv('COMPLETION_POLL_INTERVAL', '0.5'))  # 확인 간격 (초)
+    PROCESS_IDLE_CPU_PERCENT = float(os.getenv('PROCESS_IDLE_CPU_PERCENT', '5'))  # 학습 전 유휴 CPU 기준 (%)
+    PROCESS_IDLE_DWELL = float(os.getenv('PROCESS_IDLE_DWELL', '1.5'))  # 유휴 유지 시간 최소값 (초)
+    PROCESS_IDLE_MAX_DWELL = float(os.getenv('PROCESS_IDLE_MAX_DWELL', '10'))  # 학습된 유지 시간 상한 (초)
+    
+    # 앱 재활용: 최근 이미지의 처리 시간/앱 메모리가 실행 초반 기준보다 나빠지면 이미지 사이에서 재시작
+    RECYCLE = os.getenv('RECYCLE', 'false').lower() in ('1', 'true', 'yes')
+    RECYCLE_WINDOW = int(os.getenv('RECYCLE_WINDOW', '10'))  # 슬라이딩 윈도우 크기 (이미지 수)
+    RECYCLE_BASELINE_IMAGES = int(os.getenv('RECYCLE_BASELINE_IMAGES', '5'))  # 기준값을 잡을 초반 이미지 수
+    RECYCLE_SLOWDOWN = float(os.getenv('RECYCLE_SLOWDOWN', '0.3'))  # 처리 시간 30% 증가 시 재시작
+    RECYCLE_RSS_GROWTH = float(os.getenv('RECYCLE_RSS_GROWTH', '0.5'))  # 앱 메모리 50% 증가 시 재시작 (0이면 끔)
+    RECYCLE_RSS_LIMIT_MB = float(os.getenv('RECYCLE_RSS_LIMIT_MB', '0'))  # 앱 메모리 절대 상한 (MB, 0이면 끔)
+    RECYCLE_MAX_RESTARTS = int(os.getenv('RECYCLE_MAX_RESTARTS', '20'))  # 실행당 최대 재활용 횟수
+    
+    # --watch 모드: 마지막 파일 이벤트 후 이 시간 동안 변화가 없어야 처리 (복사 중 파일 제외)
+    WATCH_DEBOUNCE = float(os.getenv('WATCH_DEBOUNCE', '2.0'))
+    WATCH_POLL_INTERVAL = float(os.getenv('WATCH_POLL_INTERVAL', '1.0'))
+    
     # 키보드 단축키
     SHORTCUT_OPEN = 'ctrl+o'
     SHORTCUT_SAVE = 'ctrl+s'
     
     # 이미지 확장자
     SUPPORTED_IMAGE_EXTENSIONS = ['.jpg', '.jpeg', '.png', '.tiff', '.tif', '.bmp', '.webp']
+    IMAGE_EXTENSIONS = extension_set(SUPPORTED_IMAGE_EXTENSIONS)  # 소문자 조회용
+    
+    # 입력 폴더의 하위 폴더까지 검색 (--recursive, 감시 모드는 항상 입력 폴더만)
+    RECURSIVE_SCAN = os.getenv('RECURSIVE_SCAN', 'false').lower() in ('1', 'true', 'yes')
+    
+    # 탐색 캐시: 디렉토리별 mtime/목록을 저장해 반복 실행에서 바뀐 디렉토리만 다시 나열 (--scan-cache)
+    SCAN_CACHE = os.getenv('SCAN_CACHE', 'false').lower() in ('1', 'true', 'yes')
+    SCAN_CACHE_PATH = Path(os.getenv('SCAN_CACHE_PATH', str(PROJECT_ROOT / 'cache' / 'scan_cache.bin')))
+    # mtime이 같아도 이 시간(시)이 지난 디렉토리 목록은 다시 나열 (0이면 mtime만 비교)
+    SCAN_CACHE_MAX_AGE_HOURS = float(os.getenv('SCAN_CACHE_MAX_AGE_HOURS', '24'))
     
     @classmethod
     def ensure_directories(cls):
@@ -34,43 +173,73 @@ class BaseConfig:
         cls.LOG_DIR.mkdir(parents=True, exist_ok=True)
     
     @classmethod
-    def get_image_files(cls, directory: Path, exclude_suffixes: list = None) -> list:
+    def is_image_file(cls, path: Path, exclude_suffixes: list = None) -> bool:
         """
-        지정된 디렉토리에서 지원하는 이미지 파일 목록 반환
+        처리 대상 이미지 파일인지 확인 (확장자 + 처리된 파일 suffix)
         
         Args:
-            directory: 검색할 디렉토리
-            exclude_suffixes: 제외할 suffix 리스트 (예: ['_upscaled', '_2x'])
+            path: 파일 경로
+            exclude_suffixes: 제외할 suffix 리스트
         
         Returns:
-            이미지 파일 경로 리스트 (중복 제거됨)
+            처리 대상이면 True
+        """
+        path = Path(path)
+        if path.name.startswith('.') or path.suffix.lower() not in cls.IMAGE_EXTENSIONS:
+            return False
+        
+        stem = path.stem.lower()
+        return not any(suffix.lower() in stem for suffix in exclude_suffixes or [])
+    
+    @classmethod
+    def scan_image_entries(cls, directory: Path, recursive: bool = None) -> Iterator[os.DirEntry]:
         """
-        if not directory.exists():
-            return []
+        지정된 디렉토리의 이미지 파일 DirEntry 생성 (크기/수정 시각이 필요한 경우, suffix 필터 없음)
         
-        # 중복 방지를 위해 set 사용
-        image_files_set = set()
+        Args:
+            directory: 검색할 디렉토리
+            recursive: 하위 폴더까지 검색 (None이면 RECURSIVE_SCAN)
         
-        for ext in cls.SUPPORTED_IMAGE_EXTENSIONS:
-            # 소문자 확장자로 검색 (Windows는 대소문자 구분 안 함)
-            image_files_set.update(directory.glob(f'*{ext}'))
-            image_files_set.update(directory.glob(f'*{ext.upper()}'))
+        Yields:
+            os.DirEntry
+        """
+        if recursive is None:
+            recursive = cls.RECURSIVE_SCAN
+        return scan_image_entries(directory, cls.IMAGE_EXTENSIONS, recursive)
+    
+    @classmethod
+    def iter_image_files(cls, directory: Path, exclude_suffixes: list = None, recursive: bool = None) -> Iterator[Path]:
+        """
+        지정된 디렉토리의 이미지 파일을 찾는 대로 생성 (정렬하지 않음)
         
-        # set을 list로 변환
-        image_files = list(image_files_set)
+        디렉토리마다 os.scandir로 한 번만 나열하므로 큰 폴더에서도 첫 파일이 바로 나온다.
         
-        # Suffix 필터링 (이미 처리된 파일 제외)
-        if exclude_suffixes:
-            filtered_files = []
-            for img_file in image_files:
-                # 파일명(확장자 제외)에 suffix가 포함되어 있는지 확인
-                stem = img_file.stem.lower()
-                is_processed = any(suffix.lower() in stem for suffix in exclude_suffixes)
-                
-                if not is_processed:
-                    filtered_files.append(img_file)
-            
-            return sorted(filtered_files)
+        Args:
+            directory: 검색할 디렉토리
+            exclude_suffixes: 제외할 suffix 리스트 (예: ['_upscaled', '_2x'])
+            recursive: 하위 폴더까지 검색 (None이면 RECURSIVE_SCAN)
         
-        return sorted(image_files)
+        Yields:
+            이미지 파일 경로
+        """
+        if recursive is None:
+            recursive = cls.RECURSIVE_SCAN
+        return iter_image_files(directory, cls.IMAGE_EXTENSIONS, exclude_suffixes, recursive)
+    
+    @classmethod
+    def get_image_files(cls, directory: Path, exclude_suffixes: list = None, recursive: bool = None) -> list:
+        """
+        지정된 디렉토리에서 지원하는 이미지 파일 목록 반환
+        
+        Args:
+            directory: 검색할 디렉토리
+            exclude_suffixes: 제외할 suffix 리스트 (예: ['_upscaled', '_2x'])
+            recursive: 하위 폴더까지 검색 (None이면 RECURSIVE_SCAN)
+        
+        Returns:
+            이미지 파일 경로 리스트 (정렬됨)
+        """
+        if recursive is None:
+            recursive = cls.RECURSIVE_SCAN
+        return list_image_files(directory, cls.IMAGE_EXTENSIONS, exclude_suffixes, recursive)
 
@@ -53,6 +53,28 @@ class GigapixelConfig(BaseConfig):
     SAVE_PROCESSING_TEXT = "Processing"  # 저장 중 표시 텍스트
     SAVE_DONE_TEXT = "Done"  # 저장 완료 표시 텍스트
     
+    # 템플릿 방식 완료 감지 (COMPLETION_PROBE=template): Export Settings의 Queue 영역에서 완료 아이콘 찾기
+    EXPORT_DIALOG_TITLE = 'Export Settings'
+    DONE_ICON_TEMPLATE = 'done_folder_icon'  # assets/templates (tools/capture_icon_template.py로 캡처)
+    QUEUE_REGION_RATIOS = {
+        'x_ratio': 0.02,
+        'y_ratio': 0.12,
+        'width_ratio': 0.60,
+        'height_ratio': 0.15
+    }
+    
+    # 배치 큐 모드 (--batch-queue): 여러 이미지를 한 번에 열고 한 번에 Export
+    BATCH_QUEUE_SIZE = int(os.getenv('GIGAPIXEL_BATCH_QUEUE_SIZE', '10'))  # 청크당 이미지 수
+    SHORTCUT_SELECT_ALL = 'ctrl+a'       # 이미지 목록 전체 선택
+    SHORTCUT_CLOSE_ALL = os.getenv('GIGAPIXEL_CLOSE_ALL_SHORTCUT', 'ctrl+shift+w')  # 청크 처리 후 모든 이미지 닫기
+    
+    # 파이프라인 모드 (--pipeline): GUI 단계 앞뒤의 검사/정규화/감지/검증을 동시에 진행
+    PIPELINE_QUEUE_SIZE = int(os.getenv('GIGAPIXEL_PIPELINE_QUEUE_SIZE', '4'))  # 단계 사이 대기 항목 수
+    PIPELINE_CONCURRENCY = int(os.getenv('GIGAPIXEL_PIPELINE_CONCURRENCY', '4'))  # GUI 외 단계의 동시 처리 수
+    
+    # Topaz 설정의 Export 저장 위치 (미지정 시 원본 이미지와 같은 폴더로 간주)
+    EXPORT_DIR = Path(os.getenv('GIGAPIXEL_EXPORT_DIR')) if os.getenv('GIGAPIXEL_EXPORT_DIR') else None
+    
     @classmethod
     def ensure_directories(cls):
         """필요한 디렉토리 생성"""
@@ -39,6 +39,10 @@ class PhotoAIConfig(BaseConfig):
     # 이미지당 export 처리 시간
     EXPORT_PER_IMAGE_WAIT_TIME = 10  # 기본 10초
     
+    # 템플릿 방식 완료 감지 (COMPLETION_PROBE=template): Export 완료 표시 템플릿
+    # python utils/ui_detector.py export_done 으로 캡처
+    EXPORT_DONE_TEMPLATE = os.getenv('PHOTOAI_EXPORT_DONE_TEMPLATE', 'export_done')
+    
     # UI 버튼 절대 좌표 (해상도에 따라 조정 필요!)
     # Apply Autopilot 버튼 좌표 (화면 절대 좌표)
     APPLY_AUTOPILOT_BUTTON_X = None  # 설정 안하면 수동 클릭 필요
@@ -48,6 +52,19 @@ class PhotoAIConfig(BaseConfig):
     EXPORT_BUTTON_X = None  # 설정 안하면 수동 클릭 필요
     EXPORT_BUTTON_Y = None
     
+    # 스테이징 디렉토리 사용 여부
+    # 파일 다이얼로그가 폴더 전체를 불러오므로 대상 이미지만 링크한 임시 폴더를 연다
+    USE_STAGING = os.getenv('PHOTOAI_USE_STAGING', 'true').lower() in ('1', 'true', 'yes')
+    # 스테이징 폴더를 만들 위치 (비우면 입력 폴더 아래, 하드링크는 같은 볼륨에서만 가능)
+    STAGING_DIR = Path(os.getenv('PHOTOAI_STAGING_DIR')) if os.getenv('PHOTOAI_STAGING_DIR') else None
+    
+    # 청크 분할 (앱 메모리 제한 / 실패 시 손실 범위 제한)
+    # 이미지 헤더의 해상도 합계가 예산을 넘거나 파일 수 상한에 도달하면 다음 청크로 넘김
+    CHUNK_MEGAPIXEL_BUDGET = float(os.getenv('PHOTOAI_CHUNK_MEGAPIXELS', '400'))  # 청크당 총 메가픽셀
+    CHUNK_MAX_FILES = int(os.getenv('PHOTOAI_CHUNK_MAX_FILES', '20'))              # 청크당 최대 이미지 수
+    UNKNOWN_IMAGE_MEGAPIXELS = 24.0  # 헤더를 읽지 못한 이미지에 가정할 메가픽셀
+    SHORTCUT_CLOSE_ALL = os.getenv('PHOTOAI_CLOSE_ALL_SHORTCUT', 'ctrl+shift+w')  # 청크 처리 후 모든 이미지 닫기
+    
     # 처리된 파일 구분용 suffix
     PROCESSED_SUFFIXES = [
         '_photoai',
@@ -1,8 +1,10 @@
 """Base controller for Topaz applications"""
+import os
 import time
 import subprocess
 from pathlib import Path
 from abc import ABC, abstractmethod
+from typing import Iterator, Optional
 from loguru import logger
 import pyautogui
 import keyboard
@@ -10,6 +12,24 @@ import pyperclip
 
 from utils.window_manager import WindowManager
 from utils.file_handler import FileHandler
+from utils.state_monitor import StateMonitor
+from utils.focus_tracker import FocusTracker
+from utils.delay_profile import DelayProfile
+from utils.optimistic import OptimisticExecutor
+from utils.job_journal import QUEUED, VERIFIED, FAILED
+from utils.result_cache import app_version
+from utils.perceptual_hash import compute_hashes, group_near_duplicates
+from utils.folder_watcher import FolderWatcher
+from utils.retry_policy import RetryPolicy, CircuitBreaker
+from utils.hang_watchdog import HangWatchdog
+from utils.app_process import PsutilProcessBackend
+from utils.completion_probe import CompletionProbe, ProcessIdleProbe
+from utils.recycle_policy import RecyclePolicy
+from utils.image_info import read_megapixels
+from utils.output_locator import OutputLocator, compile_suffix_pattern, source_stems
+from utils.processed_manifest import ProcessedManifest
+from utils.image_scan import exclude_suffix_entries
+from utils.scan_cache import ScanCache
 
 
 class BaseController(ABC):
@@ -23,10 +43,633 @@ class BaseController(ABC):
         self.config = config
         self.window_manager = WindowManager()
         self.file_handler = FileHandler()
+        self.focus_tracker = FocusTracker(WindowManager.handle_cache.backend)
         
         # PyAutoGUI 안전 설정
         pyautogui.FAILSAFE = True  # 마우스를 화면 모서리로 이동하면 중단
-        pyautogui.PAUSE = 0.5  # 각 명령 후 0.5초 대기
+        
+        # 동작별 대기 시간 (pyautogui.PAUSE 포함)
+        self.apply_delay_profile(DelayProfile.load(config.DELAY_PROFILE))
+        
+        # 낙관적 입력 실행 (사후 조건 확인 + 제한된 재시도)
+        self.use_optimistic = config.OPTIMISTIC_INPUT
+        self.optimistic = OptimisticExecutor(
+            max_attempts=config.OPTIMISTIC_MAX_ATTEMPTS,
+            initial_scale=config.OPTIMISTIC_INITIAL_SCALE
+        )
+        
+        # 작업 저널 (main에서 배치 처리 시 설정, None이면 기록 안 함)
+        self.journal = None
+        
+        # 결과 캐시 (main에서 설정, None이면 사용 안 함)
+        self.result_cache = None
+        
+        # 처리 순서 스케줄러 (main에서 설정, None이면 이름순)
+        self.scheduler = None
+        
+        # 유사 이미지 제외 (main에서 설정) 및 마지막 배치의 그룹 {대표: [중복, ...]}
+        self.dedupe = config.DEDUPE
+        self.duplicate_groups = {}
+        
+        # 입력 사전 검사 (main에서 설정, None이면 검사 안 함) 및 제외된 파일 [(경로, 사유)]
+        self.preflight = None
+        self.rejected = []
+        
+        # 입력 사전 정규화 (main에서 설정, None이면 원본 그대로 열기)
+        self.normalizer = None
+        
+        # 결과물 후처리 (main에서 설정, None이면 후처리 안 함)
+        self.post_processor = None
+        
+        # 단계별 재시도와 앱 재시작 서킷 브레이커 (main에서 설정, None이면 사용 안 함)
+        self.retry_policy: RetryPolicy = None
+        self.circuit_breaker: CircuitBreaker = None
+        
+        # 앱 멈춤 감시 스레드 (main에서 설정, None이면 감시 안 함)
+        self.watchdog: HangWatchdog = None
+        
+        # Export 완료 감지 (main에서 설정, None이면 고정 시간 대기)
+        self.completion_probe: CompletionProbe = None
+        
+        # 처리 시간/메모리 증가 시 앱 재활용 (main에서 설정, None이면 사용 안 함)
+        self.recycle_policy: RecyclePolicy = None
+        
+        # 자동 저장 결과 파일 찾기와 입력 ↔ 결과 인덱스 (자동 저장을 쓰는 컨트롤러에서 설정)
+        self.output_locator: OutputLocator = None
+        
+        # 처리 기록 (main에서 설정, None이면 파일명 suffix로 처리된 파일 판별)
+        self.processed: ProcessedManifest = None
+        
+        # 입력 폴더 탐색 캐시 (main에서 설정, None이면 매번 전체 나열)
+        self.scan_cache: ScanCache = None
+        
+        # 감시 모드에서 도착한 파일이 원본 옆에 저장된 결과물인지 판별할 suffix 정규식
+        self._suffix_pattern = compile_suffix_pattern(config.PROCESSED_SUFFIXES)
+    
+    def apply_delay_profile(self, profile: DelayProfile):
+        """
+        대기 시간 프로파일 적용
+        
+        Args:
+            profile: 적용할 DelayProfile
+        """
+        self.delays = profile
+        pyautogui.PAUSE = profile.get('input_pause')  # 각 pyautogui 명령 후 대기
+        self.focus_tracker.nominal_cost = profile.get('window_activate')
+        logger.info(f"Delay profile: {profile.name} (input pause {pyautogui.PAUSE}s)")
+    
+    def close(self):
+        """
+        실행 중 연 자원 정리 (남은 후처리 대기, 감시 스레드 종료, 정규화 파일 정리, 기록/인덱스 파일 닫기)
+        
+        main이 예외나 Ctrl+C로 끝날 때도 finally에서 호출한다. 여러 번 호출해도 된다.
+        """
+        resources = [
+            ('post processor', self.post_processor and self.post_processor.close),
+            ('watchdog', self.watchdog and self.watchdog.stop),
+            ('normalizer', self.normalizer and self.normalizer.close),
+            ('journal', self.journal and self.journal.close),
+            ('result cache', self.result_cache and self.result_cache.close),
+            ('processed manifest', self.processed and self.processed.close),
+            ('output locator', self.output_locator and self.output_locator.close),
+            ('scan cache', self.scan_cache and self.scan_cache.close),
+        ]
+        for name, close in resources:
+            if not close:
+                continue
+            try:
+                close()
+            except Exception as e:
+                logger.warning(f"Failed to close {name}: {e}")
+    
+    def _journal(self, image_paths, state: str, error: str = None):
+        """
+        작업 저널에 상태 전이 기록 (저널이 없으면 무시)
+        
+        Args:
+            image_paths: 이미지 경로 또는 경로 리스트
+            state: utils.job_journal의 상태 상수
+            error: 실패 사유
+        """
+        if self.journal is None:
+            return
+        if isinstance(image_paths, (str, Path)):
+            image_paths = [image_paths]
+        self.journal.record_many(image_paths, state, error)
+    
+    def _mark_done(self, image_paths):
+        """
+        이미지 처리 완료 기록 (저널 verified + 스케줄러 완료 시각)
+        
+        Args:
+            image_paths: 이미지 경로 또는 경로 리스트
+        """
+        if isinstance(image_paths, (str, Path)):
+            image_paths = [image_paths]
+        self._journal(image_paths, VERIFIED)
+        if self.scheduler is not None:
+            for image_path in image_paths:
+                self.scheduler.record(image_path)
+        if self.processed is not None:
+            self.processed.add_many(image_paths)
+    
+    def _remember_outputs(self, output_paths):
+        """
+        찾은 결과물을 처리 기록에 추가 (다음 실행에서 입력으로 오인하지 않도록, 기록이 없으면 무시)
+        
+        Args:
+            output_paths: 결과 파일 경로 리스트 (None 항목은 무시)
+        """
+        if self.processed is not None:
+            self.processed.add_many(path for path in output_paths if path)
+    
+    def _find_images(self, input_dir: Path, recursive: bool = None) -> list:
+        """
+        입력 폴더의 처리 대상 이미지 목록 (정렬됨)
+        
+        처리 기록이 있으면 기록된 파일(처리한 입력, 찾은 결과물)과 같은 폴더에 원본이 있는
+        예전 결과물만 제외하고, 없으면 이름에 PROCESSED_SUFFIXES가 들어 있는 파일을 모두 제외한다.
+        탐색 캐시가 있으면 mtime이 바뀐 디렉토리만 다시 나열한다.
+        
+        Args:
+            input_dir: 입력 디렉토리
+            recursive: 하위 폴더까지 검색 (None이면 RECURSIVE_SCAN)
+        
+        Returns:
+            이미지 파일 경로 리스트
+        """
+        suffixes = self.config.PROCESSED_SUFFIXES
+        if self.processed is None and self.scan_cache is None:
+            return self.config.get_image_files(input_dir, exclude_suffixes=suffixes, recursive=recursive)
+        
+        if recursive is None:
+            recursive = self.config.RECURSIVE_SCAN
+        if self.scan_cache is not None:
+            entries = self.scan_cache.scan(input_dir, recursive)
+        else:
+            entries = self.config.scan_image_entries(input_dir, recursive)
+        
+        if self.processed is None:
+            paths = exclude_suffix_entries(entries, suffixes)
+        else:
+            paths = self.processed.filter_unprocessed(entries, compile_suffix_pattern(suffixes))
+        return [Path(path) for path in sorted(paths, key=os.path.normcase)]
+    
+    def _accepts_arrival(self, path: Path) -> bool:
+        """감시 모드에서 새로 생긴 파일이 처리 대상인지 (처리 기록이 있으면 기록 기준)"""
+        if self.processed is None:
+            return self.config.is_image_file(path, self.config.PROCESSED_SUFFIXES)
+        if not self.config.is_image_file(path) or self.processed.contains(path):
+            return False
+        # 원본 옆에 저장되는 결과물은 찾아서 기록되기 전에 감지될 수 있음 → 같은 폴더에 원본이 있으면 제외
+        # (이벤트마다 폴더를 나열하지 않고 stem 후보 × 이미지 확장자만 확인)
+        for stem in source_stems(self._suffix_pattern, path.name):
+            prefix = os.path.join(path.parent, path.name[:len(stem)])
+            for extension in self.config.SUPPORTED_IMAGE_EXTENSIONS:
+                if os.path.exists(prefix + extension) or os.path.exists(prefix + extension.upper()):
+                    return False
+        return True
+    
+    def _schedule(self, image_files: list) -> list:
+        """스케줄러 정책으로 처리 순서 결정 (스케줄러가 없으면 그대로)"""
+        if self.scheduler is None or not image_files:
+            return image_files
+        return self.scheduler.schedule(image_files)
+    
+    def _filter_resumed(self, image_files: list) -> tuple:
+        """
+        저널 기준으로 이미 끝난 이미지를 제외하고 남은 이미지를 queued로 기록
+        
+        Args:
+            image_files: 검색된 이미지 경로 리스트
+        
+        Returns:
+            (남은 이미지 리스트, 건너뛴 개수)
+        """
+        if self.journal is None:
+            return image_files, 0
+        
+        pending = self.journal.pending(image_files)
+        skipped = len(image_files) - len(pending)
+        if skipped:
+            logger.info(f"Resuming: {skipped} images already verified in journal, {len(pending)} remaining")
+        self._journal(pending, QUEUED)
+        return pending, skipped
+    
+    def _filter_near_duplicates(self, image_files: list) -> tuple:
+        """
+        지각 해시로 유사 이미지를 묶고 그룹마다 대표 이미지만 남김
+        
+        Args:
+            image_files: 이미지 경로 리스트
+        
+        Returns:
+            (대표 이미지 리스트, 제외한 개수)
+        """
+        if not self.dedupe or len(image_files) < 2:
+            return image_files, 0
+        
+        logger.info(f"Computing perceptual hashes for {len(image_files)} images...")
+        hashes = compute_hashes(image_files, workers=self.config.DEDUPE_WORKERS)
+        groups = group_near_duplicates(image_files, hashes, self.config.DEDUPE_THRESHOLD)
+        
+        self.duplicate_groups = {rep: members for rep, members in groups.items() if members}
+        for rep, members in self.duplicate_groups.items():
+            logger.info(f"  {rep.name}: skipping {len(members)} near-duplicates "
+                        f"({', '.join(m.name for m in members[:3])}{', ...' if len(members) > 3 else ''})")
+        
+        representatives = list(groups)
+        return representatives, len(image_files) - len(representatives)
+    
+    def _validated(self, image_files: list, results: dict = None, run_history=None) -> Iterator[Path]:
+        """
+        사전 검사를 통과한 이미지를 처리 순서대로 하나씩 반환 (사전 검사가 없으면 그대로)
+        
+        검사는 프로세스 풀에서 미리 진행되므로, 앞쪽 이미지를 GUI로 처리하는 동안
+        뒤쪽 이미지가 검사된다. 제외된 파일은 실패로 기록하고, 유사 이미지 그룹의 대표였으면
+        그룹에서 검사를 통과한 다음 이미지를 대신 반환한다.
+        
+        Args:
+            image_files: 이미지 경로 리스트
+            results: 처리 결과 딕셔너리 (실패 개수 갱신)
+            run_history: RunHistory 객체
+        
+        Yields:
+            검사를 통과한 이미지 경로
+        """
+        if self.preflight is None:
+            yield from image_files
+            return
+        
+        for check in self.preflight.stream(image_files):
+            if check['ok']:
+                if check['warning']:
+                    logger.info(f"Preflight: {check['path'].name}: {check['warning']}")
+                yield check['path']
+            else:
+                self._reject(check['path'], check['reason'], results, run_history)
+                promoted = self._promote_duplicate(check['path'], results)
+                if promoted is not None:
+                    yield promoted
+    
+    def _promote_duplicate(self, rejected: Path, results: dict = None) -> Optional[Path]:
+        """
+        사전 검사에서 제외된 대표 이미지 대신 같은 그룹에서 검사를 통과한 첫 이미지(이름순)를 대표로 올림
+        
+        Args:
+            rejected: 제외된 이미지 경로
+            results: 처리 결과 딕셔너리 (건너뜀 개수 갱신)
+        
+        Returns:
+            새 대표 이미지 경로 (그룹 대표가 아니었거나 통과한 이미지가 없으면 None)
+        """
+        members = self.duplicate_groups.get(rejected)
+        if not members:
+            return None
+        # 이전 실행에서 이미 처리한 이미지가 있는 그룹은 다시 처리하지 않음
+        if self.journal is not None and len(self.journal.pending(members)) < len(members):
+            return None
+        
+        for check in self.preflight.stream(members):
+            if not check['ok']:
+                logger.debug(f"Preflight: near-duplicate {check['path'].name} also rejected: {check['reason']}")
+                continue
+            promoted = check['path']
+            del self.duplicate_groups[rejected]
+            remaining = [member for member in members if member != promoted]
+            if remaining:
+                self.duplicate_groups[promoted] = remaining
+            if results is not None and results.get('skipped'):
+                results['skipped'] -= 1
+            self._journal(promoted, QUEUED)
+            logger.info(f"Preflight: processing near-duplicate {promoted.name} instead of {rejected.name}")
+            return promoted
+        return None
+    
+    def _reject(self, image_path: Path, reason: str, results: dict = None, run_history=None):
+        """사전 검사에서 제외된 이미지를 실패로 기록"""
+        logger.warning(f"Preflight rejected {image_path.name}: {reason}")
+        self.rejected.append((image_path, reason))
+        self._journal(image_path, FAILED, f"Rejected: {reason}")
+        if results is not None:
+            results['failed'] += 1
+        if run_history:
+            run_history.add_image_result(str(image_path), success=False, error=f"Rejected: {reason}")
+    
+    def _prepare_normalized(self, image_files: list):
+        """GUI 처리보다 먼저 처리 순서대로 사전 정규화 시작 (정규화가 없으면 무시)"""
+        if self.normalizer is not None:
+            self.normalizer.submit(image_files)
+    
+    def _open_path(self, image_path: Path) -> Path:
+        """GUI에서 열 경로 (변환이 끝난 정규화 파일이 있으면 그 파일, 아니면 원본)"""
+        if self.normalizer is None:
+            return image_path
+        return self.normalizer.resolve(image_path)
+    
+    def _release_normalized(self, image_paths):
+        """정규화 파일 정리 (변환 폴더에 생긴 결과물은 원본 폴더로 이동)"""
+        if self.normalizer is None:
+            return
+        if isinstance(image_paths, (str, Path)):
+            image_paths = [image_paths]
+        for image_path in image_paths:
+            self.normalizer.release(image_path)
+    
+    def _post_process(self, input_path: Path, output, run_history=None):
+        """
+        결과물 후처리를 스레드 풀에 넘기고 바로 반환 (후처리가 없으면 무시)
+        
+        Args:
+            input_path: 입력 이미지 경로
+            output: 결과 파일 경로 또는 결과 파일을 찾는 함수
+            run_history: 후처리 결과를 기록할 RunHistory 객체
+        """
+        if self.post_processor is None:
+            return
+        
+        def on_result(result: dict):
+            # 후처리가 결과물을 옮기거나 시각을 복사했으면 인덱스와 처리 기록도 새 위치/시각으로 갱신
+            if result['ok'] and result['output']:
+                if self.output_locator is not None:
+                    self.output_locator.moved(input_path, result['output'])
+                self._remember_outputs([result['output']])
+            if run_history:
+                run_history.add_postprocess_result(str(input_path), result)
+        
+        self.post_processor.submit(input_path, output, on_result)
+    
+    def _step(self, name: str, step, rollback=None, verify=None) -> bool:
+        """
+        처리 단계 실행 (재시도 정책이 있으면 실패 시 되돌리기 후 백오프 재시도)
+        
+        Args:
+            name: 단계 이름 ('open', 'wait', 'save', 'close_dialog' 등)
+            step: 단계 함수 (False를 반환하면 실패)
+            rollback: 재시도 전 되돌리기 동작
+            verify: 재시도 정책 사용 시 추가로 확인할 성공 조건
+        
+        Returns:
+            성공 여부
+        """
+        if self.retry_policy is None:
+            return step() is not False
+        
+        def checked() -> bool:
+            return step() is not False and (verify is None or verify())
+        
+        return self.retry_policy.run(name, checked, rollback)
+    
+    def _with_circuit_breaker(self, label: str, process) -> bool:
+        """
+        이미지(청크) 처리 결과를 서킷 브레이커에 기록하고, 연속 실패가 임계값에 도달하거나
+        감시 스레드가 앱 멈춤을 감지하면 앱을 재시작한 뒤 실패한 작업을 한 번 다시 처리
+        
+        Args:
+            label: 로그용 이름 (파일명, 청크 번호 등)
+            process: 처리 함수 (성공 여부 반환)
+        
+        Returns:
+            성공 여부
+        """
+        if self.circuit_breaker is None and self.watchdog is None:
+            return process()
+        
+        def attempt() -> bool:
+            try:
+                return bool(process())
+            except Exception as e:
+                logger.error(f"{label} error: {e}")
+                logger.exception("Full traceback:")
+                return False
+        
+        success = attempt()
+        breaker = self.circuit_breaker
+        hung = self.watchdog is not None and self.watchdog.hung.is_set()
+        
+        # 감시 스레드가 멈춤을 감지했으면 연속 실패 횟수와 관계없이 바로 재시작
+        if hung:
+            logger.warning(f"App hung during {label} ({self.watchdog.reason}) - restarting now")
+        elif breaker is None or not breaker.record(success):
+            return success
+        else:
+            logger.warning(f"{breaker.consecutive_failures} consecutive failures - app looks stuck")
+        
+        if breaker is not None and not breaker.can_restart:
+            logger.error(f"Restart limit reached ({breaker.max_restarts}), not restarting")
+            return False
+        if not self.restart_app():
+            return False
+        if breaker is not None:
+            breaker.restarted()
+        if success:
+            return success
+        
+        logger.info(f"Replaying {label} after restart")
+        success = attempt()
+        if breaker is not None:
+            breaker.record(success)
+            breaker.replays['success' if success else 'failed'] += 1
+        return success
+    
+    def _recycle_if_needed(self, duration: float, success: bool = True, image_paths: list = ()):
+        """
+        이미지 사이에서 재활용 정책 확인: 처리 시간/앱 메모리가 기준보다 나빠졌으면 앱 재시작
+        
+        Args:
+            duration: 방금 끝난 이미지의 처리 시간 (초, 실패한 이미지는 기록하지 않음)
+            success: 처리 성공 여부
+            image_paths: 처리한 이미지 (여러 장이면 duration은 장당 평균, 해상도를 모르면 시간 비교에서 제외)
+        """
+        if self.recycle_policy is None or not success:
+            return
+        
+        sizes = [read_megapixels(path) for path in image_paths]
+        megapixels = sum(sizes) / len(sizes) if sizes and None not in sizes else None
+        reason = self.recycle_policy.observe(duration, megapixels)
+        if reason is None:
+            return
+        
+        logger.warning(f"App slowing down: {reason}")
+        if not self.recycle_policy.can_restart:
+            logger.error(f"Recycle limit reached ({self.recycle_policy.max_restarts}), not restarting")
+            return
+        if self.restart_app():
+            self.recycle_policy.recycled(reason)
+    
+    def _recover_if_hung(self) -> bool:
+        """
+        감시 스레드가 앱 멈춤을 감지했으면 앱 재시작 (서킷 브레이커를 거치지 않는 청크 처리용)
+        
+        Returns:
+            재시작했으면 True
+        """
+        if self.watchdog is None or not self.watchdog.hung.is_set():
+            return False
+        logger.warning(f"App hung ({self.watchdog.reason}) - restarting before next chunk")
+        return self.restart_app()
+    
+    def restart_app(self) -> bool:
+        """
+        앱 종료 후 다시 실행
+        
+        Returns:
+            성공 여부
+        """
+        logger.info("=" * 60)
+        logger.info(f"Restarting {self.config.PROCESS_NAME}")
+        logger.info("=" * 60)
+        
+        # 의도적인 종료를 멈춤으로 보지 않도록 재시작 동안 감시 중지
+        if self.watchdog is not None:
+            self.watchdog.pause()
+        
+        restarted = False
+        try:
+            if not self.window_manager.terminate_process(self.config.PROCESS_NAME):
+                logger.error(f"Failed to close {self.config.PROCESS_NAME}")
+                return False
+            
+            if not self.launch_app():
+                logger.error("Failed to relaunch application")
+                return False
+            
+            self.delays.sleep('image_settle')
+            restarted = True
+            return True
+        finally:
+            if self.watchdog is not None:
+                self.watchdog.resume(recovered=restarted)
+    
+    def process_arrivals(self, image_paths: list, on_done):
+        """
+        --watch 모드에서 새로 들어온 이미지 처리 (하위 클래스에서 구현)
+        
+        Args:
+            image_paths: 쓰기가 끝난 새 이미지 경로 리스트
+            on_done: 이미지마다 끝날 때 호출 on_done(path, success, duration, error, verified=True)
+                (verified=False: 저장은 성공했지만 결과 파일을 찾지 못함 → 완료로 기록하지 않음)
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support watch mode")
+    
+    def watch_folder(self, input_dir: Path, run_history=None) -> dict:
+        """
+        입력 폴더를 감시하며 새 이미지를 도착하는 대로 처리 (Ctrl+C로 종료)
+        
+        시작 시점에 이미 있던 미처리 이미지부터 처리하고, 이후 새 파일은
+        debounce + 크기 안정화 확인 후 process_arrivals()로 넘긴다.
+        도착(처음 감지)부터 결과 저장까지의 지연 시간을 집계한다.
+        
+        Args:
+            input_dir: 감시할 입력 디렉토리
+            run_history: RunHistory 객체 (실행 기록 저장용)
+        
+        Returns:
+            처리 결과 딕셔너리 {'success', 'failed', 'total', 'skipped'}
+        """
+        # 폴더 감시는 입력 폴더만 보므로 초기 목록도 하위 폴더를 제외
+        initial = self._find_images(input_dir, recursive=False)
+        pending = self.journal.pending(initial) if self.journal else initial
+        
+        results = {'success': 0, 'failed': 0, 'total': 0, 'skipped': len(initial) - len(pending)}
+        arrivals = {}
+        latencies = []
+        
+        def on_done(path: Path, success: bool, duration: float, error: str = None, verified: bool = True):
+            latency = time.time() - arrivals.pop(path, time.time())
+            results['success' if success else 'failed'] += 1
+            if success:
+                if verified:
+                    self._mark_done(path)
+                else:
+                    logger.warning(f"  [watch] {path.name}: output not found, leaving it unverified")
+                latencies.append(latency)
+                logger.info(f"  [watch] {path.name}: done {latency:.1f}s after arrival")
+            else:
+                self._journal(path, FAILED, error)
+            if run_history:
+                run_history.add_image_result(str(path), success=success, duration=duration, error=error)
+        
+        watcher = FolderWatcher(
+            input_dir,
+            accept=self._accepts_arrival,
+            debounce=self.config.WATCH_DEBOUNCE,
+            poll_interval=self.config.WATCH_POLL_INTERVAL
+        )
+        watcher.start(initial=pending)
+        logger.info("Press Ctrl+C to stop watching")
+        
+        try:
+            while True:
+                ready = watcher.ready()
+                if not ready:
+                    time.sleep(self.config.WATCH_POLL_INTERVAL)
+                    continue
+                
+                paths = []
+                for path, first_seen in ready:
+                    arrivals[path] = first_seen
+                    paths.append(path)
+                
+                results['total'] += len(paths)
+                self._journal(paths, QUEUED)
+                logger.info(f"[watch] {len(paths)} new images ready ({watcher.pending_count()} still settling)")
+                paths = list(self._validated(paths, results, run_history))
+                if not paths:
+                    continue
+                self.process_arrivals(paths, on_done)
+        
+        except KeyboardInterrupt:
+            logger.info("Watch stopped by user")
+        
+        finally:
+            watcher.stop()
+        
+        if latencies:
+            ordered = sorted(latencies)
+            stats = {
+                'completed': len(ordered),
+                'mean_latency': round(sum(ordered) / len(ordered), 2),
+                'p50_latency': round(ordered[len(ordered) // 2], 2),
+                'p95_latency': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 2),
+                'max_latency': round(ordered[-1], 2),
+            }
+            logger.info(f"Arrival -> output latency: mean {stats['mean_latency']}s, "
+                        f"p50 {stats['p50_latency']}s, p95 {stats['p95_latency']}s, max {stats['max_latency']}s")
+            if run_history:
+                run_history.set_metrics("watch", stats)
+        
+        return results
+    
+    def cache_settings(self) -> dict:
+        """결과 캐시 지문에 포함할 설정 (결과물에 영향을 주는 값)"""
+        return {
+            'controller': type(self).__name__,
+            'app_version': app_version(getattr(self.config, 'APP_PATH', '')),
+            'processing_wait': self.config.PROCESSING_WAIT_TIME,
+            'save_wait': getattr(self.config, 'SAVE_PROCESSING_WAIT_TIME', None),
+            'tag': self.config.RESULT_CACHE_TAG,
+        }
+    
+    def _reuse_cached_result(self, image_path: Path, output_dir: Path) -> bool:
+        """
+        결과 캐시에 같은 내용의 결과가 있으면 output_dir에 링크/복사
+        
+        Args:
+            image_path: 입력 이미지 경로
+            output_dir: 결과물을 둘 디렉토리
+        
+        Returns:
+            캐시 결과를 사용했으면 True
+        """
+        if self.result_cache is None:
+            return False
+        
+        entry = self.result_cache.lookup(image_path)
+        if not entry:
+            return False
+        
+        return self.result_cache.materialize(image_path, entry, output_dir) is not None
     
     @abstractmethod
     def open_image(self, image_path: Path) -> bool:
@@ -94,29 +737,55 @@ class BaseController(ABC):
     
     def activate_app_window(self) -> bool:
         """
-        앱 윈도우 활성화
+        앱 윈도우 활성화 (이미 포그라운드면 건너뜀)
         
         Returns:
             성공 여부
         """
+        self._check_hang()
         hwnd = self.window_manager.find_window_by_title(self.config.WINDOW_TITLE_PATTERN)
         if hwnd:
-            return self.window_manager.activate_window(hwnd)
+            return self.focus_tracker.ensure_focus(hwnd, self._activate_window)
         
         logger.error(f"Cannot find window: {self.config.WINDOW_TITLE_PATTERN}")
         return False
     
-    def press_shortcut(self, shortcut: str, delay: float = 0.5):
+    def _activate_window(self, hwnd: int) -> bool:
+        """프로파일의 활성화 대기 시간으로 윈도우 활성화"""
+        return self.window_manager.activate_window(hwnd, settle=self.delays.get('window_activate'))
+    
+    def _dialog_open(self) -> bool:
+        """
+        앱 메인 윈도우가 아닌 창(파일/저장 다이얼로그 등)이 앞에 있는지 확인
+        
+        다이얼로그 타이틀은 OS 언어마다 다르므로 메인 타이틀 패턴이 없는지로 판단한다.
+        """
+        title = StateMonitor.get_active_window_title()
+        return self.config.WINDOW_TITLE_PATTERN.lower() not in title.lower()
+    
+    def _close_dialog_if_open(self, scale: float = 1.0):
+        """
+        낙관적 실행 롤백: 다이얼로그가 남아 있으면 Esc로 닫기
+        
+        Args:
+            scale: 대기 배율
+        """
+        if self._dialog_open():
+            pyautogui.press('esc')
+            self.delays.sleep('dialog_close', scale)
+    
+    def press_shortcut(self, shortcut: str, delay: float = None):
         """
         키보드 단축키 입력
         
         Args:
             shortcut: 단축키 (예: 'ctrl+o', 'ctrl+s')
-            delay: 입력 후 대기 시간
+            delay: 입력 후 대기 시간 (None이면 프로파일의 'shortcut' 값)
         """
+        self._check_hang()
         logger.debug(f"Pressing shortcut: {shortcut}")
         keyboard.press_and_release(shortcut)
-        time.sleep(delay)
+        self._sleep(self.delays.get('shortcut') if delay is None else delay)
     
     def type_text(self, text: str, use_clipboard: bool = True):
         """
@@ -126,6 +795,7 @@ class BaseController(ABC):
             text: 입력할 텍스트
             use_clipboard: True면 클립보드 사용 (모든 문자 지원), False면 키보드 입력
         """
+        self._check_hang()
         logger.debug(f"Typing text: {text[:50]}{'...' if len(text) > 50 else ''}")
         
         if use_clipboard:
@@ -136,11 +806,11 @@ class BaseController(ABC):
                 
                 # 텍스트를 클립보드에 복사
                 pyperclip.copy(text)
-                time.sleep(0.1)
+                self.delays.sleep('clipboard_copy')
                 
                 # Ctrl+V로 붙여넣기
                 pyautogui.hotkey('ctrl', 'v')
-                time.sleep(0.2)
+                self.delays.sleep('clipboard_paste')
                 
                 # 클립보드 복원
                 pyperclip.copy(old_clipboard)
@@ -167,6 +837,61 @@ class BaseController(ABC):
             timeout = self.config.MAX_WAIT_TIME
         
         logger.info(f"Waiting for processing to complete (timeout: {timeout}s)")
-        time.sleep(self.config.PROCESSING_WAIT_TIME)
+        self._sleep(self.config.PROCESSING_WAIT_TIME)
         return True
+    
+    def build_completion_probe(self, kind: str) -> Optional[CompletionProbe]:
+        """
+        Export 완료 감지 객체 생성 (화면 기반 방식은 하위 클래스에서 추가)
+        
+        Args:
+            kind: 감지 방식 ('ocr', 'template', 'process')
+        
+        Returns:
+            감지 객체 (지원하지 않는 방식이면 None)
+        """
+        if kind == 'process':
+            return ProcessIdleProbe(
+                PsutilProcessBackend(self.config.PROCESS_NAME),
+                idle_cpu_percent=self.config.PROCESS_IDLE_CPU_PERCENT,
+                min_dwell=self.config.PROCESS_IDLE_DWELL,
+                max_dwell=self.config.PROCESS_IDLE_MAX_DWELL
+            )
+        return None
+    
+    def _wait_for_completion(self, timeout: float) -> bool:
+        """
+        설정된 완료 감지 방식으로 Export 완료 대기
+        
+        Args:
+            timeout: 최대 대기 시간 (초)
+        
+        Returns:
+            완료가 감지되면 True
+        """
+        return self.completion_probe.wait(
+            timeout,
+            interval=self.config.COMPLETION_POLL_INTERVAL,
+            sleep=self._sleep
+        )
+    
+    def _check_hang(self):
+        """
+        감시 스레드가 앱 멈춤을 감지했으면 AppHangError 발생
+        (멈춘 창에 키 입력을 계속 보내지 않도록 입력 전에 호출)
+        """
+        if self.watchdog is not None:
+            self.watchdog.check()
+    
+    def _sleep(self, seconds: float):
+        """
+        고정 대기 (감시 중이면 대기 도중 멈춤이 감지되는 즉시 AppHangError 발생)
+        
+        Args:
+            seconds: 대기 시간 (초)
+        """
+        if self.watchdog is not None:
+            self.watchdog.sleep(seconds)
+        else:
+            time.sleep(seconds)
 
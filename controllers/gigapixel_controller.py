@@ -1,12 +1,23 @@
 """Topaz Gigapixel AI controller"""
+import asyncio
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import groupby
 from pathlib import Path
+from typing import Optional
 from loguru import logger
 import pyautogui
 
 from .base_controller import BaseController
 from config.gigapixel_config import GigapixelConfig
 from utils.state_monitor import StateMonitor
+from utils.optimistic import wait_until, title_contains, title_shows_file
+from utils.job_journal import OPENED, EXPORTED, FAILED
+from utils.pipeline import Pipeline, Stage
+from utils.hang_watchdog import AppHangError
+from utils.completion_probe import CompletionProbe, OCRProbe, TemplateProbe
+from utils.preflight import inspect_image
+from utils.output_locator import OutputLocator
 
 
 class GigapixelController(BaseController):
@@ -14,6 +25,11 @@ class GigapixelController(BaseController):
     def __init__(self):
         super().__init__(GigapixelConfig)
         self.state_monitor = StateMonitor()
+        # 인덱스 파일은 main에서 배치 처리 시 연결 (OUTPUT_INDEX)
+        self.output_locator = OutputLocator(
+            self.config.PROCESSED_SUFFIXES,
+            [self.config.EXPORT_DIR, *self.config.OUTPUT_SEARCH_DIRS]
+        )
         logger.info("GigapixelController initialized")
     
     def open_image(self, image_path: Path) -> bool:
@@ -29,14 +45,14 @@ class GigapixelController(BaseController):
             logger.error("Failed to activate application window")
             return False
         
-        time.sleep(0.5)
+        if self.use_optimistic:
+            return self._open_image_optimistic(image_path)
+        
+        self.delays.sleep('activate_settle')
         
         # Ctrl+O로 파일 열기 대화상자 열기
         logger.debug("Pressing Ctrl+O to open file dialog...")
-        self.press_shortcut(self.config.SHORTCUT_OPEN, delay=1.5)
-        
-        # 파일 다이얼로그가 열렸는지 확인 (선택사항이지만 권장)
-        time.sleep(0.5)  # 다이얼로그 열릴 시간
+        self.press_shortcut(self.config.SHORTCUT_OPEN, delay=self.delays.get('open_dialog'))
         
         # 파일 경로 입력 (클립보드 사용으로 모든 문자 지원)
         absolute_path = str(image_path.absolute())
@@ -45,14 +61,14 @@ class GigapixelController(BaseController):
         # 파일명 필드 초기화 (여러 방법 시도)
         logger.debug("Clearing file path field...")
         pyautogui.hotkey('ctrl', 'a')
-        time.sleep(0.3)
+        self.delays.sleep('field_select')
         pyautogui.press('delete')
-        time.sleep(0.2)
+        self.delays.sleep('field_clear')
         
         # 경로 입력 (클립보드 사용)
         logger.debug("Typing path via clipboard...")
         self.type_text(absolute_path, use_clipboard=True)
-        time.sleep(1)  # 경로 입력 완료 대기
+        self.delays.sleep('path_settle')  # 경로 입력 완료 대기
         
         # Enter로 열기
         logger.debug("Pressing Enter to open...")
@@ -65,9 +81,116 @@ class GigapixelController(BaseController):
             return True
         else:
             logger.warning(f"Image load verification timeout (continuing anyway)")
-            time.sleep(1)  # 추가 대기
+            self.delays.sleep('load_fallback')  # 추가 대기
             return True  # 타임아웃이어도 계속 진행
     
+    def _open_image_optimistic(self, image_path: Path) -> bool:
+        """
+        이미지 열기 (낙관적 실행)
+        
+        최소 대기로 Ctrl+O → 경로 입력 → Enter를 보내고
+        타이틀바에 파일명이 나타나는지로 확인한다. 실패하면 다이얼로그를 닫고
+        더 긴 대기로 재시도한다.
+        
+        Args:
+            image_path: 열 이미지 파일 경로
+        
+        Returns:
+            성공 여부
+        """
+        absolute_path = str(image_path.absolute())
+        logger.info(f"Opening file (optimistic): {absolute_path}")
+        
+        def open_and_type(scale: float) -> bool:
+            self.press_shortcut(self.config.SHORTCUT_OPEN, delay=0)
+            if not wait_until(self._dialog_open, self.delays.get('open_dialog') * 2):
+                return False
+            
+            pyautogui.hotkey('ctrl', 'a')
+            self.delays.sleep('field_select', scale)
+            pyautogui.press('delete')
+            self.delays.sleep('field_clear', scale)
+            self.type_text(absolute_path, use_clipboard=True)
+            self.delays.sleep('path_settle', scale)
+            pyautogui.press('enter')
+            return True
+        
+        loaded = title_shows_file(self.state_monitor.get_active_window_title, image_path.name)
+        if self.optimistic.run('open_image', open_and_type, loaded, timeout=15,
+                               rollback=self._close_dialog_if_open):
+            logger.info(f"Image loaded: {image_path.name}")
+            return True
+        
+        logger.error(f"Failed to open image: {image_path.name}")
+        return False
+    
+    def open_images(self, image_paths: list) -> bool:
+        """
+        여러 이미지를 한 번에 열기 (파일 다이얼로그 다중 선택)
+        
+        디렉토리로 이동한 뒤 파일명 필드에 "a.jpg" "b.jpg" 형식으로 입력한다.
+        모든 파일은 같은 디렉토리에 있어야 한다.
+        
+        Args:
+            image_paths: 열 이미지 파일 경로 리스트
+        
+        Returns:
+            성공 여부
+        """
+        if not image_paths:
+            logger.error("No images to open")
+            return False
+        
+        directory = image_paths[0].parent.absolute()
+        if any(path.parent.absolute() != directory for path in image_paths):
+            logger.error("open_images requires all images in the same directory")
+            return False
+        
+        logger.info(f"Opening {len(image_paths)} images from {directory}...")
+        
+        # 앱 활성화
+        if not self.activate_app_window():
+            logger.error("Failed to activate application window")
+            return False
+        
+        self.delays.sleep('activate_settle')
+        
+        # Ctrl+O로 파일 열기 대화상자 열기
+        self.press_shortcut(self.config.SHORTCUT_OPEN, delay=0)
+        if not wait_until(self._dialog_open, self.delays.get('open_dialog') * 2):
+            logger.error("File dialog did not appear")
+            return False
+        
+        # 디렉토리로 이동
+        pyautogui.hotkey('ctrl', 'a')
+        self.delays.sleep('field_select')
+        self.type_text(str(directory), use_clipboard=True)
+        self.delays.sleep('dir_path_settle')
+        pyautogui.press('enter')
+        self.delays.sleep('dir_load')
+        
+        # 파일명 필드에 여러 파일명 입력
+        file_names = ' '.join(f'"{path.name}"' for path in image_paths)
+        pyautogui.hotkey('ctrl', 'a')
+        self.delays.sleep('field_select')
+        pyautogui.press('delete')
+        self.delays.sleep('field_clear')
+        self.type_text(file_names, use_clipboard=True)
+        self.delays.sleep('path_settle')
+        pyautogui.press('enter')
+        
+        # 로드 확인: 타이틀에 청크 중 하나의 파일명이 나타날 때까지
+        get_title = self.state_monitor.get_active_window_title
+        stems = [path.stem.lower() for path in image_paths]
+        load_timeout = 15 + len(image_paths) * self.delays.get('multi_load_per_image')
+        if wait_until(lambda: any(stem in get_title().lower() for stem in stems), load_timeout):
+            logger.info(f"Images loaded ({len(image_paths)})")
+        else:
+            logger.warning("Image load verification timeout (continuing anyway)")
+        
+        self.delays.sleep('multi_load_base')
+        return True
+    
     def save_image(self, output_path: Path) -> bool:
         """
         이미지 저장 (경로 지정)
@@ -85,7 +208,7 @@ class GigapixelController(BaseController):
             logger.error("Failed to activate application window")
             return False
         
-        time.sleep(0.5)
+        self.delays.sleep('activate_settle')
         
         # Ctrl+S로 저장 대화상자 열기
         self.press_shortcut(self.config.SHORTCUT_SAVE, delay=1)
@@ -114,28 +237,62 @@ class GigapixelController(BaseController):
         logger.error(f"Failed to save image: {output_path.name}")
         return False
     
-    def save_image_auto(self) -> bool:
+    def save_image_auto(self, input_path: Path = None) -> bool:
         """
         이미지 자동 저장 (Ctrl+S + Enter + 대기 + Close Window)
         
+        Args:
+            input_path: 저널에 기록할 입력 이미지 경로 (선택)
+        
         Returns:
             성공 여부
         """
         logger.info("Saving image (Ctrl+S)...")
         
+        if not self._step('save', self._start_export, rollback=self._close_dialog_if_open):
+            return False
+        
+        if input_path:
+            self._journal(input_path, EXPORTED)
+        
+        # ===== 저장 처리 대기 (고정 시간) =====
+        if not self._wait_for_save_processing():
+            # 완료를 감지하지 못했으면 결과물이 덜 쓰였을 수 있음 → 창을 닫고 저장 단계 실패
+            logger.error("Save processing did not complete in time")
+            self._close_export_dialog()
+            return False
+        
+        # Export Settings 창 닫기
+        return self._step('close_dialog', self._close_export_dialog, verify=lambda: not self._dialog_open())
+    
+    def _start_export(self) -> bool:
+        """
+        Ctrl+S → Enter로 Export 시작 (Export Settings 창이 뜰 때까지)
+        
+        Returns:
+            성공 여부
+        """
         # 앱 활성화
         if not self.activate_app_window():
             logger.error("Failed to activate application window")
             return False
         
-        time.sleep(0.5)
-        
-        # Ctrl+S로 저장 다이얼로그 열기
-        logger.debug("Pressing Ctrl+S to open save dialog...")
-        self.press_shortcut(self.config.SHORTCUT_SAVE, delay=2)
-        
-        # 저장 다이얼로그가 열렸는지 확인
-        time.sleep(0.5)
+        if self.use_optimistic:
+            # Ctrl+S 후 다이얼로그가 앞으로 나왔는지 확인
+            def press_save(scale: float):
+                self.press_shortcut(self.config.SHORTCUT_SAVE, delay=0)
+            
+            if not self.optimistic.run('save_dialog', press_save, self._dialog_open,
+                                       timeout=self.delays.get('save_dialog') * 2,
+                                       rollback=self._close_dialog_if_open):
+                logger.error("Save dialog did not appear")
+                return False
+        else:
+            self.delays.sleep('activate_settle')
+            
+            # Ctrl+S로 저장 다이얼로그 열기
+            logger.debug("Pressing Ctrl+S to open save dialog...")
+            self.press_shortcut(self.config.SHORTCUT_SAVE, delay=self.delays.get('save_dialog'))
         
         # Enter로 저장 확인
         logger.debug("Pressing Enter to confirm save...")
@@ -143,13 +300,59 @@ class GigapixelController(BaseController):
         
         # Export Settings 창이 나타날 때까지 대기
         logger.debug("Waiting for Export Settings dialog to appear...")
-        time.sleep(2.0)
+        self.delays.sleep('export_dialog')
+        return True
+    
+    def _close_export_dialog(self) -> bool:
+        """
+        Export Settings 창 닫기 (Esc)
         
-        # ===== 저장 처리 대기 (고정 시간) =====
+        Returns:
+            항상 True (닫힘 확인 실패 시에도 계속 진행)
+        """
+        if self.use_optimistic:
+            return self._close_export_dialog_optimistic()
+        
+        logger.debug("Closing Export Settings window (Esc)...")
+        self.delays.sleep('dialog_close')  # 잠깐 대기
+        pyautogui.press('esc')
+        self.delays.sleep('dialog_close')
+        
+        # 한 번 더 Esc 시도 (안전장치)
+        pyautogui.press('esc')
+        self.delays.sleep('dialog_close')
+        
+        # 창이 닫혔는지 확인
+        logger.debug("Verifying dialog closed...")
+        current_title = self.state_monitor.get_active_window_title()
+        logger.debug(f"Current window: {current_title}")
+        
+        if "Topaz Gigapixel" in current_title:
+            logger.info("Image saved and dialog closed")
+            return True
+        else:
+            logger.warning(f"Dialog may not be closed (title: {current_title})")
+            # 추가 Esc 시도
+            pyautogui.press('esc')
+            self.delays.sleep('dialog_close')
+            return True  # 계속 진행
+    
+    def _wait_for_save_processing(self) -> bool:
+        """
+        저장(Export) 처리 완료 대기 (완료 감지 방식이 없으면 고정 시간)
+        
+        Returns:
+            완료 감지 방식이 MAX_WAIT_TIME 안에 완료를 감지하지 못하면 False (고정 시간 대기는 항상 True)
+        """
         logger.info("=" * 60)
         logger.info("Waiting for save processing to complete...")
         logger.info("=" * 60)
         
+        if self.completion_probe is not None:
+            completed = self._wait_for_completion(self.config.MAX_WAIT_TIME)
+            logger.info("=" * 60)
+            return completed
+        
         # 고정 시간 대기 (config에서 설정)
         save_wait_time = self.config.SAVE_PROCESSING_WAIT_TIME
         
@@ -158,35 +361,64 @@ class GigapixelController(BaseController):
             remaining = save_wait_time - i
             if i % 3 == 0:
                 logger.info(f"  Processing... ({remaining}s remaining)")
-            time.sleep(1)
+            self._sleep(1)
         
         logger.info("Save wait complete")
         logger.info("=" * 60)
+        return True
+    
+    def build_completion_probe(self, kind: str) -> Optional[CompletionProbe]:
+        """
+        Export 완료 감지 객체 생성
         
-        # Export Settings 창 닫기
-        logger.debug("Closing Export Settings window (Esc)...")
-        time.sleep(1)  # 잠깐 대기
-        pyautogui.press('esc')
-        time.sleep(1)
+        - ocr: Queue 영역(OCR_REGION_QUEUE)에 SAVE_DONE_TEXT가 나타나면 완료
+        - template: Export Settings의 Queue 영역에 완료 아이콘(DONE_ICON_TEMPLATE)이 나타나면 완료
+        """
+        if kind == 'ocr':
+            region = self.config.OCR_REGION_QUEUE
+            return OCRProbe(
+                lambda: (region['x'], region['y'], region['width'], region['height']),
+                self.config.SAVE_DONE_TEXT
+            )
+        if kind == 'template':
+            # OpenCV는 이 방식을 쓸 때만 import
+            from utils.icon_detector import IconDetector
+            detector = IconDetector()
+            ratios = self.config.QUEUE_REGION_RATIOS
+            
+            def find_icon(template_name: str) -> bool:
+                hwnd = (self.window_manager.find_window_by_title(self.config.EXPORT_DIALOG_TITLE)
+                        or self.window_manager.find_window_by_title(self.config.WINDOW_TITLE_PATTERN))
+                region = self.window_manager.get_relative_region(
+                    hwnd, ratios['x_ratio'], ratios['y_ratio'], ratios['width_ratio'], ratios['height_ratio']
+                ) if hwnd else None
+                if region is None:
+                    return False
+                found, _ = detector.detect_icon_in_region(*region, template_name)
+                return found
+            
+            return TemplateProbe(find_icon, self.config.DONE_ICON_TEMPLATE)
+        return super().build_completion_probe(kind)
+    
+    def _close_export_dialog_optimistic(self) -> bool:
+        """
+        Export Settings 창 닫기 (낙관적 실행)
         
-        # 한 번 더 Esc 시도 (안전장치)
-        pyautogui.press('esc')
-        time.sleep(1)
+        Esc 후 메인 윈도우 타이틀로 돌아왔는지 확인하고, 아니면 Esc를 다시 보낸다.
         
-        # 창이 닫혔는지 확인
-        logger.debug("Verifying dialog closed...")
-        current_title = self.state_monitor.get_active_window_title()
-        logger.debug(f"Current window: {current_title}")
+        Returns:
+            항상 True (닫힘 확인 실패 시에도 계속 진행)
+        """
+        def press_esc(scale: float):
+            pyautogui.press('esc')
         
-        if "Topaz Gigapixel" in current_title:
+        main_window = title_contains(self.state_monitor.get_active_window_title, "Topaz Gigapixel")
+        if self.optimistic.run('close_dialog', press_esc, main_window,
+                               timeout=self.delays.get('dialog_close') * 2):
             logger.info("Image saved and dialog closed")
-            return True
         else:
-            logger.warning(f"Dialog may not be closed (title: {current_title})")
-            # 추가 Esc 시도
-            pyautogui.press('esc')
-            time.sleep(1)
-            return True  # 계속 진행
+            logger.warning("Dialog may not be closed (continuing anyway)")
+        return True
     
     def wait_for_processing(self) -> bool:
         """
@@ -197,7 +429,7 @@ class GigapixelController(BaseController):
         """
         wait_time = self.config.PROCESSING_WAIT_TIME
         logger.info(f"Waiting {wait_time}s for processing to complete...")
-        time.sleep(wait_time)
+        self._sleep(wait_time)
         logger.info(f"Processing wait complete")
         return True
     
@@ -286,20 +518,21 @@ class GigapixelController(BaseController):
         if not self.activate_app_window():
             return False
         
-        time.sleep(0.3)
+        self.delays.sleep('zoom_activate')
         
         # Ctrl+0으로 Zoom to fit
-        self.press_shortcut(self.config.SHORTCUT_ZOOM_TO_FIT, delay=0.5)
+        self.press_shortcut(self.config.SHORTCUT_ZOOM_TO_FIT, delay=self.delays.get('zoom'))
         
         logger.debug("Zoom to fit applied")
         return True
     
-    def process_single_image_auto_save(self, input_path: Path) -> bool:
+    def process_single_image_auto_save(self, input_path: Path, open_path: Path = None) -> bool:
         """
         단일 이미지 처리 (자동 저장)
         
         Args:
             input_path: 입력 이미지 경로
+            open_path: 앱에서 열 파일 (사전 정규화된 파일, None이면 input_path)
         
         Returns:
             성공 여부
@@ -310,28 +543,30 @@ class GigapixelController(BaseController):
         
         # 1. 이미지 열기 (절대 경로 사용)
         logger.info("Step 1: Opening image...")
-        if not self.open_image(input_path):
+        if not self._step('open', lambda: self.open_image(open_path or input_path),
+                          rollback=self._close_dialog_if_open):
             logger.error("Failed to open image")
             return False
+        self._journal(input_path, OPENED)
         logger.info("Image opened")
         
         # 2. Zoom to fit (전체 이미지 화면에 맞춤)
         logger.info("Step 2: Zoom to fit...")
-        time.sleep(1.5)  # 이미지가 완전히 로드될 때까지 대기
+        self.delays.sleep('image_settle')  # 이미지가 완전히 로드될 때까지 대기
         self.zoom_to_fit()
-        time.sleep(1)  # Zoom 적용 대기
+        self.delays.sleep('zoom_settle')  # Zoom 적용 대기
         logger.info("Zoom applied")
         
         # 3. 처리 대기 (고정 시간 - 업스케일은 저장 시 처리됨)
         logger.info("Step 3: Waiting for initial processing...")
-        if not self.wait_for_processing():
+        if not self._step('wait', self.wait_for_processing):
             logger.warning("Processing wait returned False")
             return False
         logger.info("Initial processing complete")
         
         # 4. 이미지 자동 저장 (고정 시간 대기)
         logger.info("Step 4: Saving image...")
-        if not self.save_image_auto():
+        if not self.save_image_auto(input_path):
             logger.error("Failed to save image")
             return False
         logger.info("  Save complete")
@@ -356,16 +591,18 @@ class GigapixelController(BaseController):
         """
         # 이미지 파일 목록 (처리된 파일 제외)
         logger.info("Scanning for images...")
-        image_files = self.config.get_image_files(
-            input_dir, 
-            exclude_suffixes=self.config.PROCESSED_SUFFIXES
-        )
+        image_files = self._find_images(input_dir)
         
         if not image_files:
             logger.warning(f"No unprocessed images found in {input_dir}")
             logger.info("(Already processed files are excluded)")
             return {'success': 0, 'failed': 0, 'total': 0, 'skipped': 0}
         
+        total = len(image_files)
+        image_files, duplicates = self._filter_near_duplicates(image_files)
+        image_files, resumed = self._filter_resumed(image_files)
+        image_files = self._schedule(image_files)
+        
         logger.info(f"Found {len(image_files)} unprocessed images")
         logger.info(f"Save mode: Ctrl+S (output folder from settings)")
         logger.info("")
@@ -374,15 +611,25 @@ class GigapixelController(BaseController):
             logger.info(f"  {idx}. {img.name}")
         logger.info("")
         
-        results = {'success': 0, 'failed': 0, 'total': len(image_files), 'skipped': 0}
+        results = {'success': 0, 'failed': 0, 'total': total, 'skipped': resumed + duplicates}
         
-        for idx, input_path in enumerate(image_files, 1):
+        # GUI 처리보다 먼저 내용 해시 계산/사전 정규화 시작
+        if self.result_cache:
+            self.result_cache.prefetch(image_files)
+        self._prepare_normalized(image_files)
+        
+        for idx, input_path in enumerate(self._validated(image_files, results, run_history), 1):
             logger.info("")
             logger.info(f"╔{'═'*58}╗")
             logger.info(f"║ IMAGE {idx}/{len(image_files)}: {input_path.name:<45} ║")
             logger.info(f"║ Path: {str(input_path):<51} ║")
             logger.info(f"╚{'═'*58}╝")
             
+            if not self._take_cached([input_path], results, run_history):
+                continue
+            
+            before = self.output_locator.snapshot(input_path)
+            
             # 이미지 처리
             try:
                 logger.info(f"  Starting processing of image #{idx}: {input_path.name}")
@@ -390,12 +637,17 @@ class GigapixelController(BaseController):
                 import time as time_module
                 start_time = time_module.time()
                 
-                success = self.process_single_image_auto_save(input_path)
+                success = self._process_normalized(input_path)
                 
                 duration = time_module.time() - start_time
                 
                 if success:
                     results['success'] += 1
+                    output_path = self._locate_output(input_path, before)
+                    self._mark_located(input_path, output_path)
+                    if self.result_cache and output_path:
+                        self.result_cache.store(input_path, output_path)
+                    self._post_process(input_path, output_path, run_history)
                     logger.info(f"")
                     logger.info(f"  IMAGE #{idx} SUCCESS (took {duration:.1f}s)")
                     logger.info(f"   Total progress: {results['success']}/{len(image_files)}")
@@ -406,10 +658,12 @@ class GigapixelController(BaseController):
                         run_history.add_image_result(
                             str(input_path),
                             success=True,
-                            duration=duration
+                            duration=duration,
+                            output_path=output_path
                         )
                 else:
                     results['failed'] += 1
+                    self._journal(input_path, FAILED, "Processing failed")
                     logger.error(f"")
                     logger.error(f"IMAGE #{idx} FAILED (took {duration:.1f}s)")
                     logger.error(f"   Total failed: {results['failed']}")
@@ -428,6 +682,7 @@ class GigapixelController(BaseController):
                 logger.error(f"IMAGE #{idx} ERROR: {e}")
                 logger.exception("Full traceback:")
                 results['failed'] += 1
+                self._journal(input_path, FAILED, str(e))
                 logger.error(f"")
                 
                 # 실행 기록에 추가
@@ -440,3 +695,616 @@ class GigapixelController(BaseController):
         
         return results
 
+    def process_arrivals(self, image_paths: list, on_done):
+        """
+        --watch 모드: 새 이미지를 한 장씩 자동 저장 방식으로 처리
+        
+        Args:
+            image_paths: 새 이미지 경로 리스트
+            on_done: 이미지마다 끝날 때 호출 on_done(path, success, duration, error, verified)
+        """
+        self._prepare_normalized(image_paths)
+        for input_path in image_paths:
+            start_time = time.time()
+            verified = False
+            try:
+                before = self.output_locator.snapshot(input_path)
+                success = self._process_normalized(input_path)
+                error = None if success else "Processing failed"
+                if success:
+                    verified = self._locate_output(input_path, before) is not None
+            except Exception as e:
+                logger.error(f"{input_path.name} error: {e}")
+                logger.exception("Full traceback:")
+                success, error = False, str(e)
+            on_done(input_path, success, time.time() - start_time, error, verified=verified)
+    
+    def process_batch_pipeline(self, input_dir: Path, run_history=None) -> dict:
+        """
+        파이프라인 배치 처리 (자동 저장)
+        
+        앱이 이미지 N을 처리하는 동안 N+1 이후의 검사/정규화와 N-1 이전의 결과 감지/검증/기록을
+        동시에 진행한다. GUI 조작은 전용 스레드 하나에서 직렬로만 실행된다.
+        사전 정규화는 기다리지 않는다 (GUI가 이미지를 열 때 끝났으면 변환 파일, 아니면 원본).
+        
+        단계: 검사(사전 검사, 결과 캐시) → GUI(열기~저장) → 완료 감지 → 검증(후처리) → 기록
+        
+        Args:
+            input_dir: 입력 디렉토리
+            run_history: RunHistory 객체 (실행 기록 저장용)
+        
+        Returns:
+            처리 결과 딕셔너리 {'success', 'failed', 'total', 'skipped'}
+        """
+        logger.info("Scanning for images...")
+        image_files = self._find_images(input_dir)
+        
+        if not image_files:
+            logger.warning(f"No unprocessed images found in {input_dir}")
+            return {'success': 0, 'failed': 0, 'total': 0, 'skipped': 0}
+        
+        total = len(image_files)
+        image_files, duplicates = self._filter_near_duplicates(image_files)
+        image_files, resumed = self._filter_resumed(image_files)
+        image_files = self._schedule(image_files)
+        
+        logger.info(f"Found {len(image_files)} unprocessed images (pipeline, "
+                    f"queue {self.config.PIPELINE_QUEUE_SIZE}, concurrency {self.config.PIPELINE_CONCURRENCY})")
+        
+        results = {'success': 0, 'failed': 0, 'total': total, 'skipped': resumed + duplicates}
+        
+        if self.result_cache:
+            self.result_cache.prefetch(image_files)
+        self._prepare_normalized(image_files)
+        
+        gui_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='gui')
+        cpu_executor = ProcessPoolExecutor(max_workers=self.config.PIPELINE_CONCURRENCY) if self.preflight else None
+        pipeline = self._build_pipeline(results, run_history, gui_executor, cpu_executor)
+        try:
+            asyncio.run(pipeline.run({'path': path} for path in image_files))
+        finally:
+            gui_executor.shutdown(wait=True)
+            if cpu_executor:
+                cpu_executor.shutdown(wait=False, cancel_futures=True)
+        
+        stats = pipeline.get_stats()
+        logger.info(f"Pipeline: {pipeline.wall_seconds:.1f}s, " + ", ".join(
+            f"{name} {stat['utilization']:.0%}" for name, stat in stats.items()
+        ))
+        if run_history:
+            run_history.set_metrics("pipeline", stats)
+        
+        return results
+    
+    def _build_pipeline(self, results: dict, run_history, gui_executor, cpu_executor) -> Pipeline:
+        """
+        파이프라인 단계 구성
+        
+        단계 함수는 이벤트 루프 스레드에서 실행되고, 블로킹 작업은 풀로 넘긴다.
+        GUI 조작은 gui_executor(스레드 1개)에서만 실행된다.
+        """
+        def run(executor, func, *args):
+            return asyncio.get_running_loop().run_in_executor(executor, func, *args)
+        
+        async def validate(item):
+            path = item['path']
+            if self.preflight is not None:
+                check = await run(cpu_executor, inspect_image, path, self.preflight.min_side, self.preflight.reject_modes)
+                if not check['ok']:
+                    self._reject(path, check['reason'], results, run_history)
+                    return None
+            
+            item['export_dir'] = self.config.EXPORT_DIR or path.parent
+            if self.result_cache and await run(None, self._reuse_cached_result, path, item['export_dir']):
+                results['success'] += 1
+                self._mark_done(path)
+                if run_history:
+                    run_history.add_image_result(str(path), success=True, duration=0.0)
+                return None
+            return item
+        
+        async def drive(item):
+            def gui():
+                before = self.output_locator.snapshot(item['path'])
+                start_time = time.time()
+                # 열기 직전에 결정 (정규화가 아직 안 끝났으면 기다리지 않고 원본을 엶)
+                open_path = self._open_path(item['path'])
+                success = self._with_circuit_breaker(
+                    item['path'].name,
+                    lambda: self.process_single_image_auto_save(item['path'], open_path=open_path)
+                )
+                duration = time.time() - start_time
+                self._recycle_if_needed(duration, success, [item['path']])
+                return before, success, duration
+            
+            item['before'], item['success'], item['duration'] = await run(gui_executor, gui)
+            return item
+        
+        async def detect(item):
+            path = item['path']
+            await run(None, self._release_normalized, path)
+            item['output'] = None
+            if item['success']:
+                item['output'] = await run(None, self._locate_output, path, item['before'])
+            return item
+        
+        async def verify(item):
+            item['postprocess'] = None
+            if item['success'] and self.post_processor is not None:
+                item['postprocess'] = await asyncio.wrap_future(
+                    self.post_processor.submit(item['path'], item['output'])
+                )
+                if item['postprocess']['output']:
+                    item['output'] = item['postprocess']['output']
+                    self.output_locator.moved(item['path'], item['output'])
+                    self._remember_outputs([item['output']])
+            return item
+        
+        async def record(item):
+            path, postprocess = item['path'], item['postprocess']
+            error = None
+            if not item['success']:
+                error = "Processing failed"
+            elif postprocess and not postprocess['ok']:
+                error = f"Output verification failed: {postprocess['error']}"
+            
+            if error is None:
+                results['success'] += 1
+                self._mark_located(path, item['output'])
+                if self.result_cache and item['output']:
+                    await run(None, self.result_cache.store, path, item['output'])
+                logger.info(f"  [pipeline] {path.name}: SUCCESS ({item['duration']:.1f}s in app)")
+            else:
+                results['failed'] += 1
+                self._journal(path, FAILED, error)
+                logger.error(f"  [pipeline] {path.name}: {error}")
+            
+            if run_history:
+                run_history.add_image_result(
+                    str(path), success=error is None, duration=item['duration'], error=error, output_path=item['output']
+                )
+                if postprocess:
+                    run_history.add_postprocess_result(str(path), postprocess)
+        
+        def on_error(stage: str, item: dict, error: Exception):
+            path = item['path']
+            self._release_normalized(path)
+            results['failed'] += 1
+            self._journal(path, FAILED, f"{stage}: {error}")
+            if run_history:
+                run_history.add_image_result(str(path), success=False, error=f"{stage}: {error}")
+        
+        concurrency = self.config.PIPELINE_CONCURRENCY
+        return Pipeline(
+            [
+                Stage('validate', validate, concurrency),
+                Stage('gui', drive, 1),
+                Stage('detect', detect, concurrency),
+                Stage('verify', verify, concurrency),
+                Stage('record', record, 1),
+            ],
+            queue_size=self.config.PIPELINE_QUEUE_SIZE,
+            on_error=on_error
+        )
+    
+    def _process_normalized(self, input_path: Path) -> bool:
+        """
+        자동 저장 방식으로 처리하되, 사전 정규화된 파일이 준비되어 있으면 그 파일을 연다
+        
+        처리 후 정규화 폴더에 저장된 결과물은 원본 폴더로 옮기고, 앱 재활용 정책을 확인한다.
+        """
+        start_time = time.time()
+        try:
+            success = self._with_circuit_breaker(
+                input_path.name,
+                lambda: self.process_single_image_auto_save(input_path, open_path=self._open_path(input_path))
+            )
+        finally:
+            self._release_normalized(input_path)
+        
+        self._recycle_if_needed(time.time() - start_time, success, [input_path])
+        return success
+    
+    def _take_cached(self, image_paths: list, results: dict, run_history=None) -> list:
+        """
+        결과 캐시에 있는 이미지는 이전 결과를 재사용해 성공 처리하고 나머지를 반환
+        
+        Args:
+            image_paths: 처리할 이미지 경로 리스트
+            results: 처리 결과 딕셔너리 (성공 개수 갱신)
+            run_history: RunHistory 객체
+        
+        Returns:
+            Topaz로 처리해야 하는 이미지 리스트
+        """
+        if self.result_cache is None:
+            return image_paths
+        
+        remaining = []
+        for input_path in image_paths:
+            export_dir = self.config.EXPORT_DIR or input_path.parent
+            if not self._reuse_cached_result(input_path, export_dir):
+                remaining.append(input_path)
+                continue
+            
+            results['success'] += 1
+            self._mark_done(input_path)
+            if run_history:
+                run_history.add_image_result(str(input_path), success=True, duration=0.0)
+        
+        return remaining
+    
+    def _mark_located(self, input_path: Path, output_path: Optional[Path]):
+        """
+        결과 파일을 찾았을 때만 완료 기록 (저널 verified, 처리 기록)
+        
+        앱이 저장에 성공했다고 보고해도 결과 파일이 없으면 저널을 exported로 남겨
+        --resume/--manifest 다음 실행에서 다시 처리되게 한다.
+        
+        Args:
+            input_path: 입력 이미지 경로
+            output_path: _locate_output() 결과 (None이면 찾지 못함)
+        """
+        if output_path:
+            self._mark_done(input_path)
+        else:
+            logger.warning(f"  {input_path.name}: output not found, leaving it unverified for the next run")
+    
+    def _locate_output(self, input_path: Path, before: dict) -> Optional[Path]:
+        """
+        저장 후 후보 폴더에 새로 생긴 입력 이미지의 결과 파일을 찾아 인덱스에 기록
+        
+        Args:
+            input_path: 입력 이미지 경로
+            before: 처리 전 output_locator.snapshot() 결과
+        
+        Returns:
+            결과 파일 경로 (찾지 못하면 None)
+        """
+        output_path = self.output_locator.locate(input_path, before, timeout=self.config.OUTPUT_LOCATE_TIMEOUT)
+        self._remember_outputs([output_path])
+        return output_path
+    
+    def _track_queue_outputs(
+        self,
+        image_paths: list,
+        before: dict,
+        started_at: float,
+        timeout: float
+    ) -> dict:
+        """
+        Export 큐의 각 항목이 끝나는 것을 출력 파일 생성으로 추적
+        
+        새로 생긴 파일을 output_locator로 입력에 배정하고,
+        크기가 두 번 연속 같으면 완료로 보고 인덱스에 기록한다.
+        
+        Args:
+            image_paths: 큐에 들어간 입력 이미지 경로 리스트
+            before: Export 시작 전 output_locator.snapshot() 결과
+            started_at: Export 시작 시각 (time.time())
+            timeout: 최대 대기 시간 (초)
+        
+        Returns:
+            {입력 경로: (출력 경로, Export 시작 후 경과 초)} - 완료된 항목만
+        """
+        pending = list(image_paths)
+        input_names = {path.name for path in image_paths}
+        finished = {}
+        assigned = set()  # 이미 끝난 항목에 배정한 출력 (남은 항목에 다시 배정하지 않음)
+        last_sizes = {}
+        
+        logger.info(f"Tracking {len(pending)} queue items in {', '.join(str(d) for d in before)} "
+                    f"(timeout: {timeout:.0f}s)")
+        
+        while pending and time.time() - started_at < timeout:
+            # 남은 입력만으로 stem 맵 구성 (같은 stem이면 먼저 남은 입력)
+            stems = {}
+            for path in pending:
+                stems.setdefault(path.stem.lower(), path)
+            
+            for directory, previous in before.items():
+                for name, size in self.file_handler.snapshot_directory(directory).items():
+                    output_path = directory / name
+                    if name in previous or name in input_names or size == 0 or output_path in assigned:
+                        continue
+                    
+                    input_path = self.output_locator.owner(name, stems)
+                    if input_path is None:
+                        continue
+                    
+                    # 크기가 안정되면 완료
+                    if last_sizes.get(output_path) == size:
+                        pending.remove(input_path)
+                        assigned.add(output_path)
+                        elapsed = time.time() - started_at
+                        finished[input_path] = (output_path, elapsed)
+                        self.output_locator.record(input_path, output_path, size)
+                        self._remember_outputs([output_path])
+                        logger.info(f"  [queue] {input_path.name} -> {name} ({elapsed:.1f}s)")
+                    else:
+                        last_sizes[output_path] = size
+            
+            if pending:
+                try:
+                    self._sleep(1)
+                except AppHangError as e:
+                    # 이미 끝난 항목은 완료로 남기고 추적 중단
+                    logger.warning(f"  [queue] Stopped tracking: {e}")
+                    break
+        
+        for input_path in pending:
+            logger.warning(f"  [queue] {input_path.name}: export not detected")
+        
+        return finished
+    
+    def process_queue_chunk(self, image_paths: list) -> dict:
+        """
+        청크 단위 처리: 한 번에 열기 → 전체 선택 → 한 번 Export → 항목별 완료 추적
+        
+        Args:
+            image_paths: 같은 디렉토리의 입력 이미지 경로 리스트
+        
+        Returns:
+            {입력 경로: (출력 경로, Export 시작 후 경과 초)} - 완료된 항목만
+        """
+        if not self.open_images(image_paths):
+            return {}
+        self._journal(image_paths, OPENED)
+        
+        # 로드된 이미지 전체 선택
+        self.delays.sleep('image_settle')
+        if not self.activate_app_window():
+            return {}
+        self.press_shortcut(self.config.SHORTCUT_SELECT_ALL)
+        
+        if not self.wait_for_processing():
+            return {}
+        
+        before = self.output_locator.snapshot(*image_paths)
+        started_at = time.time()
+        
+        if not self._start_export():
+            return {}
+        self._journal(image_paths, EXPORTED)
+        
+        timeout = max(
+            self.config.MAX_WAIT_TIME,
+            self.config.SAVE_PROCESSING_WAIT_TIME * len(image_paths) * 2
+        )
+        finished = self._track_queue_outputs(image_paths, before, started_at, timeout)
+        
+        self._close_export_dialog()
+        
+        # 다음 청크가 이전 이미지를 다시 선택하지 않도록 모두 닫기
+        if self.config.SHORTCUT_CLOSE_ALL:
+            self.activate_app_window()
+            self.press_shortcut(self.config.SHORTCUT_CLOSE_ALL)
+        
+        return finished
+    
+    @staticmethod
+    def _queue_chunks(image_paths, chunk_size: int):
+        """
+        이미지를 chunk_size장씩 묶되 폴더가 바뀌면 새 청크 시작 (열기 다이얼로그는 한 폴더만 다룸)
+        
+        같은 stem(a.jpg/a.png)은 결과 파일명으로 구분할 수 없으므로 다른 청크로 나눈다.
+        
+        Args:
+            image_paths: 이미지 경로 iterable (하위 폴더 검색 시 폴더별로 이어져 있음)
+            chunk_size: 청크당 최대 이미지 수
+        
+        Yields:
+            같은 폴더의 이미지 경로 리스트
+        """
+        chunk = []
+        stems = set()
+        for path in image_paths:
+            stem = path.stem.lower()
+            if chunk and (path.parent != chunk[-1].parent or stem in stems):
+                yield chunk
+                chunk = []
+                stems = set()
+            chunk.append(path)
+            stems.add(stem)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+                stems = set()
+        if chunk:
+            yield chunk
+    
+    def process_batch_queue(self, input_dir: Path, run_history=None) -> dict:
+        """
+        배치 큐 처리 (여러 이미지를 한 번에 열고 한 번에 Export)
+        
+        열기/Export 다이얼로그 등 GUI 고정 비용을 이미지마다가 아니라
+        청크(BATCH_QUEUE_SIZE장)마다 한 번만 지불한다.
+        
+        Args:
+            input_dir: 입력 디렉토리
+            run_history: RunHistory 객체 (실행 기록 저장용)
+        
+        Returns:
+            처리 결과 딕셔너리 {'success', 'failed', 'total', 'skipped'}
+        """
+        logger.info("Scanning for images...")
+        image_files = self._find_images(input_dir)
+        
+        if not image_files:
+            logger.warning(f"No unprocessed images found in {input_dir}")
+            return {'success': 0, 'failed': 0, 'total': 0, 'skipped': 0}
+        
+        total = len(image_files)
+        image_files, duplicates = self._filter_near_duplicates(image_files)
+        image_files, resumed = self._filter_resumed(image_files)
+        image_files = self._schedule(image_files)
+        
+        chunk_size = max(1, self.config.BATCH_QUEUE_SIZE)
+        num_chunks = sum(-(-len(list(run)) // chunk_size) for _, run in groupby(image_files, key=lambda p: p.parent))
+        logger.info(f"Found {len(image_files)} unprocessed images -> {num_chunks} chunks of up to {chunk_size}")
+        
+        results = {'success': 0, 'failed': 0, 'total': total, 'skipped': resumed + duplicates}
+        
+        # 사전 검사를 통과한 이미지로 청크를 채움 (검사는 앞쪽 청크 처리와 겹쳐 진행)
+        validated = self._validated(image_files, results, run_history)
+        chunks = self._queue_chunks(validated, chunk_size)
+        
+        # GUI 처리보다 먼저 내용 해시 계산 시작
+        if self.result_cache:
+            self.result_cache.prefetch(image_files)
+        
+        for chunk_idx, chunk in enumerate(chunks, 1):
+            logger.info("")
+            logger.info("=" * 60)
+            logger.info(f"CHUNK {chunk_idx}/{num_chunks}: {len(chunk)} images")
+            logger.info("=" * 60)
+            
+            chunk = self._take_cached(chunk, results, run_history)
+            if not chunk:
+                continue
+            
+            start_time = time.time()
+            error = "Export not detected"
+            try:
+                finished = self.process_queue_chunk(chunk)
+            except Exception as e:
+                logger.error(f"Chunk {chunk_idx} error: {e}")
+                logger.exception("Full traceback:")
+                finished = {}
+                error = str(e)
+            
+            # 앱이 멈췄으면 다음 청크 전에 재시작 (실패한 이미지는 --resume으로 다시 처리)
+            if not self._recover_if_hung() and finished:
+                self._recycle_if_needed((time.time() - start_time) / len(finished), image_paths=list(finished))
+            
+            logger.info(f"Chunk {chunk_idx}: {len(finished)}/{len(chunk)} exported "
+                        f"(took {time.time() - start_time:.1f}s)")
+            
+            self._mark_done([path for path in chunk if path in finished])
+            for input_path, (output_path, _) in finished.items():
+                if self.result_cache:
+                    self.result_cache.store(input_path, output_path)
+                self._post_process(input_path, output_path, run_history)
+            self._journal([path for path in chunk if path not in finished], FAILED, error)
+            
+            for input_path in chunk:
+                if input_path in finished:
+                    results['success'] += 1
+                    if run_history:
+                        run_history.add_image_result(
+                            str(input_path),
+                            success=True,
+                            duration=finished[input_path][1],
+                            output_path=finished[input_path][0]
+                        )
+                else:
+                    results['failed'] += 1
+                    if run_history:
+                        run_history.add_image_result(
+                            str(input_path),
+                            success=False,
+                            error=error
+                        )
+        
+        return results
+    
+    def calibrate(self, image_paths: list, calibrator) -> bool:
+        """
+        샘플 이미지로 열기/저장을 실행하며 UI 전환 시간 측정
+        
+        측정 항목 (타이틀로 관찰 가능한 전환만):
+            open_dialog: Ctrl+O → 파일 다이얼로그 표시
+            image_load: Enter → 타이틀에 파일명 표시 (참고용)
+            save_dialog: Ctrl+S → 저장 다이얼로그 표시
+            export_dialog: Enter → Export Settings 창으로 전환
+            dialog_close: Esc → 메인 윈도우 복귀
+        
+        Args:
+            image_paths: 샘플 이미지 경로 리스트
+            calibrator: LatencyCalibrator
+        
+        Returns:
+            하나 이상의 샘플을 끝까지 측정했으면 True
+        """
+        get_title = self.state_monitor.get_active_window_title
+        main_window = title_contains(get_title, "Topaz Gigapixel")
+        completed = 0
+        
+        for idx, image_path in enumerate(image_paths, 1):
+            logger.info(f"[calibrate {idx}/{len(image_paths)}] {image_path.name}")
+            
+            if not self.activate_app_window():
+                logger.error("Failed to activate application window")
+                return False
+            self.delays.sleep('activate_settle')
+            
+            # 1. 열기 다이얼로그
+            if calibrator.measure(
+                'open_dialog',
+                lambda: self.press_shortcut(self.config.SHORTCUT_OPEN, delay=0),
+                self._dialog_open,
+                timeout=15
+            ) is None:
+                self._close_dialog_if_open()
+                continue
+            
+            pyautogui.hotkey('ctrl', 'a')
+            self.delays.sleep('field_select')
+            pyautogui.press('delete')
+            self.delays.sleep('field_clear')
+            self.type_text(str(image_path.absolute()), use_clipboard=True)
+            self.delays.sleep('path_settle')
+            
+            # 2. 이미지 로드
+            if calibrator.measure(
+                'image_load',
+                lambda: pyautogui.press('enter'),
+                title_shows_file(get_title, image_path.name),
+                timeout=60
+            ) is None:
+                self._close_dialog_if_open()
+                continue
+            
+            self.delays.sleep('image_settle')
+            self.zoom_to_fit()
+            self.delays.sleep('zoom_settle')
+            self.wait_for_processing()
+            
+            # 3. 저장 다이얼로그
+            self.activate_app_window()
+            self.delays.sleep('activate_settle')
+            if calibrator.measure(
+                'save_dialog',
+                lambda: self.press_shortcut(self.config.SHORTCUT_SAVE, delay=0),
+                self._dialog_open,
+                timeout=15
+            ) is None:
+                self._close_dialog_if_open()
+                continue
+            
+            # 4. Export Settings 전환 (타이틀 변화)
+            save_title = get_title()
+            calibrator.measure(
+                'export_dialog',
+                lambda: pyautogui.press('enter'),
+                lambda: get_title() != save_title,
+                timeout=15
+            )
+            
+            if not self._wait_for_save_processing():
+                self._close_dialog_if_open()
+                continue
+            
+            # 5. 다이얼로그 닫기
+            if calibrator.measure(
+                'dialog_close',
+                lambda: pyautogui.press('esc'),
+                main_window,
+                timeout=10
+            ) is None:
+                self._close_dialog_if_open()
+                continue
+            
+            completed += 1
+        
+        return completed > 0
@@ -1,6 +1,8 @@
 """Topaz Photo AI controller"""
 import time
+from contextlib import ExitStack
 from pathlib import Path
+from typing import Optional
 from loguru import logger
 import pyautogui
 
@@ -8,6 +10,12 @@ from .base_controller import BaseController
 from config.photoai_config import PhotoAIConfig
 from utils.state_monitor import StateMonitor
 from utils.ui_detector import UIDetector
+from utils.optimistic import title_contains
+from utils.staging import StagingDirectory
+from utils.post_processor import match_outputs
+from utils.image_info import plan_chunks
+from utils.job_journal import OPENED, EXPORTED, FAILED
+from utils.completion_probe import CompletionProbe, TemplateProbe
 
 
 class PhotoAIController(BaseController):
@@ -22,6 +30,22 @@ class PhotoAIController(BaseController):
     def force_activate_app(self) -> bool:
         """
         앱을 강제로 활성화 (여러 번 시도 + 마우스 클릭)
+        이미 포그라운드에 있으면 전체 과정을 건너뜀
+        
+        Returns:
+            성공 여부
+        """
+        hwnd = self.window_manager.find_window_by_title(self.config.WINDOW_TITLE_PATTERN)
+        return self.focus_tracker.ensure_focus(
+            hwnd, self._force_activate_window, kind='force_activate'
+        )
+    
+    def _force_activate_window(self, hwnd: int) -> bool:
+        """
+        force_activate_app의 실제 활성화 과정
+        
+        Args:
+            hwnd: 앱 윈도우 핸들 (0이면 활성화 후 다시 찾음)
         
         Returns:
             성공 여부
@@ -49,7 +73,8 @@ class PhotoAIController(BaseController):
         time.sleep(0.5)
         
         # 2. 앱 창을 찾아서 중앙 클릭
-        hwnd = self.window_manager.find_window_by_title(self.config.WINDOW_TITLE_PATTERN)
+        if not hwnd:
+            hwnd = self.window_manager.find_window_by_title(self.config.WINDOW_TITLE_PATTERN)
         if hwnd:
             try:
                 import win32gui
@@ -139,12 +164,13 @@ class PhotoAIController(BaseController):
         logger.warning("save_image not used in Photo AI (use export_images instead)")
         return True
     
-    def open_images(self, image_paths: list) -> bool:
+    def open_images(self, image_paths: list, staged: bool = False) -> bool:
         """
         이미지 열기 (다중 선택 가능)
         
         Args:
             image_paths: 열 이미지 파일 경로 리스트
+            staged: 대상 이미지만 담은 스테이징 폴더의 경로인지 여부
         
         Returns:
             성공 여부
@@ -160,14 +186,22 @@ class PhotoAIController(BaseController):
             logger.error("Failed to activate application window")
             return False
         
-        time.sleep(0.5)
-        
-        # Ctrl+O로 파일 열기 대화상자 열기
-        logger.debug("Pressing Ctrl+O to open file dialog...")
-        self.press_shortcut(self.config.SHORTCUT_OPEN, delay=2.0)
-        
-        # 파일 다이얼로그가 열렸는지 확인
-        time.sleep(1.5)
+        if self.use_optimistic:
+            # Ctrl+O 후 파일 다이얼로그가 앞으로 나왔는지 확인
+            def press_open(scale: float):
+                self.press_shortcut(self.config.SHORTCUT_OPEN, delay=0)
+            
+            if not self.optimistic.run('open_dialog', press_open, self._dialog_open,
+                                       timeout=self.delays.get('multi_open_dialog') * 2,
+                                       rollback=self._close_dialog_if_open):
+                logger.error("File dialog did not appear")
+                return False
+        else:
+            self.delays.sleep('activate_settle')
+            
+            # Ctrl+O로 파일 열기 대화상자 열기
+            logger.debug("Pressing Ctrl+O to open file dialog...")
+            self.press_shortcut(self.config.SHORTCUT_OPEN, delay=self.delays.get('multi_open_dialog'))
         
         # 디렉토리 경로만 입력 (파일명은 입력하지 않음!)
         input_dir_path = str(image_paths[0].parent.absolute())
@@ -176,17 +210,17 @@ class PhotoAIController(BaseController):
         # 파일명 필드 초기화
         logger.debug("Clearing file name field...")
         pyautogui.hotkey('ctrl', 'a')
-        time.sleep(0.3)
+        self.delays.sleep('field_select')
         
         # 디렉토리 경로 입력 (클립보드 사용)
         logger.debug("Entering directory path...")
         self.type_text(input_dir_path, use_clipboard=True)
-        time.sleep(0.8)
+        self.delays.sleep('dir_path_settle')
         
         # Enter로 디렉토리로 이동
         logger.debug("Pressing Enter to navigate to directory...")
         pyautogui.press('enter')
-        time.sleep(2.5)  # 디렉토리 로드 대기 (충분히 길게)
+        self.delays.sleep('dir_load')  # 디렉토리 로드 대기 (충분히 길게)
         
         # 파일 다이얼로그가 여전히 열려있는지 확인
         logger.debug("File dialog should now show all files in the directory")
@@ -194,20 +228,20 @@ class PhotoAIController(BaseController):
         # 파일명 필드 비우기
         logger.debug("Clearing file name field...")
         pyautogui.hotkey('ctrl', 'a')
-        time.sleep(0.2)
+        self.delays.sleep('field_select')
         pyautogui.press('delete')
-        time.sleep(0.3)
+        self.delays.sleep('field_clear')
         
         # 핵심: Shift+Tab으로 파일 리스트로 포커스 이동!
         # Windows 파일 대화상자: 파일명 필드 -> Shift+Tab -> 파일 리스트
         logger.info("Moving focus to file list with Shift+Tab...")
         pyautogui.hotkey('shift', 'tab')
-        time.sleep(0.5)
+        self.delays.sleep('file_list_focus')
         
         # 파일 리스트에서 Ctrl+A로 모든 파일 선택
         logger.info("Selecting all files with Ctrl+A...")
         pyautogui.hotkey('ctrl', 'a')
-        time.sleep(1.0)
+        self.delays.sleep('select_all_files')
         
         logger.debug("All files should now be selected (highlighted in blue)")
         
@@ -216,17 +250,21 @@ class PhotoAIController(BaseController):
         pyautogui.press('enter')
         
         # 이미지 로드 완료 대기
-        load_wait_time = 3 + len(image_paths) * 0.5
+        load_wait_time = (
+            self.delays.get('multi_load_base')
+            + len(image_paths) * self.delays.get('multi_load_per_image')
+        )
         logger.debug(f"Waiting {load_wait_time:.1f}s for images to load...")
-        time.sleep(load_wait_time)
+        self._sleep(load_wait_time)
         
         # 파일 로드 후 앱을 강제로 포커스!
         logger.info("Reactivating Photo AI window after file load...")
         self.force_activate_app()
         
         logger.info(f"  All files in directory should be loaded")
-        logger.info("   Note: This method loads ALL files in the directory")
-        logger.info("   Make sure only target images are in the directory!")
+        if not staged:
+            logger.info("   Note: This method loads ALL files in the directory")
+            logger.info("   Make sure only target images are in the directory!")
         
         return True
     
@@ -394,7 +432,7 @@ class PhotoAIController(BaseController):
                     else:
                         logger.info(f"  Applying filters... ({remaining}s remaining)")
                 
-                time.sleep(check_interval)
+                self._sleep(check_interval)
                 elapsed += check_interval
             
             if not completed:
@@ -457,13 +495,22 @@ class PhotoAIController(BaseController):
         logger.info("=" * 60)
         
         export_wait_time = self.config.EXPORT_PER_IMAGE_WAIT_TIME * num_images
-        logger.info(f"Waiting {export_wait_time}s for {num_images} images...")
         
-        for i in range(export_wait_time):
-            remaining = export_wait_time - i
-            if i % 5 == 0:
-                logger.info(f"  Exporting... ({remaining}s remaining)")
-            time.sleep(1)
+        if self.completion_probe is not None:
+            # 감지 방식이 있으면 고정 대기 시간의 2배(최소 MAX_WAIT_TIME)까지 완료를 기다림
+            if not self._wait_for_completion(max(self.config.MAX_WAIT_TIME, export_wait_time * 2)):
+                # 결과물이 덜 쓰였을 수 있으므로 Export 완료로 기록하지 않음
+                logger.error("Export did not complete in time")
+                self._close_dialog_if_open()
+                return False
+        else:
+            logger.info(f"Waiting {export_wait_time}s for {num_images} images...")
+            
+            for i in range(export_wait_time):
+                remaining = export_wait_time - i
+                if i % 5 == 0:
+                    logger.info(f"  Exporting... ({remaining}s remaining)")
+                self._sleep(1)
         
         logger.info("=" * 60)
         logger.info("  Export complete")
@@ -471,50 +518,110 @@ class PhotoAIController(BaseController):
         
         return True
     
-    def process_batch(self, input_dir: Path, run_history=None) -> dict:
+    def build_completion_probe(self, kind: str) -> Optional[CompletionProbe]:
         """
-        배치 처리
+        Export 완료 감지 객체 생성
+        
+        - template: 화면에 EXPORT_DONE_TEMPLATE이 나타나면 완료 (템플릿을 캡처하지 않았으면 None)
+        - ocr: Photo AI는 완료 텍스트 영역이 정해져 있지 않아 지원하지 않음
+        """
+        if kind == 'template':
+            # 템플릿이 없으면 매 확인마다 경고만 남기고 최대 대기 시간까지 기다리게 되므로 고정 대기 사용
+            if self.ui_detector.template_path(self.config.EXPORT_DONE_TEMPLATE) is None:
+                logger.warning(f"Export done template '{self.config.EXPORT_DONE_TEMPLATE}' not found in "
+                               f"{self.ui_detector.template_dir} (capture it with "
+                               f"python utils/ui_detector.py {self.config.EXPORT_DONE_TEMPLATE})")
+                return None
+            return TemplateProbe(self.ui_detector.find_button, self.config.EXPORT_DONE_TEMPLATE)
+        return super().build_completion_probe(kind)
+    
+    def calibrate(self, image_paths: list, calibrator) -> bool:
+        """
+        파일 다이얼로그 전환 시간 측정
+        
+        Photo AI는 디렉토리 이동/목록 로드가 타이틀에 드러나지 않으므로
+        Ctrl+O → 다이얼로그 표시(multi_open_dialog)만 보정하고,
+        Esc → 메인 윈도우 복귀는 참고용(file_dialog_close)으로 기록한다.
+        이미지는 실제로 열지 않는다.
         
         Args:
-            input_dir: 입력 디렉토리
-            run_history: RunHistory 객체 (실행 기록 저장용)
+            image_paths: 샘플 이미지 경로 리스트 (측정 횟수로 사용)
+            calibrator: LatencyCalibrator
         
         Returns:
-            처리 결과 딕셔너리
+            하나 이상의 측정에 성공했으면 True
         """
-        # 이미지 파일 목록
-        logger.info("Scanning for images...")
-        image_files = self.config.get_image_files(
-            input_dir,
-            exclude_suffixes=self.config.PROCESSED_SUFFIXES
+        main_window = title_contains(
+            self.state_monitor.get_active_window_title,
+            self.config.WINDOW_TITLE_PATTERN
         )
+        completed = 0
         
-        if not image_files:
-            logger.warning(f"No unprocessed images found in {input_dir}")
-            return {'success': 0, 'failed': 0, 'total': 0}
-        
-        num_images = len(image_files)
-        logger.info(f"Found {num_images} unprocessed images")
-        logger.info("")
-        logger.info("Image list:")
-        for idx, img in enumerate(image_files, 1):
-            logger.info(f"  {idx}. {img.name}")
-        logger.info("")
+        for idx in range(1, len(image_paths) + 1):
+            logger.info(f"[calibrate {idx}/{len(image_paths)}] file dialog")
+            
+            if not self.activate_app_window():
+                logger.error("Failed to activate application window")
+                return False
+            self.delays.sleep('activate_settle')
+            
+            if calibrator.measure(
+                'multi_open_dialog',
+                lambda: self.press_shortcut(self.config.SHORTCUT_OPEN, delay=0),
+                self._dialog_open,
+                timeout=15
+            ) is None:
+                self._close_dialog_if_open()
+                continue
+            
+            self.delays.sleep('dir_path_settle')
+            if calibrator.measure(
+                'file_dialog_close',
+                lambda: pyautogui.press('esc'),
+                main_window,
+                timeout=10
+            ) is not None:
+                completed += 1
+        
+        return completed > 0
+    
+    def process_chunk(self, image_files: list, run_history=None) -> bool:
+        """
+        청크 하나를 열기 → Autopilot → 순차 처리 → Export 순서로 처리
         
-        results = {'success': 0, 'failed': 0, 'total': num_images}
+        Args:
+            image_files: 청크의 이미지 경로 리스트
+            run_history: 후처리 결과를 기록할 RunHistory 객체
         
-        try:
-            import time as time_module
-            start_time = time_module.time()
+        Returns:
+            모든 단계 성공 여부
+        """
+        num_images = len(image_files)
+        staging = None
+        
+        with ExitStack() as stack:
+            open_paths = image_files
+            if self.config.USE_STAGING:
+                # 대상 이미지만 담은 임시 폴더를 열도록 스테이징 (정규화 파일이 준비되었으면 그 파일을 링크)
+                stack.callback(self._release_normalized, image_files)
+                staging = stack.enter_context(
+                    StagingDirectory(
+                        image_files,
+                        root=self.config.STAGING_DIR,
+                        replacements={path: self._open_path(path) for path in image_files}
+                    )
+                )
+                open_paths = staging.staged_paths
             
             # Step 1: Open images
             logger.info("=" * 60)
             logger.info("Step 1: Opening images")
             logger.info("=" * 60)
-            if not self.open_images(image_files):
+            if not self._step('open', lambda: self.open_images(open_paths, staged=self.config.USE_STAGING),
+                              rollback=self._close_dialog_if_open):
                 logger.error("Failed to open images")
-                results['failed'] = num_images
-                return results
+                return False
+            self._journal(image_files, OPENED)
             
             # Step 2: Apply Autopilot
             logger.info("")
@@ -523,8 +630,7 @@ class PhotoAIController(BaseController):
             logger.info("=" * 60)
             if not self.apply_autopilot(num_images):
                 logger.error("Failed to apply Autopilot")
-                results['failed'] = num_images
-                return results
+                return False
             
             # Step 3: Process each image sequentially
             logger.info("")
@@ -533,8 +639,7 @@ class PhotoAIController(BaseController):
             logger.info("=" * 60)
             if not self.process_each_image_sequentially(num_images):
                 logger.error("Failed to process images")
-                results['failed'] = num_images
-                return results
+                return False
             
             # Step 4: Export all images
             logger.info("")
@@ -543,39 +648,175 @@ class PhotoAIController(BaseController):
             logger.info("=" * 60)
             if not self.export_images(num_images):
                 logger.error("Failed to export images")
-                results['failed'] = num_images
-                return results
+                return False
+            self._journal(image_files, EXPORTED)
+        
+        # 스테이징 정리 때 원본 폴더로 옮긴 결과물만 위치를 알 수 있음
+        if staging is not None:
+            self._remember_outputs(staging.outputs)
+            for input_path, output_path in match_outputs(image_files, staging.outputs).items():
+                self._post_process(input_path, output_path, run_history)
+        
+        return True
+    
+    def _close_all_images(self):
+        """다음 청크가 이전 이미지를 다시 처리하지 않도록 열린 이미지 모두 닫기"""
+        if self.config.SHORTCUT_CLOSE_ALL:
+            self.force_activate_app()
+            self.press_shortcut(self.config.SHORTCUT_CLOSE_ALL)
+            # 저장 확인 다이얼로그가 떴다면 닫기
+            self._close_dialog_if_open()
+    
+    def process_arrivals(self, image_paths: list, on_done):
+        """
+        --watch 모드: 새 이미지를 청크로 나눠 청크 단위로 처리
+        
+        Args:
+            image_paths: 새 이미지 경로 리스트
+            on_done: 이미지마다 끝날 때 호출 on_done(path, success, duration, error)
+        """
+        if self.config.USE_STAGING:
+            self._prepare_normalized(image_paths)
+        chunks = plan_chunks(
+            image_paths,
+            megapixel_budget=self.config.CHUNK_MEGAPIXEL_BUDGET,
+            max_files=self.config.CHUNK_MAX_FILES,
+            unknown_megapixels=self.config.UNKNOWN_IMAGE_MEGAPIXELS
+        )
+        
+        for chunk in chunks:
+            start_time = time.time()
+            try:
+                success = self._with_circuit_breaker("chunk", lambda: self.process_chunk(chunk))
+                error = None if success else "Chunk step failed"
+            except Exception as e:
+                logger.error(f"Chunk error: {e}")
+                logger.exception("Full traceback:")
+                success, error = False, str(e)
             
-            duration = time_module.time() - start_time
+            duration = (time.time() - start_time) / len(chunk)
+            for img_path in chunk:
+                on_done(img_path, success, duration, error)
             
-            # 모두 성공
-            results['success'] = num_images
+            try:
+                self._close_all_images()
+            except Exception as e:
+                logger.warning(f"Failed to close images: {e}")
+    
+    def process_batch(self, input_dir: Path, run_history=None) -> dict:
+        """
+        배치 처리
+        
+        이미지를 해상도 합계(CHUNK_MEGAPIXEL_BUDGET)와 파일 수(CHUNK_MAX_FILES)
+        기준의 청크로 나눠 청크마다 한 세션씩 처리한다.
+        앱 메모리 사용량이 청크 크기로 제한되고, 실패해도 해당 청크만 실패로 기록된다.
+        
+        Args:
+            input_dir: 입력 디렉토리
+            run_history: RunHistory 객체 (실행 기록 저장용)
+        
+        Returns:
+            처리 결과 딕셔너리
+        """
+        # 이미지 파일 목록
+        logger.info("Scanning for images...")
+        image_files = self._find_images(input_dir)
+        
+        if not image_files:
+            logger.warning(f"No unprocessed images found in {input_dir}")
+            return {'success': 0, 'failed': 0, 'total': 0}
+        
+        total = len(image_files)
+        image_files, duplicates = self._filter_near_duplicates(image_files)
+        image_files, resumed = self._filter_resumed(image_files)
+        image_files = self._schedule(image_files)
+        
+        num_images = len(image_files)
+        logger.info(f"Found {num_images} unprocessed images")
+        logger.info("")
+        logger.info("Image list:")
+        for idx, img in enumerate(image_files, 1):
+            logger.info(f"  {idx}. {img.name}")
+        logger.info("")
+        
+        results = {'success': 0, 'failed': 0, 'total': total, 'skipped': resumed + duplicates}
+        
+        # 청크는 해상도 합계로 나누므로 검사를 모두 마친 뒤 계획
+        image_files = list(self._validated(image_files, results, run_history))
+        
+        if self.config.USE_STAGING:
+            self._prepare_normalized(image_files)
+        
+        chunks = plan_chunks(
+            image_files,
+            megapixel_budget=self.config.CHUNK_MEGAPIXEL_BUDGET,
+            max_files=self.config.CHUNK_MAX_FILES,
+            unknown_megapixels=self.config.UNKNOWN_IMAGE_MEGAPIXELS
+        )
+        logger.info(f"Split into {len(chunks)} chunks "
+                    f"(budget {self.config.CHUNK_MEGAPIXEL_BUDGET:.0f}MP, max {self.config.CHUNK_MAX_FILES} files)")
+        
+        batch_start = time.time()
+        
+        for chunk_idx, chunk in enumerate(chunks, 1):
             logger.info("")
             logger.info("=" * 60)
-            logger.info(f"  BATCH COMPLETE: {num_images} images (took {duration:.1f}s)")
+            logger.info(f"CHUNK {chunk_idx}/{len(chunks)}: {len(chunk)} images")
             logger.info("=" * 60)
             
+            start_time = time.time()
+            error = None
+            try:
+                success = self._with_circuit_breaker(
+                    f"chunk {chunk_idx}",
+                    lambda: self.process_chunk(chunk, run_history)
+                )
+                if not success:
+                    error = "Chunk step failed"
+            except Exception as e:
+                logger.error(f"Chunk {chunk_idx} error: {e}")
+                logger.exception("Full traceback:")
+                success = False
+                error = str(e)
+            
+            duration = time.time() - start_time
+            
+            if success:
+                results['success'] += len(chunk)
+                self._mark_done(chunk)
+                logger.info(f"  CHUNK {chunk_idx} COMPLETE: {len(chunk)} images (took {duration:.1f}s)")
+            else:
+                results['failed'] += len(chunk)
+                self._journal(chunk, FAILED, error)
+                logger.error(f"  CHUNK {chunk_idx} FAILED: {error}")
+            
             # 실행 기록에 추가
             if run_history:
-                for img_path in image_files:
-                    run_history.add_image_result(
-                        str(img_path),
-                        success=True,
-                        duration=duration / num_images
-                    )
-        
-        except Exception as e:
-            logger.error(f"Batch processing error: {e}")
-            logger.exception("Full traceback:")
-            results['failed'] = num_images
+                for img_path in chunk:
+                    if success:
+                        run_history.add_image_result(
+                            str(img_path),
+                            success=True,
+                            duration=duration / len(chunk)
+                        )
+                    else:
+                        run_history.add_image_result(
+                            str(img_path),
+                            success=False,
+                            error=error
+                        )
             
-            if run_history:
-                for img_path in image_files:
-                    run_history.add_image_result(
-                        str(img_path),
-                        success=False,
-                        error=str(e)
-                    )
+            if chunk_idx < len(chunks):
+                try:
+                    self._close_all_images()
+                except Exception as e:
+                    logger.warning(f"Failed to close images after chunk {chunk_idx}: {e}")
+        
+        logger.info("")
+        logger.info("=" * 60)
+        logger.info(f"  BATCH COMPLETE: {results['success']}/{num_images} images "
+                    f"(took {time.time() - batch_start:.1f}s)")
+        logger.info("=" * 60)
         
         return results
 
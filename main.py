@@ -20,6 +20,360 @@ from controllers.gigapixel_controller import GigapixelController
 from controllers.photoai_controller import PhotoAIController
 from utils.logger import setup_logger
 from utils.run_history import RunHistory
+from utils.delay_profile import DelayProfile
+from utils.calibration import LatencyCalibrator
+from utils.job_journal import JobJournal, journal_path_for
+from utils.result_cache import ResultCache
+from utils.scheduler import JobScheduler, POLICIES
+from utils.preflight import Preflight
+from utils.normalizer import Normalizer
+from utils.post_processor import PostProcessor
+from utils.retry_policy import RetryPolicy, CircuitBreaker
+from utils.app_process import PsutilProcessBackend
+from utils.hang_watchdog import HangWatchdog, AppHangError
+from utils.completion_probe import PROBES
+from utils.recycle_policy import RecyclePolicy
+from utils.processed_manifest import ProcessedManifest
+from utils.scan_cache import ScanCache
+
+
+def report_run_stats(controller, run_history):
+    """
+    실행 단위 통계(후처리, 포커스 추적, 저널, 입력 선택, 캐시/기록, 재시도/완료 감지/재활용/멈춤 감시,
+    낙관적 입력)를 로그와 실행 기록에 남김
+    
+    자원 정리는 controller.close()가 하며, 남은 후처리 결과가 실행 기록에 들어가도록 그 뒤에 호출한다.
+    """
+    if controller.post_processor is not None:
+        post_stats = controller.post_processor.get_stats()
+        run_history.set_metrics("postprocess", post_stats)
+        logger.info(f"결과물 후처리: 검증 {post_stats['verified']}장, 실패 {post_stats['failed']}장, "
+                    f"이동 {post_stats['moved']}장")
+    
+    stats = controller.focus_tracker.get_stats()
+    run_history.set_metrics("focus", stats)
+    logger.info(
+        f"윈도우 활성화: {stats['activations']}회 수행, {stats['skipped']}회 생략 "
+        f"(약 {stats['saved_seconds']:.1f}초 절약)"
+    )
+    
+    if controller.journal is not None:
+        journal_stats = controller.journal.get_stats()
+        run_history.set_metrics("journal", journal_stats)
+        logger.info(f"작업 저널: {controller.journal.path} {journal_stats}")
+    
+    if controller.duplicate_groups:
+        run_history.set_metrics("near_duplicates", {
+            str(rep): [str(member) for member in members]
+            for rep, members in controller.duplicate_groups.items()
+        })
+        skipped = sum(len(members) for members in controller.duplicate_groups.values())
+        logger.info(f"유사 이미지 제외: {skipped}장 ({len(controller.duplicate_groups)}개 그룹)")
+    
+    if controller.rejected:
+        run_history.set_metrics("preflight", {str(path): reason for path, reason in controller.rejected})
+        logger.info(f"사전 검사 제외: {len(controller.rejected)}장")
+    
+    if controller.normalizer is not None:
+        normalize_stats = controller.normalizer.get_stats()
+        run_history.set_metrics("normalize", normalize_stats)
+        logger.info(f"사전 정규화: 변환 {normalize_stats['converted']}장, "
+                    f"변환 미완료로 원본 사용 {normalize_stats['not_ready']}장, 오류 {normalize_stats['errors']}장")
+    
+    if controller.scheduler is not None and controller.scheduler.order:
+        schedule_stats = controller.scheduler.summary()
+        run_history.set_metrics("schedule", schedule_stats)
+        expected, achieved = schedule_stats['expected'], schedule_stats['achieved']
+        logger.info(
+            f"처리 순서 '{schedule_stats['policy']}': "
+            f"예상 {expected['throughput_per_hour']:.0f}장/시간 (평균 지연 {expected['mean_latency']:.0f}초), "
+            f"실제 {achieved['throughput_per_hour']:.0f}장/시간 (평균 지연 {achieved['mean_latency']:.0f}초)"
+        )
+    
+    if controller.result_cache is not None:
+        cache_stats = controller.result_cache.get_stats()
+        run_history.set_metrics("result_cache", cache_stats)
+        logger.info(f"결과 캐시: 적중 {cache_stats['hits']}회, 미적중 {cache_stats['misses']}회, "
+                    f"저장 {cache_stats['stored']}회")
+    
+    if controller.processed is not None:
+        manifest_stats = controller.processed.get_stats()
+        run_history.set_metrics("processed_manifest", manifest_stats)
+        logger.info(f"처리 기록: {manifest_stats['entries']}건 ({manifest_stats['mode']}), "
+                    f"기록으로 제외 {manifest_stats['skipped_recorded']}장, 원본이 있는 결과물 제외 "
+                    f"{manifest_stats['skipped_derived']}장, 새로 기록 {manifest_stats['recorded']}건")
+    
+    if controller.output_locator is not None:
+        locate_stats = controller.output_locator.get_stats()
+        run_history.set_metrics("output_locator", locate_stats)
+        logger.info(f"결과 파일 찾기: {locate_stats['located']}장 찾음 (suffix {locate_stats['by_suffix']}, "
+                    f"이름 앞부분 {locate_stats['by_prefix']}), 못 찾음 {locate_stats['not_found']}장, "
+                    f"인덱스 {locate_stats['indexed']}건")
+    
+    if controller.scan_cache is not None:
+        scan_stats = controller.scan_cache.get_stats()
+        run_history.set_metrics("scan_cache", scan_stats)
+        logger.info(f"탐색 캐시: 폴더 {scan_stats['dirs_cached']}개 캐시 사용, {scan_stats['dirs_listed']}개 다시 나열 "
+                    f"(저장된 폴더 {scan_stats['directories']}개)")
+    
+    if controller.retry_policy is not None:
+        retry_stats = {'steps': controller.retry_policy.get_stats()}
+        if controller.circuit_breaker is not None:
+            retry_stats['circuit_breaker'] = controller.circuit_breaker.get_stats()
+            logger.info(f"앱 재시작: {controller.circuit_breaker.restarts}회")
+        run_history.set_metrics("retry", retry_stats)
+        for step, stat in retry_stats['steps'].items():
+            logger.info(f"단계 재시도 '{step}': {stat['runs']}회, 재시도 {stat['retries']}회, 실패 {stat['failures']}회")
+    
+    if controller.completion_probe is not None:
+        probe_stats = controller.completion_probe.get_stats()
+        run_history.set_metrics("completion", probe_stats)
+        logger.info(f"완료 감지 '{probe_stats['probe']}': {probe_stats['waits']}회, 시간 초과 {probe_stats['timeouts']}회, "
+                    f"평균 {probe_stats['avg_wait_seconds']}초 (확인당 {probe_stats['avg_poll_ms']}ms)")
+    
+    if controller.recycle_policy is not None:
+        recycle_stats = controller.recycle_policy.get_stats()
+        run_history.set_metrics("recycle", recycle_stats)
+        logger.info(f"앱 재활용: {len(recycle_stats['restarts'])}회 (기준 {recycle_stats['baseline_seconds_per_mp']}초/MP)")
+        for entry in recycle_stats['restarts']:
+            logger.info(f"  {entry['after_image']}장 후 재시작: 시간당 {entry['throughput_before_per_hour']}장 → "
+                        f"{entry['throughput_after_per_hour']}장 ({entry['reason']})")
+    
+    if controller.watchdog is not None:
+        watchdog_stats = controller.watchdog.get_stats()
+        run_history.set_metrics("watchdog", watchdog_stats)
+        logger.info(f"앱 멈춤 감시: 멈춤 {len(watchdog_stats['hangs'])}회, 복구 {watchdog_stats['recoveries']}회 "
+                    f"(확인 {watchdog_stats['samples']}회, 평균 {watchdog_stats['avg_probe_ms']}ms)")
+    
+    if controller.use_optimistic:
+        optimistic_stats = controller.optimistic.get_stats()
+        run_history.set_metrics("optimistic", optimistic_stats)
+        for step, stat in optimistic_stats.items():
+            logger.info(
+                f"낙관적 입력 '{step}': {stat['runs']}회, 재시도 {stat['retries']}회, 실패 {stat['failures']}회"
+            )
+
+
+def open_journal(controller, config, input_dir: Path, resume: bool):
+    """배치 처리용 작업 저널 열기 (--resume이면 이전 기록을 이어서 사용)"""
+    journal_path = journal_path_for(input_dir, config.JOURNAL_DIR)
+    controller.journal = JobJournal(journal_path, resume=resume)
+    if resume:
+        logger.info(f"이전 작업 이어서 처리: {journal_path}")
+
+
+def open_result_cache(controller, config):
+    """결과 캐시 열기 (설정 지문은 컨트롤러가 결정)"""
+    controller.result_cache = ResultCache(
+        config.RESULT_CACHE_PATH,
+        controller.cache_settings(),
+        workers=config.HASH_WORKERS
+    )
+    logger.info(f"결과 캐시 사용: {config.RESULT_CACHE_PATH} (설정 지문 {controller.result_cache.fingerprint})")
+
+
+def setup_scheduler(controller, config, policy: str):
+    """처리 순서 스케줄러 설정 (policy가 비어 있으면 이름순 그대로)"""
+    if not policy:
+        return
+    controller.scheduler = JobScheduler(
+        policy,
+        base_seconds=config.SCHEDULE_BASE_SECONDS,
+        seconds_per_mp=config.SCHEDULE_SECONDS_PER_MP
+    )
+
+
+def setup_preflight(controller, config):
+    """입력 사전 검사 설정"""
+    controller.preflight = Preflight(
+        workers=config.PREFLIGHT_WORKERS,
+        min_side=config.PREFLIGHT_MIN_SIDE,
+        reject_modes=config.PREFLIGHT_REJECT_MODES
+    )
+
+
+def setup_normalizer(controller, config):
+    """입력 사전 정규화 설정"""
+    controller.normalizer = Normalizer(
+        config.NORMALIZE_DIR,
+        max_megapixels=config.NORMALIZE_MAX_MEGAPIXELS,
+        max_bit_depth=config.NORMALIZE_MAX_BIT_DEPTH,
+        color_modes=config.NORMALIZE_COLOR_MODES,
+        output_format=config.NORMALIZE_FORMAT,
+        workers=config.NORMALIZE_WORKERS
+    )
+
+
+def setup_post_processor(controller, config, destination: str = None):
+    """결과물 후처리 설정 (destination이 있으면 설정값 대신 사용)"""
+    controller.post_processor = PostProcessor(
+        workers=config.POSTPROCESS_WORKERS,
+        destination_dir=Path(destination) if destination else config.POSTPROCESS_DEST_DIR,
+        checksum=config.POSTPROCESS_CHECKSUM,
+        copy_times=config.POSTPROCESS_COPY_TIMES
+    )
+
+
+def setup_retry(controller, config):
+    """단계별 재시도 정책과 앱 재시작 서킷 브레이커 설정"""
+    controller.retry_policy = RetryPolicy(
+        attempts=config.RETRY_ATTEMPTS,
+        step_attempts=config.RETRY_STEP_ATTEMPTS,
+        base_delay=config.RETRY_BASE_DELAY,
+        max_delay=config.RETRY_MAX_DELAY,
+        fatal=(AppHangError,)
+    )
+    if config.CIRCUIT_BREAKER_THRESHOLD > 0:
+        controller.circuit_breaker = CircuitBreaker(
+            threshold=config.CIRCUIT_BREAKER_THRESHOLD,
+            max_restarts=config.CIRCUIT_BREAKER_MAX_RESTARTS
+        )
+
+
+def setup_watchdog(controller, config):
+    """앱 멈춤 감시 스레드 시작 (멈춤 감지 시 컨트롤러가 입력을 멈추고 앱 재시작)"""
+    backend = PsutilProcessBackend(config.PROCESS_NAME, config.WINDOW_TITLE_PATTERN)
+    controller.watchdog = HangWatchdog(
+        backend,
+        interval=config.WATCHDOG_INTERVAL,
+        hang_seconds=config.WATCHDOG_HANG_SECONDS,
+        busy_hang_seconds=config.WATCHDOG_BUSY_HANG_SECONDS,
+        probe_timeout=config.WATCHDOG_PROBE_TIMEOUT
+    )
+    controller.watchdog.start()
+
+
+def setup_completion_probe(controller, kind: str):
+    """Export 완료 감지 방식 설정 ('time'이거나 지원하지 않는 방식이면 고정 시간 대기)"""
+    if kind == 'time':
+        return
+    if kind not in PROBES:
+        logger.warning(f"알 수 없는 완료 감지 방식 '{kind}' - 고정 시간 대기 사용")
+        return
+    
+    controller.completion_probe = controller.build_completion_probe(kind)
+    if controller.completion_probe is None:
+        logger.warning(f"완료 감지 방식 '{kind}'를 사용할 수 없습니다 - 고정 시간 대기 사용")
+    else:
+        logger.info(f"Export 완료 감지 방식: {kind}")
+
+
+def open_processed_manifest(controller, config):
+    """처리 기록 열기 (이후 입력 목록에서 기록된 입력/결과물을 제외)"""
+    controller.processed = ProcessedManifest(
+        config.PROCESSED_MANIFEST_PATH,
+        max_exact=config.PROCESSED_MANIFEST_MAX_EXACT,
+        false_positive_rate=config.PROCESSED_MANIFEST_FP_RATE
+    )
+    logger.info(f"처리 기록: {config.PROCESSED_MANIFEST_PATH} ({controller.processed.entries}건)")
+
+
+def open_scan_cache(controller, config):
+    """입력 폴더 탐색 캐시 열기 (이후 탐색에서 mtime이 바뀐 디렉토리만 다시 나열)"""
+    controller.scan_cache = ScanCache(
+        config.SCAN_CACHE_PATH,
+        config.IMAGE_EXTENSIONS,
+        max_age=config.SCAN_CACHE_MAX_AGE_HOURS * 3600
+    )
+    logger.info(f"탐색 캐시: {config.SCAN_CACHE_PATH} (폴더 {len(controller.scan_cache.dirs)}개)")
+
+
+def open_output_index(controller, config):
+    """결과 파일 찾기에 입력 ↔ 결과 인덱스 파일 연결 (이전 실행 기록 재생)"""
+    controller.output_locator.open_index(config.OUTPUT_INDEX_PATH)
+    logger.info(f"결과 인덱스: {config.OUTPUT_INDEX_PATH} ({len(controller.output_locator.outputs)}건)")
+
+
+def setup_recycle(controller, config):
+    """처리 시간/앱 메모리 증가 시 이미지 사이에서 앱을 재시작하는 재활용 정책 설정"""
+    controller.recycle_policy = RecyclePolicy(
+        backend=PsutilProcessBackend(config.PROCESS_NAME),
+        window=config.RECYCLE_WINDOW,
+        baseline_images=config.RECYCLE_BASELINE_IMAGES,
+        slowdown=config.RECYCLE_SLOWDOWN,
+        rss_growth=config.RECYCLE_RSS_GROWTH,
+        rss_limit_mb=config.RECYCLE_RSS_LIMIT_MB,
+        max_restarts=config.RECYCLE_MAX_RESTARTS
+    )
+
+
+def configure_controller(controller, config, args):
+    """두 모드에 공통인 명령줄 옵션/설정을 컨트롤러에 적용 (지연 프로파일, 입력 선택, 보조 기능)"""
+    if args.delay_profile:
+        controller.apply_delay_profile(DelayProfile.load(args.delay_profile))
+    
+    if args.optimistic:
+        controller.use_optimistic = True
+    
+    if args.dedupe:
+        controller.dedupe = True
+    
+    if args.dedupe_threshold is not None:
+        controller.config.DEDUPE_THRESHOLD = args.dedupe_threshold
+    
+    if args.recursive:
+        controller.config.RECURSIVE_SCAN = True
+    
+    setup_scheduler(controller, config, args.schedule or config.SCHEDULE_POLICY)
+    
+    if args.preflight or config.PREFLIGHT:
+        setup_preflight(controller, config)
+    
+    if args.normalize or config.NORMALIZE:
+        setup_normalizer(controller, config)
+    
+    if args.postprocess or config.POSTPROCESS:
+        setup_post_processor(controller, config, args.postprocess_dest)
+    
+    if args.retry or config.RETRY:
+        setup_retry(controller, config)
+    
+    if args.watchdog or config.WATCHDOG:
+        setup_watchdog(controller, config)
+    
+    setup_completion_probe(controller, args.completion_probe or config.COMPLETION_PROBE)
+    
+    if args.recycle or config.RECYCLE:
+        setup_recycle(controller, config)
+
+
+def open_batch_state(controller, config, args, input_dir: Path):
+    """두 모드에 공통인 배치 처리 상태 열기 (작업 저널, 처리 기록, 탐색 캐시)"""
+    open_journal(controller, config, input_dir, args.resume)
+    if args.manifest or config.PROCESSED_MANIFEST:
+        open_processed_manifest(controller, config)
+    if args.scan_cache or config.SCAN_CACHE:
+        open_scan_cache(controller, config)
+
+
+def run_calibration(controller, config, args) -> int:
+    """
+    --calibrate: 샘플 이미지로 UI 전환 시간을 측정해 장비별 프로파일 저장
+    
+    측정 중 사이사이 대기는 'safe' 프로파일을 사용한다.
+    """
+    input_dir = Path(args.input_dir) if args.input_dir else config.INPUT_DIR
+    samples = config.get_image_files(input_dir)[:args.calibrate_samples]
+    
+    if not samples:
+        logger.error(f"보정용 샘플 이미지가 없습니다: {input_dir}")
+        return 1
+    
+    logger.info(f"보정 모드: 샘플 {len(samples)}장, 여유 {config.CALIBRATION_MARGIN:.0%}")
+    
+    controller.apply_delay_profile(DelayProfile.load('safe'))
+    calibrator = LatencyCalibrator(margin=config.CALIBRATION_MARGIN)
+    
+    if not controller.calibrate(samples, calibrator):
+        logger.error("측정에 성공한 샘플이 없습니다. 프로파일을 저장하지 않습니다.")
+        return 1
+    
+    profile = calibrator.build_profile('calibrated', DelayProfile.load('safe'))
+    profile_path = calibrator.save_profile(profile, config.CALIBRATED_PROFILE_PATH)
+    
+    logger.info(f"보정된 프로파일 저장: {profile_path}")
+    logger.info("다음 실행부터 자동으로 사용됩니다 (DELAY_PROFILE로 다른 프로파일 지정 가능)")
+    return 0
 
 
 def main():
@@ -68,6 +422,138 @@ def main():
         type=int,
         help='이미지당 export 대기 시간(초) - 기본값은 10초 (Photo AI 전용)'
     )
+    parser.add_argument(
+        '--delay-profile',
+        type=str,
+        metavar='NAME_OR_PATH',
+        help='입력 대기 시간 프로파일: safe, fast 또는 JSON 파일 경로 [기본값: .env의 DELAY_PROFILE 또는 safe]'
+    )
+    parser.add_argument(
+        '--optimistic',
+        action='store_true',
+        help='낙관적 입력 실행: 최소 대기 후 다이얼로그/타이틀 변화를 확인하고 실패 시 재시도'
+    )
+    parser.add_argument(
+        '--calibrate',
+        action='store_true',
+        help='보정 모드: 샘플 이미지로 열기/저장 UI 전환 시간을 측정해 장비별 대기 시간 프로파일 저장'
+    )
+    parser.add_argument(
+        '--calibrate-samples',
+        type=int,
+        default=3,
+        help='보정에 사용할 샘플 이미지 수 [기본값: 3]'
+    )
+    parser.add_argument(
+        '--pipeline',
+        action='store_true',
+        help='파이프라인 모드: 다음 이미지 준비와 이전 결과 확인을 GUI 처리와 겹쳐 실행 (Gigapixel AI 전용)'
+    )
+    parser.add_argument(
+        '--batch-queue',
+        action='store_true',
+        help='배치 큐 모드: 여러 이미지를 한 번에 열고 한 번에 Export (Gigapixel AI 전용)'
+    )
+    parser.add_argument(
+        '--queue-size',
+        type=int,
+        help='배치 큐 모드의 청크당 이미지 수 - 기본값은 10 (Gigapixel AI 전용)'
+    )
+    parser.add_argument(
+        '--schedule',
+        choices=POLICIES,
+        help='처리 순서 정책: name(이름순), sjf(짧은 작업 먼저), ljf(긴 작업 먼저), dims(크기별 묶음)'
+    )
+    parser.add_argument(
+        '--preflight',
+        action='store_true',
+        help='GUI로 열기 전에 손상/미지원 이미지를 병렬로 검사해 제외'
+    )
+    parser.add_argument(
+        '--normalize',
+        action='store_true',
+        help='대형/CMYK/16비트 이미지를 GUI보다 먼저 8비트 RGB로 변환해 변환 파일을 열기'
+    )
+    parser.add_argument(
+        '--postprocess',
+        action='store_true',
+        help='결과물 검증/체크섬/시각 복사/이동을 GUI 처리와 겹쳐 백그라운드에서 실행'
+    )
+    parser.add_argument(
+        '--postprocess-dest',
+        type=str,
+        help='후처리에서 검증된 결과물을 옮길 최종 폴더'
+    )
+    parser.add_argument(
+        '--retry',
+        action='store_true',
+        help='단계별 재시도 + 연속 실패 시 앱 재시작 후 다시 처리 (무인 장시간 실행용)'
+    )
+    parser.add_argument(
+        '--watchdog',
+        action='store_true',
+        help='앱 프로세스/윈도우 응답을 감시해 멈추면 입력을 중단하고 앱 재시작'
+    )
+    parser.add_argument(
+        '--completion-probe',
+        choices=PROBES,
+        help='Export 완료 감지 방식: time(고정 대기), ocr, template, process(앱 CPU/쓰기 I/O 유휴)'
+    )
+    parser.add_argument(
+        '--recycle',
+        action='store_true',
+        help='이미지당 처리 시간/앱 메모리가 실행 초반보다 나빠지면 이미지 사이에서 앱 재시작'
+    )
+    parser.add_argument(
+        '--manifest',
+        action='store_true',
+        help='처리한 입력/결과물을 (경로, 크기, 수정 시각)으로 기록해 다음 실행에서 파일명과 무관하게 제외'
+    )
+    parser.add_argument(
+        '--recursive',
+        action='store_true',
+        help='입력 폴더의 하위 폴더까지 검색 (감시 모드 제외)'
+    )
+    parser.add_argument(
+        '--scan-cache',
+        action='store_true',
+        help='디렉토리별 수정 시각/목록을 저장해 반복 실행에서 바뀐 폴더만 다시 나열'
+    )
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='입력 폴더를 감시하며 새 이미지를 도착하는 대로 처리 (Ctrl+C로 종료)'
+    )
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='작업 저널에서 검증까지 끝난 이미지를 건너뛰고 이어서 처리 (배치 처리)'
+    )
+    parser.add_argument(
+        '--result-cache',
+        action='store_true',
+        help='내용이 같은 이미지는 이전 결과를 재사용 (Gigapixel AI 배치 처리)'
+    )
+    parser.add_argument(
+        '--dedupe',
+        action='store_true',
+        help='재인코딩/메타데이터만 다른 유사 이미지는 그룹당 한 장만 처리 (배치 처리)'
+    )
+    parser.add_argument(
+        '--dedupe-threshold',
+        type=int,
+        help='유사 이미지로 볼 최대 해밍 거리 (64비트 dHash) - 기본값은 4'
+    )
+    parser.add_argument(
+        '--chunk-megapixels',
+        type=float,
+        help='청크당 총 메가픽셀 예산 - 기본값은 400 (Photo AI 전용)'
+    )
+    parser.add_argument(
+        '--chunk-max-files',
+        type=int,
+        help='청크당 최대 이미지 수 - 기본값은 20 (Photo AI 전용)'
+    )
     
     args = parser.parse_args()
     
@@ -88,9 +574,11 @@ def main():
     logger.info("Topaz 앱이 실행 중이고 원하는 설정이 적용되어 있는지 확인하세요!")
     logger.info("")
     
+    controller = None
     try:
         if args.mode == 'upscale':
             controller = GigapixelController()
+            configure_controller(controller, config, args)
             
             # 대기 시간 설정
             if args.wait_time:
@@ -99,6 +587,9 @@ def main():
             if args.save_wait_time:
                 controller.config.SAVE_PROCESSING_WAIT_TIME = args.save_wait_time
             
+            if args.queue_size:
+                controller.config.BATCH_QUEUE_SIZE = args.queue_size
+            
             logger.info(f"초기 처리 대기 시간: {controller.config.PROCESSING_WAIT_TIME}초")
             logger.info(f"저장 처리 대기 시간: {controller.config.SAVE_PROCESSING_WAIT_TIME}초")
             logger.info("저장 방식: Ctrl+S (Topaz 설정의 output 폴더)")
@@ -107,7 +598,9 @@ def main():
             run_history = RunHistory()
             run_history.set_config({
                 "mode": args.mode,
-                "wait_time": controller.config.PROCESSING_WAIT_TIME
+                "wait_time": controller.config.PROCESSING_WAIT_TIME,
+                "delay_profile": controller.delays.name,
+                "batch_queue_size": controller.config.BATCH_QUEUE_SIZE if args.batch_queue else None
             })
             
             # 앱 윈도우 확인 (자동 실행 안 함)
@@ -120,6 +613,9 @@ def main():
             logger.info("Topaz 앱이 활성화되었습니다.")
             logger.info("")
             
+            if args.calibrate:
+                return run_calibration(controller, config, args)
+            
             # 단일 파일 처리 모드
             if args.single:
                 input_path = Path(args.single)
@@ -150,18 +646,47 @@ def main():
                 logger.info("")
                 
                 run_history.set_input_directory(str(input_dir))
+                open_batch_state(controller, config, args, input_dir)
+                if args.result_cache or config.RESULT_CACHE:
+                    open_result_cache(controller, config)
+                if config.OUTPUT_INDEX:
+                    open_output_index(controller, config)
                 
-                results = controller.process_batch_auto_save(
-                    input_dir,
-                    run_history=run_history
-                )
-                
-                # 실행 기록 저장
-                history_file = run_history.finalize()
+                # 예외나 Ctrl+C로 끝나도 자원 정리와 실행 기록 저장
+                try:
+                    if args.watch:
+                        logger.info(f"감시 모드: {input_dir} (새 이미지를 도착하는 대로 처리)")
+                        results = controller.watch_folder(
+                            input_dir,
+                            run_history=run_history
+                        )
+                    elif args.pipeline:
+                        logger.info("파이프라인 모드: GUI 처리와 검사/정규화/감지/검증을 겹쳐 실행")
+                        results = controller.process_batch_pipeline(
+                            input_dir,
+                            run_history=run_history
+                        )
+                    elif args.batch_queue:
+                        logger.info(f"배치 큐 모드: 청크당 {controller.config.BATCH_QUEUE_SIZE}장")
+                        results = controller.process_batch_queue(
+                            input_dir,
+                            run_history=run_history
+                        )
+                    else:
+                        results = controller.process_batch_auto_save(
+                            input_dir,
+                            run_history=run_history
+                        )
+                finally:
+                    controller.close()
+                    report_run_stats(controller, run_history)
+                    history_file = run_history.finalize()
                 
                 logger.info("")
                 logger.info("=" * 60)
                 logger.info(f"성공: {results['success']}/{results['total']}")
+                if results.get('skipped'):
+                    logger.info(f"건너뜀: {results['skipped']}")
                 if results['failed'] > 0:
                     logger.warning(f"실패: {results['failed']}")
                 logger.info(f"실행 기록: {history_file}")
@@ -171,6 +696,7 @@ def main():
         
         elif args.mode == 'photoai':
             controller = PhotoAIController()
+            configure_controller(controller, config, args)
             
             # 대기 시간 설정
             if args.filter_wait_time:
@@ -179,6 +705,12 @@ def main():
             if args.export_wait_time:
                 controller.config.EXPORT_PER_IMAGE_WAIT_TIME = args.export_wait_time
             
+            if args.chunk_megapixels:
+                controller.config.CHUNK_MEGAPIXEL_BUDGET = args.chunk_megapixels
+            
+            if args.chunk_max_files:
+                controller.config.CHUNK_MAX_FILES = args.chunk_max_files
+            
             logger.info(f"필터 적용 대기 시간: {controller.config.FILTER_APPLY_WAIT_TIME}초")
             logger.info(f"이미지당 Export 대기 시간: {controller.config.EXPORT_PER_IMAGE_WAIT_TIME}초")
             logger.info("처리 방식: Autopilot (각 이미지 순차 처리)")
@@ -188,7 +720,10 @@ def main():
             run_history.set_config({
                 "mode": args.mode,
                 "filter_wait_time": controller.config.FILTER_APPLY_WAIT_TIME,
-                "export_wait_time": controller.config.EXPORT_PER_IMAGE_WAIT_TIME
+                "export_wait_time": controller.config.EXPORT_PER_IMAGE_WAIT_TIME,
+                "delay_profile": controller.delays.name,
+                "chunk_megapixels": controller.config.CHUNK_MEGAPIXEL_BUDGET,
+                "chunk_max_files": controller.config.CHUNK_MAX_FILES
             })
             
             # 앱 윈도우 확인
@@ -201,6 +736,9 @@ def main():
             logger.info("Topaz Photo AI 앱이 활성화되었습니다.")
             logger.info("")
             
+            if args.calibrate:
+                return run_calibration(controller, config, args)
+            
             # 배치 처리만 지원 (다중 이미지 처리)
             input_dir = Path(args.input_dir) if args.input_dir else config.INPUT_DIR
             
@@ -212,18 +750,31 @@ def main():
             logger.info("")
             
             run_history.set_input_directory(str(input_dir))
+            open_batch_state(controller, config, args, input_dir)
             
-            results = controller.process_batch(
-                input_dir,
-                run_history=run_history
-            )
-            
-            # 실행 기록 저장
-            history_file = run_history.finalize()
+            # 예외나 Ctrl+C로 끝나도 자원 정리와 실행 기록 저장
+            try:
+                if args.watch:
+                    logger.info(f"감시 모드: {input_dir} (새 이미지를 도착하는 대로 처리)")
+                    results = controller.watch_folder(
+                        input_dir,
+                        run_history=run_history
+                    )
+                else:
+                    results = controller.process_batch(
+                        input_dir,
+                        run_history=run_history
+                    )
+            finally:
+                controller.close()
+                report_run_stats(controller, run_history)
+                history_file = run_history.finalize()
             
             logger.info("")
             logger.info("=" * 60)
             logger.info(f"성공: {results['success']}/{results['total']}")
+            if results.get('skipped'):
+                logger.info(f"건너뜀: {results['skipped']}")
             if results['failed'] > 0:
                 logger.warning(f"실패: {results['failed']}")
             logger.info(f"실행 기록: {history_file}")
@@ -242,6 +793,11 @@ def main():
     except Exception as e:
         logger.exception(f"Unexpected error: {e}")
         return 1
+    
+    finally:
+        # 배치 처리 전에 끝난 경우(앱 없음, 보정, 단일 파일)에도 감시 스레드/정규화 풀 정리
+        if controller is not None:
+            controller.close()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,120 @@
+"""이미지 탐색 벤치마크 - 확장자별 glob vs os.scandir 한 번 vs 탐색 캐시
+
+합성 디렉토리(기본 10만 개 파일)를 만들고 같은 조건으로 세 방식을 비교한다.
+탐색 캐시(warm)는 다음 실행처럼 캐시 파일을 새로 읽어 탐색하는 시간이다.
+
+사용법:
+    python tools/benchmark_discovery.py                     # 임시 폴더에 10만 개 생성 후 측정
+    python tools/benchmark_discovery.py --files 50000 --dir D:\\bench   # 네트워크 공유 등 지정 위치
+"""
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from utils.image_scan import extension_set, iter_image_files, list_image_files, exclude_suffix_entries
+from utils.scan_cache import ScanCache
+
+EXTENSIONS = ['.jpg', '.jpeg', '.png', '.tiff', '.tif', '.bmp', '.webp']
+SUFFIXES = ['_upscaled', '-gigapixel', '_2x', '_4x', '_6x', '-enhanced']
+
+
+def legacy_get_image_files(directory: Path, exclude_suffixes: list) -> list:
+    """이전 구현: 확장자마다 소문자/대문자 glob (디렉토리를 14번 나열)"""
+    found = set()
+    for ext in EXTENSIONS:
+        found.update(directory.glob(f'*{ext}'))
+        found.update(directory.glob(f'*{ext.upper()}'))
+    return sorted(
+        path for path in found
+        if not any(suffix.lower() in path.stem.lower() for suffix in exclude_suffixes)
+    )
+
+
+def create_files(directory: Path, count: int):
+    """
+    합성 파일 생성 (빈 파일)
+    
+    이미지 확장자(대소문자 섞음) 70%, 처리된 결과물 10%, 이미지가 아닌 파일 20%
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    for i in range(count):
+        kind = i % 10
+        if kind < 7:
+            ext = EXTENSIONS[i % len(EXTENSIONS)]
+            name = f"img_{i:06d}{ext.upper() if i % 3 == 0 else ext}"
+        elif kind == 7:
+            name = f"img_{i:06d}-gigapixel-standard-2x.jpg"
+        else:
+            name = f"note_{i:06d}.{'xmp' if kind == 8 else 'txt'}"
+        (directory / name).touch()
+
+
+def measure(label: str, func, repeat: int) -> list:
+    """func를 repeat번 실행해 가장 빠른 시간 출력, 결과 반환"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"  {label:<28} {best * 1000:10.1f} ms  ({len(result)} files)")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='이미지 탐색 벤치마크 (glob vs scandir)')
+    parser.add_argument('--files', type=int, default=100_000, help='생성할 파일 수 (기본 100000)')
+    parser.add_argument('--dir', type=str, help='합성 파일을 만들 폴더 (기본: 임시 폴더, 끝나면 삭제)')
+    parser.add_argument('--repeat', type=int, default=3, help='방식별 반복 횟수 (가장 빠른 값 사용)')
+    args = parser.parse_args()
+    
+    temporary = args.dir is None
+    directory = Path(args.dir or tempfile.mkdtemp(prefix='discovery_bench_'))
+    extensions = extension_set(EXTENSIONS)
+    
+    try:
+        print("=" * 60)
+        print(f"합성 파일 {args.files}개 생성: {directory}")
+        start = time.perf_counter()
+        create_files(directory, args.files)
+        print(f"  생성 {time.perf_counter() - start:.1f}s")
+        print("=" * 60)
+        
+        legacy = measure("glob x14 (legacy)", lambda: legacy_get_image_files(directory, SUFFIXES), args.repeat)
+        current = measure("scandir x1 (sorted)", lambda: list_image_files(directory, extensions, SUFFIXES), args.repeat)
+        measure("scandir x1 (generator)", lambda: list(iter_image_files(directory, extensions, SUFFIXES)), args.repeat)
+        
+        start = time.perf_counter()
+        next(iter_image_files(directory, extensions, SUFFIXES), None)
+        print(f"  {'first file (generator)':<28} {(time.perf_counter() - start) * 1000:10.1f} ms")
+        
+        with tempfile.TemporaryDirectory(prefix='scan_cache_') as cache_dir:
+            cache_path = Path(cache_dir) / 'scan_cache.bin'
+            
+            def cached_scan():
+                cache = ScanCache(cache_path, extensions)
+                return list(exclude_suffix_entries(cache.scan(directory), SUFFIXES))
+            
+            measure("scan cache (cold)", cached_scan, 1)
+            measure("scan cache (warm)", cached_scan, args.repeat)
+            print(f"  {'scan cache file':<28} {cache_path.stat().st_size / 1024:10.1f} KB")
+        
+        # glob은 플랫폼에 따라 대소문자 구분이 다르므로 scandir 결과가 같거나 더 많아야 함
+        missing = set(legacy) - set(current)
+        print("=" * 60)
+        print(f"결과 일치: {'예' if not missing else f'아니오 (scandir에 없는 파일 {len(missing)}개)'}")
+    finally:
+        if temporary:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Topaz 앱 프로세스 샘플링
+
+앱 프로세스의 생존 여부, 누적 CPU 시간, 메모리(RSS), 누적 쓰기 바이트와
+윈도우 응답 여부를 저렴하게 읽는다. 화면 캡처 없이 앱 상태를 판단하는
+감시/완료 감지 기능이 공유한다.
+
+플랫폼 API는 ProcessBackend 인터페이스 뒤에 숨겨져 있으므로
+Linux에서도 가짜 백엔드로 감시 로직을 검증할 수 있다.
+"""
+import time
+from typing import List, Optional
+from loguru import logger
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+try:
+    import win32con
+    import win32gui
+    WIN32_AVAILABLE = True
+except ImportError:
+    WIN32_AVAILABLE = False
+
+from .window_cache import WindowHandleCache, Win32WindowBackend
+
+
+class ProcessBackend:
+    """플랫폼 독립적인 앱 프로세스 조회 인터페이스"""
+    
+    def sample(self) -> Optional[dict]:
+        """
+        앱 프로세스 상태
+        
+        Returns:
+            {'pid', 'cpu_time', 'rss', 'write_bytes'} (실행 중이 아니면 None)
+            cpu_time은 누적 CPU 시간(초), write_bytes는 누적 쓰기 바이트(알 수 없으면 None)
+        """
+        raise NotImplementedError
+    
+    def is_responsive(self, timeout: float) -> Optional[bool]:
+        """
+        앱 윈도우가 timeout 안에 메시지에 응답하는지 확인
+        
+        Returns:
+            응답하면 True, 멈췄으면 False, 확인할 수 없으면 None
+        """
+        raise NotImplementedError
+
+
+class PsutilProcessBackend(ProcessBackend):
+    """psutil + pywin32 기반 앱 프로세스 백엔드"""
+    
+    def __init__(self, process_name: str, window_title_pattern: str = None, rescan_interval: float = 30.0):
+        """
+        Args:
+            process_name: 프로세스 이름 (config.PROCESS_NAME, 대소문자 무시 부분 일치)
+            window_title_pattern: 응답 확인할 윈도우 제목 패턴 (None이면 확인 안 함)
+            rescan_interval: 프로세스 목록을 다시 찾는 주기 (초, 보조 프로세스 추가 반영)
+        """
+        self.process_name = process_name.lower()
+        self.window_title_pattern = window_title_pattern
+        self.rescan_interval = rescan_interval
+        
+        self._procs: List = []
+        self._scanned_at = 0.0
+        
+        # 감시 스레드 전용 핸들 캐시 (WindowManager 공용 캐시와 분리)
+        self._handle_cache = WindowHandleCache(Win32WindowBackend()) if WIN32_AVAILABLE else None
+    
+    def _find_processes(self) -> List:
+        """이름이 일치하는 프로세스 목록 (죽은 프로세스가 있거나 주기가 지나면 다시 찾음)"""
+        now = time.monotonic()
+        stale = now - self._scanned_at > self.rescan_interval
+        if stale or not self._procs or not all(proc.is_running() for proc in self._procs):
+            self._procs = [
+                proc for proc in psutil.process_iter(['name'])
+                if proc.info['name'] and self.process_name in proc.info['name'].lower()
+            ]
+            self._scanned_at = now
+        return self._procs
+    
+    def sample(self) -> Optional[dict]:
+        if not PSUTIL_AVAILABLE:
+            return None
+        
+        result = {'pid': None, 'cpu_time': 0.0, 'rss': 0, 'write_bytes': None}
+        for proc in self._find_processes():
+            try:
+                with proc.oneshot():
+                    cpu = proc.cpu_times()
+                    result['cpu_time'] += cpu.user + cpu.system
+                    result['rss'] += proc.memory_info().rss
+                    try:
+                        result['write_bytes'] = (result['write_bytes'] or 0) + proc.io_counters().write_bytes
+                    except (AttributeError, psutil.AccessDenied):
+                        pass
+                if result['pid'] is None:
+                    result['pid'] = proc.pid
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        
+        return result if result['pid'] is not None else None
+    
+    def is_responsive(self, timeout: float) -> Optional[bool]:
+        if self._handle_cache is None or not self.window_title_pattern:
+            return None
+        
+        hwnd = self._handle_cache.find(self.window_title_pattern)
+        if not hwnd:
+            return None
+        
+        # WM_NULL은 아무 동작도 하지 않으므로 메시지 루프가 돌고 있는지만 확인된다
+        try:
+            win32gui.SendMessageTimeout(
+                hwnd, win32con.WM_NULL, 0, 0,
+                win32con.SMTO_ABORTIFHUNG, max(1, int(timeout * 1000))
+            )
+            return True
+        except Exception as e:
+            logger.debug(f"Window {hwnd} did not respond: {e}")
+            return False
@@ -0,0 +1,126 @@
+"""UI 지연 시간 보정(calibration) 유틸리티
+
+실제 앱을 열기/저장 과정으로 구동하면서 다이얼로그 표시, 타이틀 변화 등
+관찰 가능한 UI 전환에 걸린 시간을 측정하고, 안전 여유(margin)를 더해
+장비별 대기 시간 프로파일을 만든다.
+"""
+import math
+import statistics
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+from loguru import logger
+
+from .delay_profile import DelayProfile, SAFE_DELAYS
+from .optimistic import wait_until
+
+# 보정된 대기 시간의 하한 (초)
+MIN_DELAY = 0.05
+
+
+class LatencyCalibrator:
+    """UI 전환 지연 시간 측정 및 프로파일 생성"""
+    
+    def __init__(self, margin: float = 0.3, poll_interval: float = 0.05):
+        """
+        Args:
+            margin: 측정 최대값에 더할 안전 여유 비율 (0.3 = 30%)
+            poll_interval: 전환 확인 폴링 간격 (초)
+        """
+        self.margin = margin
+        self.poll_interval = poll_interval
+        self.samples: Dict[str, List[float]] = {}
+        self.timeouts: Dict[str, int] = {}
+    
+    def measure(
+        self,
+        action: str,
+        trigger: Callable[[], None],
+        predicate: Callable[[], bool],
+        timeout: float
+    ) -> Optional[float]:
+        """
+        trigger 실행 후 predicate가 참이 될 때까지의 시간 측정
+        
+        Args:
+            action: 동작 이름 (DelayProfile 키 또는 참고용 측정 이름)
+            trigger: 입력 동작
+            predicate: 전환 완료 조건
+            timeout: 최대 대기 시간 (초)
+        
+        Returns:
+            측정값 (초), 타임아웃 시 None
+        """
+        start = time.perf_counter()
+        trigger()
+        if not wait_until(predicate, timeout, self.poll_interval):
+            self.timeouts[action] = self.timeouts.get(action, 0) + 1
+            logger.warning(f"  [calibrate] {action}: no transition within {timeout}s")
+            return None
+        
+        elapsed = time.perf_counter() - start
+        self.samples.setdefault(action, []).append(elapsed)
+        logger.info(f"  [calibrate] {action}: {elapsed:.3f}s")
+        return elapsed
+    
+    def summary(self) -> dict:
+        """동작별 측정 요약 (samples, median, max, timeouts)"""
+        result = {}
+        for action in sorted(set(self.samples) | set(self.timeouts)):
+            values = self.samples.get(action, [])
+            result[action] = {
+                'samples': [round(v, 3) for v in values],
+                'median': round(statistics.median(values), 3) if values else None,
+                'max': round(max(values), 3) if values else None,
+                'timeouts': self.timeouts.get(action, 0),
+            }
+        return result
+    
+    def tuned_delay(self, action: str) -> Optional[float]:
+        """
+        측정 최대값 × (1 + margin)을 0.05초 단위로 올림
+        
+        타임아웃이 한 번이라도 있었던 동작은 신뢰할 수 없으므로 None을 반환한다.
+        """
+        values = self.samples.get(action)
+        if not values or self.timeouts.get(action):
+            return None
+        delay = max(values) * (1 + self.margin)
+        return max(MIN_DELAY, math.ceil(delay * 20) / 20)
+    
+    def build_profile(self, name: str, base: DelayProfile) -> DelayProfile:
+        """
+        측정값으로 base 프로파일을 덮어쓴 새 프로파일 생성
+        
+        Args:
+            name: 새 프로파일 이름
+            base: 측정하지 못한 동작에 사용할 프로파일
+        
+        Returns:
+            보정된 DelayProfile
+        """
+        delays = {action: base.get(action) for action in SAFE_DELAYS}
+        for action in SAFE_DELAYS:
+            tuned = self.tuned_delay(action)
+            if tuned is not None:
+                logger.info(f"  {action}: {delays[action]:.2f}s -> {tuned:.2f}s")
+                delays[action] = tuned
+        return DelayProfile(name, delays)
+    
+    def save_profile(self, profile: DelayProfile, path, base_name: str = 'safe'):
+        """
+        보정된 프로파일과 측정값을 JSON으로 저장
+        
+        Args:
+            profile: build_profile 결과
+            path: 저장 경로
+            base_name: 측정하지 못한 동작의 기준 내장 프로파일 이름
+        
+        Returns:
+            저장된 파일 경로
+        """
+        return profile.save(path, base=base_name, extra={
+            'calibrated_at': datetime.now().isoformat(),
+            'margin': self.margin,
+            'measurements': self.summary(),
+        })
@@ -0,0 +1,258 @@
+"""처리(Export) 완료 감지 방식
+
+모든 감지 방식은 같은 인터페이스(CompletionProbe.wait → start/poll/finish)를 따르므로
+컨트롤러는 설정(COMPLETION_PROBE)에 따라 방식을 바꿔 끼울 수 있다.
+
+    time      고정 시간 대기 (기존 동작, 감지 객체 없음)
+    ocr       화면 영역을 캡처해 OCR로 완료 텍스트(예: "Done") 확인 - 캡처 + OCR, 가장 느림
+    template  화면 영역을 캡처해 완료 아이콘 템플릿 매칭 - 캡처 필요
+    process   앱 프로세스의 CPU 사용률과 쓰기 I/O가 멈추면 완료 - 캡처 없이 psutil 값만 읽음
+
+process 방식은 유휴 CPU 기준과 유지 시간(dwell)을 처리할 때마다 학습한다.
+    - 기준: 완료 직전 유휴 구간 CPU 사용률의 이동 평균 + max(초기 기준, 처리 중 최고 사용률과의 차이의 10%)
+    - 유지 시간: 처리 도중 잠깐 유휴였다가 다시 바빠진 구간(가짜 완료)의 최대 길이 × 1.5
+"""
+import time
+from typing import Callable, Optional, Tuple
+from loguru import logger
+
+from .app_process import ProcessBackend
+
+# 선택 가능한 감지 방식
+PROBES = ('time', 'ocr', 'template', 'process')
+
+
+class CompletionProbe:
+    """완료 감지 공통 인터페이스"""
+    
+    name = 'base'
+    
+    def __init__(self):
+        self.waits = 0
+        self.timeouts = 0
+        self.polls = 0
+        self.poll_seconds = 0.0
+        self.wait_seconds = 0.0
+        self._started_at = 0.0
+    
+    @property
+    def elapsed(self) -> float:
+        """start() 이후 경과 시간 (초)"""
+        return time.monotonic() - self._started_at
+    
+    def start(self):
+        """작업(Export) 시작 직후 호출 - 감지 상태 초기화"""
+        self._started_at = time.monotonic()
+    
+    def poll(self) -> bool:
+        """한 번 확인해 완료됐으면 True"""
+        raise NotImplementedError
+    
+    def finish(self, completed: bool):
+        """대기가 끝난 뒤 호출 (학습하는 방식에서 사용)"""
+    
+    def wait(self, timeout: float, interval: float = 0.5, sleep: Callable[[float], None] = time.sleep) -> bool:
+        """
+        완료될 때까지 대기
+        
+        Args:
+            timeout: 최대 대기 시간 (초)
+            interval: 확인 간격 (초)
+            sleep: 대기 함수 (컨트롤러의 멈춤 감시 대기 등)
+        
+        Returns:
+            timeout 안에 완료가 감지되면 True
+        """
+        self.start()
+        self.waits += 1
+        completed = False
+        
+        try:
+            while True:
+                poll_start = time.perf_counter()
+                done = self.poll()
+                self.polls += 1
+                self.poll_seconds += time.perf_counter() - poll_start
+                
+                if done:
+                    completed = True
+                    break
+                if self.elapsed >= timeout:
+                    break
+                sleep(interval)
+        finally:
+            self.wait_seconds += self.elapsed
+            if not completed:
+                self.timeouts += 1
+            self.finish(completed)
+        
+        if completed:
+            logger.info(f"  [{self.name}] completion detected after {self.elapsed:.1f}s")
+        else:
+            logger.warning(f"  [{self.name}] completion not detected within {timeout:.0f}s")
+        return completed
+    
+    def get_stats(self) -> dict:
+        """대기 횟수, 시간 초과 횟수, 확인당 평균 비용, 평균 대기 시간"""
+        return {
+            'probe': self.name,
+            'waits': self.waits,
+            'timeouts': self.timeouts,
+            'polls': self.polls,
+            'avg_poll_ms': round(self.poll_seconds / self.polls * 1000, 2) if self.polls else 0.0,
+            'avg_wait_seconds': round(self.wait_seconds / self.waits, 1) if self.waits else 0.0,
+        }
+
+
+class OCRProbe(CompletionProbe):
+    """화면 영역 OCR로 완료 텍스트 감지"""
+    
+    name = 'ocr'
+    
+    def __init__(self, region: Callable[[], Tuple[int, int, int, int]], done_text: str):
+        """
+        Args:
+            region: 확인할 화면 영역 (x, y, width, height)을 반환하는 함수
+            done_text: 완료 시 나타나는 텍스트
+        """
+        super().__init__()
+        self.region = region
+        self.done_text = done_text
+    
+    def poll(self) -> bool:
+        # EasyOCR/NumPy는 무거우므로 이 방식을 쓸 때만 import
+        from .ocr_monitor import detect_text_in_region
+        return detect_text_in_region(*self.region(), target_text=self.done_text)
+
+
+class TemplateProbe(CompletionProbe):
+    """완료 아이콘 템플릿 매칭"""
+    
+    name = 'template'
+    
+    def __init__(self, find: Callable[[str], object], template_name: str):
+        """
+        Args:
+            find: 템플릿 이름을 받아 찾으면 참인 값을 반환하는 함수 (UIDetector.find_button 등)
+            template_name: 완료 아이콘 템플릿 이름
+        """
+        super().__init__()
+        self.find = find
+        self.template_name = template_name
+    
+    def poll(self) -> bool:
+        return bool(self.find(self.template_name))
+
+
+class ProcessIdleProbe(CompletionProbe):
+    """앱 프로세스의 CPU 사용률/쓰기 I/O가 멈추면 완료"""
+    
+    name = 'process'
+    
+    def __init__(
+        self,
+        backend: ProcessBackend,
+        idle_cpu_percent: float = 5.0,
+        min_dwell: float = 1.5,
+        max_dwell: float = 10.0,
+        start_grace: float = 5.0,
+        learning_rate: float = 0.3
+    ):
+        """
+        Args:
+            backend: 프로세스 조회 백엔드
+            idle_cpu_percent: 학습 전 유휴로 볼 CPU 사용률 상한 (%, 코어 하나 = 100)
+            min_dwell: 완료로 판단하기 전 유휴 상태가 유지되어야 할 최소 시간 (초)
+            max_dwell: 학습된 유지 시간의 상한 (초)
+            start_grace: 처리가 시작(바빠짐)되지 않았을 때 완료로 판단하기까지 기다릴 시간 (초)
+            learning_rate: 유휴/최고 사용률 이동 평균 가중치
+        """
+        super().__init__()
+        self.backend = backend
+        self.idle_cpu_percent = idle_cpu_percent
+        self.threshold = idle_cpu_percent
+        self.min_dwell = min_dwell
+        self.max_dwell = max(min_dwell, max_dwell)
+        self.dwell = min_dwell
+        self.start_grace = start_grace
+        self.learning_rate = learning_rate
+        
+        # 학습 값
+        self.idle_level: Optional[float] = None
+        self.busy_level: Optional[float] = None
+        self.longest_lull = 0.0
+        
+        self._reset()
+    
+    def _reset(self):
+        self._prev = None
+        self._prev_time = 0.0
+        self._seen_busy = False
+        self._idle_since: Optional[float] = None
+        self._idle_samples = []
+        self._peak = 0.0
+    
+    def start(self):
+        super().start()
+        self._reset()
+        self._prev = self.backend.sample()
+        self._prev_time = time.monotonic()
+    
+    def poll(self) -> bool:
+        sample = self.backend.sample()
+        now = time.monotonic()
+        prev, prev_time = self._prev, self._prev_time
+        self._prev, self._prev_time = sample, now
+        
+        if sample is None or prev is None or now <= prev_time:
+            return False
+        
+        # psutil cpu_percent와 같은 계산: 구간 CPU 시간 / 경과 시간
+        cpu_percent = (sample['cpu_time'] - prev['cpu_time']) / (now - prev_time) * 100
+        writing = (
+            sample['write_bytes'] is not None and prev['write_bytes'] is not None
+            and sample['write_bytes'] > prev['write_bytes']
+        )
+        
+        if writing or cpu_percent >= self.threshold:
+            # 유휴였다가 다시 바빠짐 → 가짜 완료 구간 길이 기록
+            if self._seen_busy and self._idle_since is not None:
+                self.longest_lull = max(self.longest_lull, now - self._idle_since)
+            self._seen_busy = True
+            self._idle_since = None
+            self._idle_samples = []
+            self._peak = max(self._peak, cpu_percent)
+            return False
+        
+        if self._idle_since is None:
+            self._idle_since = now
+        self._idle_samples.append(cpu_percent)
+        
+        # 처리가 시작되는 것을 보기 전에는 start_grace 동안 완료로 보지 않음
+        if not self._seen_busy and self.elapsed < self.start_grace:
+            return False
+        return now - self._idle_since >= self.dwell
+    
+    def finish(self, completed: bool):
+        """완료된 처리의 유휴/최고 사용률과 가짜 완료 구간으로 기준값 학습"""
+        if not completed or not self._seen_busy or not self._idle_samples:
+            return
+        
+        idle = sum(self._idle_samples) / len(self._idle_samples)
+        rate = self.learning_rate
+        self.idle_level = idle if self.idle_level is None else (1 - rate) * self.idle_level + rate * idle
+        self.busy_level = self._peak if self.busy_level is None else (1 - rate) * self.busy_level + rate * self._peak
+        
+        margin = max(self.idle_cpu_percent, 0.1 * (self.busy_level - self.idle_level))
+        self.threshold = self.idle_level + margin
+        self.dwell = min(self.max_dwell, max(self.min_dwell, self.longest_lull * 1.5))
+        logger.debug(f"  [process] learned idle threshold {self.threshold:.1f}% CPU, dwell {self.dwell:.1f}s")
+    
+    def get_stats(self) -> dict:
+        stats = super().get_stats()
+        stats.update({
+            'idle_threshold_percent': round(self.threshold, 1),
+            'dwell_seconds': round(self.dwell, 1),
+            'longest_lull_seconds': round(self.longest_lull, 1),
+        })
+        return stats
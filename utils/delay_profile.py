@@ -0,0 +1,193 @@
+"""입력 동작별 대기 시간 프로파일
+
+pyautogui.PAUSE 하나로 모든 입력 뒤에 같은 시간을 쉬는 대신
+동작(action)마다 최소 안정화 시간을 따로 지정한다.
+
+프로파일 지정 방법 (BaseConfig.DELAY_PROFILE / --delay-profile):
+    - 내장 프로파일 이름: 'safe' (기존 하드코딩 값), 'fast'
+    - JSON 파일 경로: 장비별로 측정/조정한 프로파일
+      {"name": "...", "base": "fast", "delays": {"open_dialog": 0.9, ...}}
+      delays에 없는 동작은 base 프로파일(기본 'safe') 값을 사용한다.
+"""
+import json
+import time
+from pathlib import Path
+from typing import Dict, Union
+from loguru import logger
+
+
+# 'safe': 기존 코드에 하드코딩되어 있던 값 그대로
+SAFE_DELAYS = {
+    # 공통 입력
+    'input_pause': 0.5,          # pyautogui.PAUSE (모든 pyautogui 호출 후)
+    'window_activate': 0.5,      # SetForegroundWindow 후
+    'activate_settle': 0.5,      # 앱 활성화 후 다음 입력 전
+    'shortcut': 0.5,             # 일반 단축키 입력 후
+    'field_select': 0.3,         # 입력 필드 Ctrl+A 후
+    'field_clear': 0.2,          # 입력 필드 Delete 후
+    'clipboard_copy': 0.1,       # 클립보드 복사 후
+    'clipboard_paste': 0.2,      # Ctrl+V 후
+    'path_settle': 1.0,          # 경로 붙여넣기 후 Enter 전
+    
+    # 이미지 열기 / 화면 맞춤
+    'open_dialog': 2.0,          # Ctrl+O 후 파일 다이얼로그 표시
+    'load_fallback': 1.0,        # 로드 확인 타임아웃 후 추가 대기
+    'image_settle': 1.5,         # 로드 후 Zoom 전
+    'zoom_activate': 0.3,        # Zoom 전 활성화 후
+    'zoom': 0.5,                 # Ctrl+0 후
+    'zoom_settle': 1.0,          # Zoom 적용 대기
+    
+    # 저장 (Gigapixel)
+    'save_dialog': 2.5,          # Ctrl+S 후 저장 다이얼로그 표시
+    'export_dialog': 2.0,        # Enter 후 Export Settings 표시
+    'dialog_close': 1.0,         # Esc 전후
+    
+    # 다중 열기 (Photo AI)
+    'multi_open_dialog': 3.5,    # Ctrl+O 후 파일 다이얼로그 표시
+    'dir_path_settle': 0.8,      # 디렉토리 경로 붙여넣기 후
+    'dir_load': 2.5,             # 디렉토리 이동 후 목록 로드
+    'file_list_focus': 0.5,      # Shift+Tab으로 파일 목록 포커스 후
+    'select_all_files': 1.0,     # 파일 목록 Ctrl+A 후
+    'multi_load_base': 3.0,      # 다중 열기 후 기본 로드 대기
+    'multi_load_per_image': 0.5, # 다중 열기 후 이미지당 추가 대기
+}
+
+# 'fast': 대기 시간을 크게 줄인 값 (장비에서 배치 몇 장으로 확인 후 사용)
+FAST_DELAYS = {
+    'input_pause': 0.05,
+    'window_activate': 0.15,
+    'activate_settle': 0.1,
+    'shortcut': 0.2,
+    'field_select': 0.1,
+    'field_clear': 0.05,
+    'clipboard_copy': 0.05,
+    'clipboard_paste': 0.1,
+    'path_settle': 0.3,
+    
+    'open_dialog': 0.8,
+    'load_fallback': 0.5,
+    'image_settle': 0.5,
+    'zoom_activate': 0.1,
+    'zoom': 0.2,
+    'zoom_settle': 0.3,
+    
+    'save_dialog': 1.0,
+    'export_dialog': 1.0,
+    'dialog_close': 0.4,
+    
+    'multi_open_dialog': 1.2,
+    'dir_path_settle': 0.3,
+    'dir_load': 1.2,
+    'file_list_focus': 0.2,
+    'select_all_files': 0.4,
+    'multi_load_base': 2.0,
+    'multi_load_per_image': 0.3,
+}
+
+BUILTIN_PROFILES = {
+    'safe': SAFE_DELAYS,
+    'fast': FAST_DELAYS,
+}
+
+
+class DelayProfile:
+    """동작 이름 -> 최소 대기 시간(초) 매핑"""
+    
+    def __init__(self, name: str, delays: Dict[str, float]):
+        """
+        Args:
+            name: 프로파일 이름
+            delays: 동작별 대기 시간 (초)
+        """
+        self.name = name
+        self.delays = dict(delays)
+    
+    def get(self, action: str) -> float:
+        """
+        동작의 대기 시간 반환
+        
+        Args:
+            action: 동작 이름 (SAFE_DELAYS의 키)
+        
+        Returns:
+            대기 시간 (초). 알 수 없는 동작이면 'safe' 값
+        """
+        if action in self.delays:
+            return self.delays[action]
+        if action in SAFE_DELAYS:
+            return SAFE_DELAYS[action]
+        raise KeyError(f"Unknown delay action: {action}")
+    
+    def sleep(self, action: str, scale: float = 1.0):
+        """
+        동작의 대기 시간만큼 대기
+        
+        Args:
+            action: 동작 이름
+            scale: 배율 (재시도 시 늘릴 때 사용)
+        """
+        time.sleep(self.get(action) * scale)
+    
+    @classmethod
+    def load(cls, spec: Union[str, Path]) -> 'DelayProfile':
+        """
+        이름 또는 JSON 경로로 프로파일 로드
+        
+        Args:
+            spec: 내장 프로파일 이름 ('safe', 'fast') 또는 JSON 파일 경로
+        
+        Returns:
+            DelayProfile (로드 실패 시 'safe')
+        """
+        spec = str(spec)
+        if spec in BUILTIN_PROFILES:
+            return cls(spec, BUILTIN_PROFILES[spec])
+        
+        path = Path(spec)
+        if not path.exists():
+            logger.warning(f"Delay profile not found: {spec} (using 'safe')")
+            return cls('safe', SAFE_DELAYS)
+        
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            
+            base = BUILTIN_PROFILES.get(data.get('base', 'safe'), SAFE_DELAYS)
+            delays = dict(base)
+            for action, value in data.get('delays', {}).items():
+                if action not in SAFE_DELAYS:
+                    logger.warning(f"Unknown delay action in {path.name}: {action}")
+                    continue
+                delays[action] = float(value)
+            
+            profile = cls(data.get('name', path.stem), delays)
+            logger.info(f"Delay profile loaded: {profile.name} ({path})")
+            return profile
+        
+        except Exception as e:
+            logger.error(f"Failed to load delay profile {path}: {e} (using 'safe')")
+            return cls('safe', SAFE_DELAYS)
+    
+    def save(self, path: Path, base: str = 'safe', extra: dict = None) -> Path:
+        """
+        JSON 파일로 저장
+        
+        Args:
+            path: 저장 경로
+            base: 누락 동작에 사용할 내장 프로파일 이름
+            extra: 함께 기록할 부가 정보 (측정값 등)
+        
+        Returns:
+            저장된 파일 경로
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        data = {'name': self.name, 'base': base, 'delays': self.delays}
+        if extra:
+            data.update(extra)
+        
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        
+        return path
@@ -1,4 +1,5 @@
 """File handling utilities"""
+import os
 import time
 from pathlib import Path
 from loguru import logger
@@ -85,3 +86,23 @@ class FileHandler:
                 return output_path
             counter += 1
 
+    @staticmethod
+    def snapshot_directory(directory: Path) -> dict:
+        """
+        디렉토리의 현재 파일 목록 (새로 생긴 출력 파일 판별용)
+        
+        Args:
+            directory: 대상 디렉토리
+        
+        Returns:
+            {파일명: 크기} 딕셔너리 (디렉토리가 없으면 빈 딕셔너리)
+        """
+        snapshot = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        snapshot[entry.name] = entry.stat().st_size
+        except OSError as e:
+            logger.debug(f"Cannot list {directory}: {e}")
+        return snapshot
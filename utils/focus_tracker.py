@@ -0,0 +1,107 @@
+"""포커스 상태 추적 유틸리티
+
+앱이 이미 포그라운드에 있으면 윈도우 활성화(및 그에 딸린 대기)를 건너뛰고,
+건너뛴 횟수와 절약된 시간을 실행 단위로 집계한다.
+"""
+import time
+from typing import Callable, Dict
+from loguru import logger
+
+from .window_cache import WindowBackend
+
+
+class FocusTracker:
+    """포그라운드 윈도우를 조회해 불필요한 활성화를 건너뛰는 클래스"""
+    
+    def __init__(self, backend: WindowBackend, nominal_cost: float = 0.5):
+        """
+        Args:
+            backend: 포그라운드 윈도우 조회용 백엔드
+            nominal_cost: 측정값이 없을 때 사용할 활성화 1회 비용 (초)
+        """
+        self.backend = backend
+        self.nominal_cost = nominal_cost
+        
+        # 종류별 ('activate', 'force_activate' 등) 집계
+        self._activations: Dict[str, int] = {}
+        self._activation_seconds: Dict[str, float] = {}
+        self._skips: Dict[str, int] = {}
+        self._saved_seconds: Dict[str, float] = {}
+    
+    def get_foreground(self) -> int:
+        """현재 포그라운드 윈도우 핸들 (조회 실패 시 0)"""
+        try:
+            return self.backend.get_foreground_window()
+        except Exception as e:
+            logger.debug(f"Failed to query foreground window: {e}")
+            return 0
+    
+    def is_focused(self, hwnd: int) -> bool:
+        """hwnd가 이미 포그라운드인지 확인"""
+        return bool(hwnd) and self.get_foreground() == hwnd
+    
+    def _average_cost(self, kind: str) -> float:
+        """종류별 평균 활성화 비용 (측정값이 없으면 nominal_cost)"""
+        count = self._activations.get(kind, 0)
+        if count == 0:
+            return self.nominal_cost
+        return self._activation_seconds[kind] / count
+    
+    def ensure_focus(
+        self,
+        hwnd: int,
+        activate: Callable[[int], bool],
+        kind: str = 'activate'
+    ) -> bool:
+        """
+        포커스가 맞지 않을 때만 activate를 호출
+        
+        Args:
+            hwnd: 포커스를 가져야 할 윈도우 핸들
+            activate: 실제 활성화 함수 (hwnd -> 성공 여부)
+            kind: 통계 구분용 이름
+        
+        Returns:
+            포커스 확보 여부
+        """
+        if self.is_focused(hwnd):
+            saved = self._average_cost(kind)
+            self._skips[kind] = self._skips.get(kind, 0) + 1
+            self._saved_seconds[kind] = self._saved_seconds.get(kind, 0.0) + saved
+            logger.debug(f"Already focused ({kind}), skipped activation (~{saved:.2f}s saved)")
+            return True
+        
+        start = time.perf_counter()
+        success = activate(hwnd)
+        elapsed = time.perf_counter() - start
+        
+        self._activations[kind] = self._activations.get(kind, 0) + 1
+        self._activation_seconds[kind] = self._activation_seconds.get(kind, 0.0) + elapsed
+        return success
+    
+    def get_stats(self) -> dict:
+        """
+        실행 단위 통계 반환
+        
+        force_activate는 내부에서 activate를 호출하므로 활성화 소요 시간은
+        종류별로만 보고한다 (합산 시 중복 집계됨).
+        
+        Returns:
+            {'activations', 'skipped', 'saved_seconds', 'by_kind'}
+        """
+        kinds = set(self._activations) | set(self._skips)
+        by_kind = {
+            kind: {
+                'activations': self._activations.get(kind, 0),
+                'skipped': self._skips.get(kind, 0),
+                'activation_seconds': round(self._activation_seconds.get(kind, 0.0), 2),
+                'saved_seconds': round(self._saved_seconds.get(kind, 0.0), 2),
+            }
+            for kind in sorted(kinds)
+        }
+        return {
+            'activations': sum(self._activations.values()),
+            'skipped': sum(self._skips.values()),
+            'saved_seconds': round(sum(self._saved_seconds.values()), 2),
+            'by_kind': by_kind,
+        }
@@ -0,0 +1,178 @@
+"""입력 폴더 감시 (--watch 모드)
+
+새 파일을 파일 시스템 이벤트(watchdog)로 감지하고, 마지막 이벤트 이후
+debounce 시간이 지나고 크기/수정 시각이 연속으로 같을 때(복사 완료) 처리 대상으로 넘긴다.
+watchdog이 없으면 같은 규칙으로 디렉토리를 주기적으로 스캔한다.
+"""
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+from loguru import logger
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+    FileSystemEventHandler = object
+
+
+class _EventHandler(FileSystemEventHandler):
+    """생성/수정/이동 이벤트를 FolderWatcher에 전달"""
+    
+    def __init__(self, watcher: 'FolderWatcher'):
+        super().__init__()
+        self.watcher = watcher
+    
+    def on_created(self, event):
+        if not event.is_directory:
+            self.watcher.touch(Path(event.src_path))
+    
+    def on_modified(self, event):
+        if not event.is_directory:
+            self.watcher.touch(Path(event.src_path))
+    
+    def on_moved(self, event):
+        if not event.is_directory:
+            self.watcher.touch(Path(event.dest_path))
+
+
+class FolderWatcher:
+    """새로 들어온 파일 중 쓰기가 끝난 파일을 골라내는 감시자"""
+    
+    def __init__(
+        self,
+        directory: Path,
+        accept: Callable[[Path], bool],
+        debounce: float = 2.0,
+        poll_interval: float = 1.0
+    ):
+        """
+        Args:
+            directory: 감시할 디렉토리 (하위 폴더 제외)
+            accept: 처리 대상 파일인지 판단하는 함수 (확장자/처리 완료 suffix 등)
+            debounce: 마지막 이벤트 후 최소 대기 시간 (초)
+            poll_interval: 폴링 모드 스캔 간격 / 안정화 확인 간격 (초)
+        """
+        self.directory = Path(directory)
+        self.accept = accept
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        
+        self._lock = threading.Lock()
+        # 경로 -> [처음 감지 시각, 마지막 이벤트 시각, 마지막 (크기, 수정 시각)]
+        self._pending: Dict[Path, list] = {}
+        self._seen = set()
+        self._observer = None
+        self._last_scan = 0.0
+    
+    @property
+    def mode(self) -> str:
+        return 'events' if self._observer else 'polling'
+    
+    def start(self, initial: List[Path] = None):
+        """
+        감시 시작
+        
+        Args:
+            initial: 시작 시점에 이미 있던 처리 대상 파일 (바로 대기열에 넣음)
+        """
+        for path in initial or []:
+            self.touch(path)
+        
+        # 폴링 모드에서 기존 파일을 새 파일로 다시 잡지 않도록 현재 목록 기록
+        self._seen.update(self._scan())
+        
+        if WATCHDOG_AVAILABLE:
+            self._observer = Observer()
+            self._observer.schedule(_EventHandler(self), str(self.directory), recursive=False)
+            self._observer.start()
+        else:
+            logger.info("watchdog not installed, falling back to directory polling")
+        
+        logger.info(f"Watching {self.directory} ({self.mode}, debounce {self.debounce}s)")
+    
+    def stop(self):
+        """감시 종료"""
+        if self._observer:
+            self._observer.stop()
+            self._observer.join(timeout=5)
+            self._observer = None
+    
+    def touch(self, path: Path):
+        """파일 이벤트 기록 (처리 대상이 아니면 무시)"""
+        path = Path(path)
+        if not self.accept(path):
+            return
+        
+        now = time.time()
+        with self._lock:
+            entry = self._pending.get(path)
+            if entry is None:
+                self._pending[path] = [now, now, None]
+            else:
+                entry[1] = now
+    
+    def _scan(self) -> set:
+        """디렉토리의 파일 경로 목록"""
+        try:
+            with os.scandir(self.directory) as entries:
+                return {Path(entry.path) for entry in entries if entry.is_file()}
+        except OSError as e:
+            logger.warning(f"Failed to scan {self.directory}: {e}")
+            return set()
+    
+    def _poll(self):
+        """폴링 모드: 새로 생긴 파일을 이벤트처럼 기록"""
+        if self._observer or time.time() - self._last_scan < self.poll_interval:
+            return
+        self._last_scan = time.time()
+        
+        current = self._scan()
+        for path in current - self._seen:
+            self.touch(path)
+        self._seen = current
+    
+    def ready(self) -> List[Tuple[Path, float]]:
+        """
+        쓰기가 끝난 파일 목록을 대기열에서 꺼냄
+        
+        debounce가 지났고, 직전 확인 때와 크기/수정 시각이 같으며 크기가 0보다 큰 파일만 반환한다.
+        
+        Returns:
+            [(파일 경로, 처음 감지 시각)] (감지 순서)
+        """
+        self._poll()
+        
+        now = time.time()
+        ready = []
+        with self._lock:
+            for path, entry in list(self._pending.items()):
+                first_seen, last_event, last_signature = entry
+                if now - last_event < self.debounce:
+                    continue
+                
+                try:
+                    stat = path.stat()
+                except OSError:
+                    # 삭제되었거나 이동됨
+                    del self._pending[path]
+                    continue
+                
+                signature = (stat.st_size, stat.st_mtime)
+                if stat.st_size > 0 and signature == last_signature:
+                    ready.append((path, first_seen))
+                    del self._pending[path]
+                else:
+                    entry[2] = signature
+        
+        ready.sort(key=lambda item: item[1])
+        return ready
+    
+    def pending_count(self) -> int:
+        """아직 안정화되지 않은 파일 수"""
+        with self._lock:
+            return len(self._pending)
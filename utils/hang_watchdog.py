@@ -0,0 +1,213 @@
+"""앱 멈춤 감시 (watchdog)
+
+백그라운드 스레드가 앱 프로세스의 생존 여부와 누적 CPU 시간, 윈도우 응답 여부를
+주기적으로 확인하다가 앱이 멈춘 것으로 보이면 hung 이벤트를 세운다.
+컨트롤러는 키 입력/대기 전에 이 이벤트를 확인해 멈춘 창에 입력을 계속 보내는 대신
+바로 중단하고 앱을 재시작한다 (재시작은 GUI를 다루는 메인 스레드에서 수행).
+
+판정 기준:
+    - 실행 중이던 프로세스가 사라짐 → 즉시
+    - 윈도우가 응답하지 않고 CPU 시간도 거의 늘지 않음 → hang_seconds 후 (교착 상태)
+    - 윈도우가 응답하지 않지만 CPU는 사용 중 → busy_hang_seconds 후 (무거운 처리 중일 수 있음)
+"""
+import threading
+import time
+from typing import Callable, List, Optional
+from loguru import logger
+
+from .app_process import ProcessBackend
+
+
+class AppHangError(RuntimeError):
+    """감시 스레드가 앱 멈춤을 감지함"""
+
+
+class HangWatchdog:
+    """앱 프로세스 감시 스레드"""
+    
+    def __init__(
+        self,
+        backend: ProcessBackend,
+        interval: float = 1.0,
+        hang_seconds: float = 5.0,
+        busy_hang_seconds: float = 60.0,
+        probe_timeout: float = 0.5,
+        cpu_epsilon: float = 0.05,
+        on_hang: Callable[[str], None] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            backend: 프로세스 조회 백엔드
+            interval: 확인 주기 (초)
+            hang_seconds: CPU 사용 없이 응답이 없을 때 멈춤으로 볼 시간 (초)
+            busy_hang_seconds: CPU를 쓰면서 응답이 없을 때 멈춤으로 볼 시간 (초)
+            probe_timeout: 윈도우 응답 확인 제한 시간 (초)
+            cpu_epsilon: 확인 주기 동안 이보다 적게 늘어난 CPU 시간은 정지로 봄 (초)
+            on_hang: 멈춤 감지 시 감시 스레드에서 호출할 함수 on_hang(사유)
+            clock: 시각 함수 (테스트용)
+        """
+        self.backend = backend
+        self.interval = interval
+        self.hang_seconds = hang_seconds
+        self.busy_hang_seconds = max(hang_seconds, busy_hang_seconds)
+        self.probe_timeout = probe_timeout
+        self.cpu_epsilon = cpu_epsilon
+        self.on_hang = on_hang
+        self.clock = clock
+        
+        self.hung = threading.Event()
+        self.reason: Optional[str] = None
+        
+        self._stop = threading.Event()
+        self._paused = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        
+        self._seen_alive = False
+        self._last_cpu: Optional[float] = None
+        self._unresponsive_since: Optional[float] = None
+        self._busy = False
+        
+        self.samples = 0
+        self.probe_seconds = 0.0
+        self.hangs: List[dict] = []
+        self.recoveries = 0
+    
+    def start(self):
+        """감시 스레드 시작"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._loop, name='hang-watchdog', daemon=True)
+        self._thread.start()
+        logger.info(f"Hang watchdog started (interval {self.interval}s, hang after {self.hang_seconds}s)")
+    
+    def stop(self):
+        """감시 스레드 종료"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + self.probe_timeout + 1)
+            self._thread = None
+    
+    def _loop(self):
+        while not self._stop.is_set():
+            if not self._paused.is_set():
+                try:
+                    self.poll()
+                except Exception as e:
+                    logger.debug(f"Watchdog poll failed: {e}")
+            self._stop.wait(self.interval)
+    
+    def poll(self) -> bool:
+        """
+        한 번 확인 (감시 스레드가 주기적으로 호출, 테스트에서는 직접 호출)
+        
+        Returns:
+            멈춤 상태이면 True
+        """
+        if self.hung.is_set():
+            return True
+        
+        start_time = time.perf_counter()
+        sample = self.backend.sample()
+        responsive = self.backend.is_responsive(self.probe_timeout) if sample else None
+        now = self.clock()
+        
+        with self._lock:
+            self.samples += 1
+            self.probe_seconds += time.perf_counter() - start_time
+            
+            # 1. 생존 여부 (한 번이라도 실행 중이었던 프로세스가 사라진 경우만)
+            if sample is None:
+                if self._seen_alive:
+                    return self._flag("process exited")
+                return False
+            self._seen_alive = True
+            
+            # 2. CPU 진행 여부
+            cpu_delta = None if self._last_cpu is None else sample['cpu_time'] - self._last_cpu
+            self._last_cpu = sample['cpu_time']
+            
+            # 3. 윈도우 응답
+            if responsive is not False:
+                self._unresponsive_since = None
+                self._busy = False
+                return False
+            
+            if self._unresponsive_since is None:
+                self._unresponsive_since = now
+            if cpu_delta is not None and cpu_delta > self.cpu_epsilon:
+                self._busy = True
+            
+            elapsed = now - self._unresponsive_since
+            if not self._busy and elapsed >= self.hang_seconds:
+                return self._flag(f"not responding for {elapsed:.0f}s with no CPU progress")
+            if elapsed >= self.busy_hang_seconds:
+                return self._flag(f"not responding for {elapsed:.0f}s")
+            return False
+    
+    def _flag(self, reason: str) -> bool:
+        """멈춤 표시 (self._lock 안에서 호출)"""
+        self.reason = reason
+        self.hangs.append({'time': time.strftime('%Y-%m-%d %H:%M:%S'), 'reason': reason})
+        self.hung.set()
+        logger.error(f"Watchdog: app hang detected ({reason})")
+        
+        if self.on_hang:
+            try:
+                self.on_hang(reason)
+            except Exception as e:
+                logger.debug(f"on_hang callback raised: {e}")
+        return True
+    
+    def check(self):
+        """
+        멈춤 상태면 AppHangError 발생 (키 입력/대기 전에 호출)
+        
+        Raises:
+            AppHangError: 앱 멈춤이 감지된 경우
+        """
+        if self.hung.is_set():
+            raise AppHangError(self.reason or "app hang detected")
+    
+    def sleep(self, seconds: float):
+        """
+        seconds 동안 대기하되 그 사이 멈춤이 감지되면 바로 AppHangError 발생
+        
+        Raises:
+            AppHangError: 앱 멈춤이 감지된 경우
+        """
+        if self.hung.wait(max(0.0, seconds)):
+            self.check()
+    
+    def pause(self):
+        """의도적인 앱 종료/재시작 동안 감시 중지"""
+        self._paused.set()
+    
+    def resume(self, recovered: bool = False):
+        """
+        감시 재개 (멈춤 상태와 누적 관측값 초기화)
+        
+        Args:
+            recovered: 앱 재시작으로 멈춤에서 복구한 경우 True
+        """
+        with self._lock:
+            if recovered and self.hung.is_set():
+                self.recoveries += 1
+            self.hung.clear()
+            self.reason = None
+            self._seen_alive = False
+            self._last_cpu = None
+            self._unresponsive_since = None
+            self._busy = False
+        self._paused.clear()
+    
+    def get_stats(self) -> dict:
+        """확인 횟수, 확인당 평균 비용, 감지된 멈춤과 복구 횟수"""
+        with self._lock:
+            return {
+                'samples': self.samples,
+                'avg_probe_ms': round(self.probe_seconds / self.samples * 1000, 2) if self.samples else 0.0,
+                'hangs': list(self.hangs),
+                'recoveries': self.recoveries,
+            }
@@ -0,0 +1,101 @@
+"""이미지 헤더 정보 유틸리티
+
+PIL의 Image.open은 헤더만 읽고 픽셀 데이터는 load() 전까지 디코딩하지 않으므로
+수백 장의 해상도를 빠르게 확인할 수 있다.
+"""
+import os
+import warnings
+from pathlib import Path
+from typing import List, Optional, Tuple
+from loguru import logger
+from PIL import Image
+
+# 수억 픽셀 원본/결과물도 정상 입력이므로 PIL의 decompression bomb 한도(약 1.8억 픽셀 초과 시 예외)를
+# IMAGE_MAX_PIXELS(기본 20억 픽셀, RGB 디코딩 시 약 6GB)로 올린다. 한도를 끄지는 않는다.
+# 프로세스 풀 워커에도 적용되도록 설정 클래스가 아니라 환경 변수에서 직접 읽는다.
+IMAGE_MAX_PIXELS = int(os.getenv('IMAGE_MAX_PIXELS', '2000000000'))
+
+# PIL은 MAX_IMAGE_PIXELS를 넘으면 경고, 2배를 넘으면 예외를 내므로 예외 기준이 IMAGE_MAX_PIXELS가 되게 설정
+Image.MAX_IMAGE_PIXELS = IMAGE_MAX_PIXELS // 2
+warnings.simplefilter('ignore', Image.DecompressionBombWarning)
+
+
+def read_dimensions(image_path: Path) -> Optional[Tuple[int, int]]:
+    """
+    이미지 헤더에서 크기 읽기
+    
+    Args:
+        image_path: 이미지 파일 경로
+    
+    Returns:
+        (너비, 높이) (읽을 수 없으면 None)
+    """
+    try:
+        with Image.open(image_path) as img:
+            return img.size
+    except Exception as e:
+        logger.debug(f"Failed to read image header {Path(image_path).name}: {e}")
+        return None
+
+
+def read_megapixels(image_path: Path) -> Optional[float]:
+    """
+    이미지 헤더에서 해상도(메가픽셀) 읽기
+    
+    Args:
+        image_path: 이미지 파일 경로
+    
+    Returns:
+        메가픽셀 (읽을 수 없으면 None)
+    """
+    size = read_dimensions(image_path)
+    if size is None:
+        return None
+    return size[0] * size[1] / 1_000_000
+
+
+def plan_chunks(
+    image_paths: List[Path],
+    megapixel_budget: float,
+    max_files: int,
+    unknown_megapixels: float = 24.0
+) -> List[List[Path]]:
+    """
+    총 메가픽셀 예산과 파일 수 상한으로 이미지를 청크로 분할 (순서 유지)
+    
+    예산보다 큰 이미지는 단독 청크가 된다. 폴더가 바뀌면 새 청크를 시작한다
+    (하위 폴더 검색 시에도 열기 다이얼로그는 한 폴더만 다루므로).
+    
+    Args:
+        image_paths: 이미지 경로 리스트
+        megapixel_budget: 청크당 총 메가픽셀 상한
+        max_files: 청크당 파일 수 상한
+        unknown_megapixels: 헤더를 읽지 못한 이미지에 가정할 메가픽셀
+    
+    Returns:
+        청크 리스트
+    """
+    max_files = max(1, max_files)
+    chunks = []
+    current = []
+    current_mp = 0.0
+    
+    for image_path in image_paths:
+        megapixels = read_megapixels(image_path)
+        if megapixels is None:
+            logger.warning(f"  Unknown resolution, assuming {unknown_megapixels}MP: {Path(image_path).name}")
+            megapixels = unknown_megapixels
+        
+        new_folder = current and Path(image_path).parent != Path(current[-1]).parent
+        if current and (current_mp + megapixels > megapixel_budget or len(current) >= max_files or new_folder):
+            chunks.append(current)
+            current = []
+            current_mp = 0.0
+        
+        current.append(image_path)
+        current_mp += megapixels
+    
+    if current:
+        chunks.append(current)
+    
+    return chunks
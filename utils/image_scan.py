@@ -0,0 +1,124 @@
+"""이미지 파일 탐색 (디렉토리당 os.scandir 한 번)
+
+확장자마다 소문자/대문자로 glob을 호출하면 같은 디렉토리를 확장자 수 × 2번 나열한다.
+네트워크 공유 폴더에서는 나열 한 번이 곧 큰 왕복이므로 디렉토리마다 os.scandir로 한 번만 나열하고
+확장자는 소문자 frozenset 조회로 확인한다.
+
+DirEntry는 나열할 때 받은 파일 종류(Windows에서는 크기/수정 시각까지)를 캐시하므로
+is_file()/stat()이 파일마다 시스템 호출을 다시 하지 않는다.
+숨김 파일/폴더(.으로 시작, 스테이징 폴더 포함)는 건너뛴다.
+"""
+import os
+from pathlib import Path
+from typing import Iterable, Iterator, FrozenSet, List
+from loguru import logger
+
+
+def extension_set(extensions: Iterable[str]) -> FrozenSet[str]:
+    """확장자 목록 → 소문자 frozenset ('.JPG' → '.jpg')"""
+    return frozenset(ext.lower() for ext in extensions)
+
+
+def scan_image_entries(directory: Path, extensions: FrozenSet[str], recursive: bool = False) -> Iterator[os.DirEntry]:
+    """
+    디렉토리의 이미지 파일 DirEntry를 나열 순서대로 생성
+    
+    Args:
+        directory: 검색할 디렉토리
+        extensions: 소문자 확장자 집합 (extension_set)
+        recursive: 하위 폴더까지 검색 (심볼릭 링크 폴더는 따라가지 않음)
+    
+    Yields:
+        os.DirEntry (entry.stat()은 캐시된 값 사용)
+    """
+    pending = [os.fspath(directory)]
+    
+    while pending:
+        current = pending.pop()
+        subdirs = []
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith('.'):
+                        continue
+                    try:
+                        if entry.is_file():
+                            dot = name.rfind('.')
+                            if dot > 0 and name[dot:].lower() in extensions:
+                                yield entry
+                        elif recursive and entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.debug(f"Cannot list {current}: {e}")
+            continue
+        
+        # 이름순에 가깝게 처리되도록 뒤집어서 스택에 넣음
+        pending.extend(reversed(sorted(subdirs)))
+
+
+def exclude_suffix_entries(entries: Iterable[os.DirEntry], exclude_suffixes: Iterable[str] = None) -> Iterator[str]:
+    """
+    파일명(확장자 제외)에 처리된 파일 suffix가 들어 있는 항목을 뺀 경로 문자열
+    
+    Args:
+        entries: 이미지 파일 항목들 (os.DirEntry 또는 name/path가 있는 항목)
+        exclude_suffixes: 제외할 suffix 리스트
+    
+    Yields:
+        경로 문자열
+    """
+    suffixes = [suffix.lower() for suffix in exclude_suffixes or [] if suffix]
+    
+    for entry in entries:
+        if suffixes:
+            name = entry.name
+            stem = name[:name.rfind('.')].lower()
+            if any(suffix in stem for suffix in suffixes):
+                continue
+        yield entry.path
+
+
+def _image_paths(directory: Path, extensions: FrozenSet[str], exclude_suffixes, recursive: bool) -> Iterator[str]:
+    """처리된 파일 suffix를 제외한 이미지 경로 문자열"""
+    return exclude_suffix_entries(scan_image_entries(directory, extensions, recursive), exclude_suffixes)
+
+
+def iter_image_files(
+    directory: Path,
+    extensions: FrozenSet[str],
+    exclude_suffixes: Iterable[str] = None,
+    recursive: bool = False
+) -> Iterator[Path]:
+    """
+    처리 대상 이미지 경로 생성 (정렬하지 않음, 처리된 파일 suffix 제외)
+    
+    Args:
+        directory: 검색할 디렉토리
+        extensions: 소문자 확장자 집합
+        exclude_suffixes: 파일명(확장자 제외)에 들어 있으면 제외할 suffix 리스트
+        recursive: 하위 폴더까지 검색
+    
+    Yields:
+        이미지 파일 경로
+    """
+    for path in _image_paths(directory, extensions, exclude_suffixes, recursive):
+        yield Path(path)
+
+
+def list_image_files(
+    directory: Path,
+    extensions: FrozenSet[str],
+    exclude_suffixes: Iterable[str] = None,
+    recursive: bool = False
+) -> List[Path]:
+    """
+    iter_image_files와 같은 목록을 정렬해서 반환
+    
+    Path 객체끼리 비교하는 대신 문자열을 먼저 정렬한다 (normcase 기준이라 Windows에서는
+    Path 정렬과 같이 대소문자를 무시).
+    """
+    paths = sorted(_image_paths(directory, extensions, exclude_suffixes, recursive), key=os.path.normcase)
+    return [Path(path) for path in paths]
@@ -0,0 +1,177 @@
+"""작업 저널 (크래시 안전 / 재개용)
+
+이미지별 상태 전이(queued → opened → exported → verified, 또는 failed)를
+한 줄짜리 JSON으로 append하고 매번 fsync한다. 앱이나 PC가 중간에 죽어도
+마지막으로 기록된 상태까지는 남으므로, --resume 실행 시 저널을 한 번 읽어
+(O(저널 크기)) 남은 작업만 다시 처리할 수 있다.
+
+저널 파일은 입력 폴더별로 하나이며, --resume 없이 실행하면 'run_start'
+표시를 남겨 새 작업으로 시작한다 (이전 기록은 재생 시 무시).
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List
+from loguru import logger
+
+# 상태 전이
+QUEUED = 'queued'
+OPENED = 'opened'
+EXPORTED = 'exported'
+VERIFIED = 'verified'
+FAILED = 'failed'
+
+
+def journal_path_for(input_dir: Path, journal_dir: Path) -> Path:
+    """
+    입력 폴더에 대응하는 저널 파일 경로
+    
+    Args:
+        input_dir: 입력 디렉토리
+        journal_dir: 저널 저장 디렉토리
+    
+    Returns:
+        저널 파일 경로 ({폴더명}_{경로 해시 8자리}.jsonl)
+    """
+    resolved = str(Path(input_dir).resolve())
+    digest = hashlib.sha1(resolved.lower().encode('utf-8')).hexdigest()[:8]
+    return Path(journal_dir) / f"{Path(input_dir).name}_{digest}.jsonl"
+
+
+class JobJournal:
+    """이미지별 상태 전이를 기록하는 append-only 저널"""
+    
+    def __init__(self, path: Path, resume: bool = False):
+        """
+        Args:
+            path: 저널 파일 경로
+            resume: True면 기존 기록을 재생해 이어서 기록, False면 새 작업으로 시작
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # 이미지 경로 -> 마지막 상태
+        self.states: Dict[str, str] = self.replay(self.path) if resume else {}
+        
+        # GUI 스레드와 파이프라인 단계가 함께 기록할 수 있으므로 잠금 사용
+        self._lock = threading.Lock()
+        
+        # 크래시로 잘린 마지막 줄 뒤에 이어 쓰지 않도록 줄바꿈 보정
+        needs_newline = False
+        if self.path.exists() and self.path.stat().st_size > 0:
+            with open(self.path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                needs_newline = f.read(1) != b'\n'
+        
+        self._file = open(self.path, 'a', encoding='utf-8')
+        if needs_newline:
+            self._file.write('\n')
+        if not resume:
+            self._append([{'event': 'run_start', 't': time.time()}])
+    
+    @staticmethod
+    def _key(image_path) -> str:
+        return str(Path(image_path).absolute())
+    
+    @staticmethod
+    def replay(path: Path) -> Dict[str, str]:
+        """
+        저널을 처음부터 읽어 이미지별 마지막 상태 복원
+        
+        크래시로 잘린 마지막 줄 등 읽을 수 없는 줄은 건너뛴다.
+        
+        Args:
+            path: 저널 파일 경로
+        
+        Returns:
+            {이미지 경로: 마지막 상태}
+        """
+        states = {}
+        if not Path(path).exists():
+            return states
+        
+        corrupted = 0
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    corrupted += 1
+                    continue
+                
+                if entry.get('event') == 'run_start':
+                    states.clear()
+                elif 'image' in entry and 'state' in entry:
+                    states[entry['image']] = entry['state']
+        
+        if corrupted:
+            logger.warning(f"Skipped {corrupted} unreadable journal lines in {Path(path).name}")
+        return states
+    
+    def _append(self, entries: List[dict]):
+        """기록 추가 후 디스크까지 flush"""
+        for entry in entries:
+            self._file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+    
+    def record(self, image_path, state: str, error: str = None):
+        """
+        이미지 상태 전이 기록
+        
+        Args:
+            image_path: 이미지 경로
+            state: QUEUED / OPENED / EXPORTED / VERIFIED / FAILED
+            error: 실패 사유
+        """
+        self.record_many([image_path], state, error)
+    
+    def record_many(self, image_paths: list, state: str, error: str = None):
+        """
+        여러 이미지의 같은 상태 전이를 한 번의 fsync로 기록
+        
+        Args:
+            image_paths: 이미지 경로 리스트
+            state: 상태
+            error: 실패 사유
+        """
+        now = time.time()
+        entries = []
+        for image_path in image_paths:
+            key = self._key(image_path)
+            entry = {'t': now, 'image': key, 'state': state}
+            if error:
+                entry['error'] = error
+            entries.append(entry)
+            self.states[key] = state
+        
+        if entries:
+            with self._lock:
+                self._append(entries)
+    
+    def is_done(self, image_path) -> bool:
+        """검증까지 끝난 이미지인지 여부"""
+        return self.states.get(self._key(image_path)) == VERIFIED
+    
+    def pending(self, image_paths: list) -> list:
+        """
+        아직 끝나지 않은 이미지만 반환 (순서 유지)
+        
+        opened/exported에서 멈춘 이미지는 결과를 확신할 수 없으므로 다시 처리한다.
+        """
+        return [path for path in image_paths if not self.is_done(path)]
+    
+    def get_stats(self) -> dict:
+        """상태별 이미지 수"""
+        counts = {}
+        for state in self.states.values():
+            counts[state] = counts.get(state, 0) + 1
+        return counts
+    
+    def close(self):
+        """저널 파일 닫기"""
+        if not self._file.closed:
+            self._file.close()
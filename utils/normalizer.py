@@ -0,0 +1,278 @@
+"""입력 이미지 사전 정규화
+
+거대한 TIFF, CMYK JPEG, 16비트 PNG 같은 입력은 Topaz에서 로드가 느리거나 실패한다.
+규칙(최대 메가픽셀, 비트 깊이, 색 공간)에 걸리는 파일만 프로세스 풀에서 앱이 잘 여는
+형식(8비트 RGB PNG/TIFF)으로 변환해 두고, GUI는 변환된 파일을 연다.
+
+변환은 처리 순서대로 GUI보다 먼저 진행되며, GUI 차례가 왔을 때 변환이 끝나지 않았으면
+기다리지 않고 원본을 그대로 연다.
+변환 파일은 원본과 같은 이름(확장자만 다름)으로 파일별 폴더에 만들어지므로 결과 파일명이
+원본 기준으로 유지되고, 그 폴더에 생긴 결과물은 원본 폴더로 옮긴다.
+"""
+import hashlib
+import io
+import shutil
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from loguru import logger
+from PIL import Image
+
+# 대형 이미지용 decompression bomb 한도(IMAGE_MAX_PIXELS)를 워커 프로세스에도 적용
+from . import image_info  # noqa: F401
+
+try:
+    from PIL import ImageCms
+    IMAGECMS_AVAILABLE = True
+except ImportError:
+    IMAGECMS_AVAILABLE = False
+
+# 변환 출력 형식 -> (PIL 형식, 확장자, 저장 옵션)
+OUTPUT_FORMATS = {
+    'png': ('PNG', '.png', {'compress_level': 1}),
+    'tiff': ('TIFF', '.tif', {}),
+}
+
+# 8비트보다 깊은 값을 담는 PIL 모드
+HIGH_BIT_MODES = {'I;16', 'I;16B', 'I;16L', 'I;16N', 'I', 'F'}
+
+
+def bit_depth(img: Image.Image, image_path: Path) -> int:
+    """
+    채널당 비트 깊이 (PIL은 16비트 RGB PNG를 8비트로 읽으므로 헤더에서 직접 확인)
+    
+    Args:
+        img: 열린 이미지
+        image_path: 이미지 경로
+    
+    Returns:
+        채널당 비트 수
+    """
+    if img.format == 'PNG':
+        with open(image_path, 'rb') as f:
+            header = f.read(25)
+        return header[24] if len(header) >= 25 else 8
+    if img.format == 'TIFF':
+        bits = img.tag_v2.get(258, 8)
+        return max(bits) if isinstance(bits, tuple) else bits
+    return 16 if img.mode in HIGH_BIT_MODES else 8
+
+
+def conversion_reasons(img: Image.Image, image_path: Path, rules: dict) -> list:
+    """
+    규칙에 걸리는 항목 (비어 있으면 변환 불필요)
+    
+    Args:
+        img: 열린 이미지
+        image_path: 이미지 경로
+        rules: {'max_megapixels', 'max_bit_depth', 'color_modes'}
+    
+    Returns:
+        사유 문자열 리스트
+    """
+    reasons = []
+    megapixels = img.width * img.height / 1_000_000
+    if rules['max_megapixels'] and megapixels > rules['max_megapixels']:
+        reasons.append(f"{megapixels:.0f}MP")
+    depth = bit_depth(img, image_path)
+    if depth > rules['max_bit_depth']:
+        reasons.append(f"{depth}-bit")
+    if img.mode in rules['color_modes']:
+        reasons.append(img.mode)
+    return reasons
+
+
+def _to_rgb(img: Image.Image) -> Image.Image:
+    """8비트 RGB(투명도가 있으면 RGBA)로 변환 (ICC 프로파일이 있으면 sRGB로 색 변환)"""
+    if img.mode in HIGH_BIT_MODES:
+        # 16비트 흑백 등: 0~65535 -> 0~255
+        scale = 1 / 256 if img.mode != 'F' else 255
+        return img.convert('I').point(lambda v: v * scale).convert('L').convert('RGB')
+    
+    icc_profile = img.info.get('icc_profile')
+    if IMAGECMS_AVAILABLE and icc_profile and img.mode in ('CMYK', 'LAB', 'YCbCr'):
+        try:
+            source = ImageCms.ImageCmsProfile(io.BytesIO(icc_profile))
+            return ImageCms.profileToProfile(img, source, ImageCms.createProfile('sRGB'), outputMode='RGB')
+        except Exception:
+            pass
+    
+    if img.mode in ('RGBA', 'LA', 'PA') or 'transparency' in img.info:
+        return img.convert('RGBA')
+    return img.convert('RGB')
+
+
+def normalize_image(image_path: Path, target_dir: Path, rules: dict) -> Tuple[Optional[Path], list]:
+    """
+    이미지 한 장을 규칙에 맞게 변환 (프로세스 풀 작업 함수)
+    
+    Args:
+        image_path: 원본 이미지 경로
+        target_dir: 변환 파일을 만들 폴더
+        rules: {'max_megapixels', 'max_bit_depth', 'color_modes', 'format'}
+    
+    Returns:
+        (변환 파일 경로 또는 None(변환 불필요), 사유 리스트)
+    """
+    with Image.open(image_path) as img:
+        reasons = conversion_reasons(img, image_path, rules)
+        if not reasons:
+            return None, []
+        
+        converted = _to_rgb(img)
+        
+        megapixels = converted.width * converted.height / 1_000_000
+        if rules['max_megapixels'] and megapixels > rules['max_megapixels']:
+            scale = (rules['max_megapixels'] / megapixels) ** 0.5
+            size = (max(1, int(converted.width * scale)), max(1, int(converted.height * scale)))
+            converted = converted.resize(size, Image.LANCZOS)
+        
+        pil_format, suffix, options = OUTPUT_FORMATS[rules['format']]
+        target_dir.mkdir(parents=True, exist_ok=True)
+        target = target_dir / f"{Path(image_path).stem}{suffix}"
+        converted.save(target, pil_format, **options)
+    
+    return target, reasons
+
+
+class Normalizer:
+    """규칙에 걸리는 입력을 미리 변환하고, GUI 차례에 변환 파일이 있으면 그것을 반환"""
+    
+    def __init__(
+        self,
+        output_dir: Path,
+        max_megapixels: float = 0,
+        max_bit_depth: int = 8,
+        color_modes: tuple = ('CMYK', 'LAB', 'YCbCr'),
+        output_format: str = 'png',
+        workers: int = None
+    ):
+        """
+        Args:
+            output_dir: 변환 파일을 만들 폴더
+            max_megapixels: 이보다 큰 이미지는 축소 (0이면 제한 없음)
+            max_bit_depth: 이보다 깊은 이미지는 8비트로 변환
+            color_modes: RGB로 변환할 PIL 색상 모드
+            output_format: 'png' 또는 'tiff'
+            workers: 프로세스 수 (None이면 CPU 수)
+        """
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unknown normalize format: {output_format} (choose from {', '.join(OUTPUT_FORMATS)})")
+        
+        self.output_dir = Path(output_dir)
+        self.rules = {
+            'max_megapixels': max_megapixels,
+            'max_bit_depth': max_bit_depth,
+            'color_modes': tuple(color_modes),
+            'format': output_format,
+        }
+        self.workers = workers
+        
+        self._executor = None
+        self._futures: Dict[Path, Future] = {}
+        self.stats = {'converted': 0, 'passthrough': 0, 'not_ready': 0, 'errors': 0}
+    
+    def _target_dir(self, image_path: Path) -> Path:
+        """원본별 변환 폴더 (같은 이름의 다른 원본과 겹치지 않도록 경로 해시 사용)"""
+        key = hashlib.sha1(str(Path(image_path).absolute()).encode('utf-8')).hexdigest()[:10]
+        return self.output_dir / key
+    
+    def submit(self, image_paths: list):
+        """
+        변환 작업을 처리 순서대로 프로세스 풀에 등록
+        
+        Args:
+            image_paths: 이미지 경로 리스트 (처리 순서대로)
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        for path in image_paths:
+            path = Path(path)
+            if path not in self._futures:
+                self._futures[path] = self._executor.submit(
+                    normalize_image, path, self._target_dir(path), self.rules
+                )
+    
+    def resolve(self, image_path: Path) -> Path:
+        """
+        GUI가 열 파일 경로 (기다리지 않음)
+        
+        변환이 끝났으면 변환 파일, 변환이 필요 없거나 아직 끝나지 않았거나 실패했으면 원본을 반환한다.
+        """
+        image_path = Path(image_path)
+        future = self._futures.get(image_path)
+        if future is None:
+            return image_path
+        
+        if not future.done():
+            self.stats['not_ready'] += 1
+            logger.info(f"  Normalization of {image_path.name} not ready, opening original")
+            return image_path
+        
+        try:
+            target, reasons = future.result()
+        except Exception as e:
+            self.stats['errors'] += 1
+            logger.warning(f"Failed to normalize {image_path.name}, opening original: {e}")
+            return image_path
+        
+        if target is None:
+            self.stats['passthrough'] += 1
+            return image_path
+        
+        self.stats['converted'] += 1
+        logger.info(f"  Normalized {image_path.name} -> {target.name} ({', '.join(reasons)})")
+        return target
+    
+    def release(self, image_path: Path):
+        """
+        변환 파일 정리
+        
+        변환 폴더에 앱이 저장한 결과물(원본과 같은 폴더로 Export한 경우)은 원본 폴더로 옮기고
+        변환 파일과 폴더를 삭제한다.
+        """
+        image_path = Path(image_path)
+        future = self._futures.pop(image_path, None)
+        if future is not None and future.cancel():
+            return
+        if future is not None and not future.done():
+            # 변환 중이면 앱은 원본을 열었으므로 끝난 뒤에 변환 파일만 지움
+            future.add_done_callback(lambda _: self._remove(image_path, move_outputs=False))
+            return
+        self._remove(image_path, move_outputs=True)
+    
+    def _remove(self, image_path: Path, move_outputs: bool):
+        target_dir = self._target_dir(image_path)
+        if not target_dir.exists():
+            return
+        
+        converted_names = {f"{image_path.stem}{suffix}" for _, suffix, _ in OUTPUT_FORMATS.values()}
+        for entry in list(target_dir.iterdir()):
+            if entry.name in converted_names or not move_outputs:
+                continue
+            
+            destination = image_path.parent / entry.name
+            counter = 1
+            while destination.exists():
+                destination = image_path.parent / f"{entry.stem}_{counter}{entry.suffix}"
+                counter += 1
+            try:
+                shutil.move(str(entry), str(destination))
+                logger.info(f"  Moved output out of normalize folder: {destination.name}")
+            except OSError as e:
+                logger.warning(f"Failed to move {entry.name} out of normalize folder: {e}")
+        
+        shutil.rmtree(target_dir, ignore_errors=True)
+    
+    def get_stats(self) -> dict:
+        """변환/원본 사용/미완료/오류 횟수"""
+        return dict(self.stats)
+    
+    def close(self):
+        """프로세스 풀 종료 (남은 변환은 취소하고 변환 파일 정리)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        for image_path in list(self._futures):
+            self._futures.pop(image_path)
+            self._remove(image_path, move_outputs=True)
@@ -0,0 +1,155 @@
+"""낙관적 입력 실행
+
+입력 동작을 최소 대기로 보낸 뒤 저렴한 사후 조건(다이얼로그 타이틀 표시,
+타이틀에 파일명 포함, 파일 생성 등)을 폴링으로 확인한다.
+확인에 실패하면 롤백(예: Esc) 후 더 긴 대기 배율로 제한된 횟수만큼 재시도한다.
+
+일반적인 경우에는 조건이 충족되는 즉시 다음 단계로 넘어가고,
+느린 경우에만 기존처럼 충분히 기다리게 된다.
+"""
+import re
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+from loguru import logger
+
+
+def wait_until(predicate: Callable[[], bool], timeout: float, interval: float = 0.1) -> bool:
+    """
+    조건이 참이 될 때까지 폴링
+    
+    Args:
+        predicate: 확인할 조건
+        timeout: 최대 대기 시간 (초)
+        interval: 폴링 간격 (초)
+    
+    Returns:
+        제한 시간 안에 조건이 참이 되면 True
+    """
+    deadline = time.time() + timeout
+    while True:
+        try:
+            if predicate():
+                return True
+        except Exception as e:
+            logger.debug(f"Predicate raised: {e}")
+        if time.time() >= deadline:
+            return False
+        time.sleep(interval)
+
+
+def title_contains(get_title: Callable[[], str], text: str) -> Callable[[], bool]:
+    """활성 윈도우 타이틀에 text가 포함되면 참 (대소문자 무시)"""
+    needle = text.lower()
+    return lambda: needle in get_title().lower()
+
+
+def title_shows_file(get_title: Callable[[], str], file_name: str) -> Callable[[], bool]:
+    """
+    활성 윈도우 타이틀에 파일이 표시되면 참 (대소문자 무시)
+    
+    이전 이미지(img10.jpg)가 아직 표시된 상태에서 img1.jpg를 열 때 통과하지 않도록
+    파일 이름 전체 또는 확장자 없는 이름이 단어 경계(공백, 경로 구분자, 괄호, 타이틀 끝)로
+    둘러싸여 있을 때만 일치로 본다.
+    
+    Args:
+        get_title: 활성 윈도우 타이틀을 반환하는 함수
+        file_name: 열고 있는 파일 이름 (예: img1.jpg)
+    """
+    stem = Path(file_name).stem
+    pattern = re.compile(
+        r'(?:^|[\s\\/(\[])' + re.escape(stem) + r'(?:\.[^\s.\\/()\[\]]+)?(?=$|[\s)\]])',
+        re.IGNORECASE
+    )
+    return lambda: pattern.search(get_title()) is not None
+
+
+def file_appeared(path: Path) -> Callable[[], bool]:
+    """파일이 존재하고 크기가 0보다 크면 참"""
+    path = Path(path)
+    
+    def check():
+        try:
+            return path.stat().st_size > 0
+        except OSError:
+            return False
+    
+    return check
+
+
+class OptimisticExecutor:
+    """동작 -> 사후 조건 확인 -> 실패 시 롤백 후 재시도"""
+    
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        initial_scale: float = 0.25,
+        backoff: float = 2.0,
+        max_scale: float = 2.0,
+        poll_interval: float = 0.1
+    ):
+        """
+        Args:
+            max_attempts: 단계별 최대 시도 횟수
+            initial_scale: 첫 시도의 대기 배율 (프로파일 값 × 배율)
+            backoff: 재시도마다 곱할 배율
+            max_scale: 대기 배율 상한
+            poll_interval: 사후 조건 폴링 간격 (초)
+        """
+        self.max_attempts = max_attempts
+        self.initial_scale = initial_scale
+        self.backoff = backoff
+        self.max_scale = max_scale
+        self.poll_interval = poll_interval
+        
+        # 단계별 통계
+        self.stats: Dict[str, Dict[str, int]] = {}
+    
+    def run(
+        self,
+        name: str,
+        action: Callable[[float], Optional[bool]],
+        verify: Callable[[], bool],
+        timeout: float,
+        rollback: Callable[[float], None] = None
+    ) -> bool:
+        """
+        단계 실행
+        
+        Args:
+            name: 단계 이름 (로그/통계용)
+            action: 입력 동작. 대기 배율(scale)을 받으며 False를 반환하면 즉시 실패 처리
+            verify: 사후 조건
+            timeout: 사후 조건 최대 대기 시간 (초)
+            rollback: 실패 시 되돌리기 동작 (scale을 받음)
+        
+        Returns:
+            사후 조건 충족 여부
+        """
+        stat = self.stats.setdefault(name, {'runs': 0, 'retries': 0, 'failures': 0})
+        stat['runs'] += 1
+        
+        scale = self.initial_scale
+        for attempt in range(1, self.max_attempts + 1):
+            if attempt > 1:
+                stat['retries'] += 1
+                logger.info(f"  Retrying '{name}' (attempt {attempt}/{self.max_attempts}, scale {scale:.2f})")
+            
+            start = time.time()
+            if action(scale) is not False:
+                if wait_until(verify, timeout, self.poll_interval):
+                    logger.debug(f"'{name}' verified in {time.time() - start:.2f}s (attempt {attempt})")
+                    return True
+            
+            logger.warning(f"'{name}' postcondition not met (attempt {attempt}/{self.max_attempts})")
+            if rollback:
+                rollback(scale)
+            scale = min(scale * self.backoff, self.max_scale)
+        
+        stat['failures'] += 1
+        logger.error(f"'{name}' failed after {self.max_attempts} attempts")
+        return False
+    
+    def get_stats(self) -> dict:
+        """단계별 실행/재시도/실패 횟수"""
+        return {name: dict(stat) for name, stat in self.stats.items()}
@@ -0,0 +1,304 @@
+"""결과 파일 위치 찾기와 입력 ↔ 결과 인덱스
+
+자동 저장(Ctrl+S)은 Topaz 설정의 출력 폴더에 저장하므로 자동화는 결과 파일 경로를 알 수 없다.
+저장 전에 후보 출력 폴더들(설정한 Export 폴더, OUTPUT_SEARCH_DIRS, 원본 폴더)을 스냅샷하고
+저장 후 새로 생긴 파일을 찾아 입력에 배정한다.
+
+배정은 PROCESSED_SUFFIXES로 만든 정규식 하나로 결과 파일명에서 앱이 붙인 suffix부터
+뒷부분을 잘라낸 뒤(a-gigapixel-standard-2x.jpg → a) 입력 stem 사전에서 바로 찾는다.
+그래도 일치하지 않는 이름만 입력 이름 + 구분 문자(-_ .)로 시작하는 가장 긴 입력에 배정한다.
+
+찾은 결과는 append-only JSONL 인덱스에 기록하므로 이후 실행에서도
+"이 입력의 결과물은?" / "이 결과물의 원본은?"을 사전 조회 한 번으로 답할 수 있다.
+
+결과 파일이 후보 폴더 밖에 저장되는 설정이면 매번 timeout만큼 기다리게 되므로
+연속으로 miss_limit번 못 찾으면 이후에는 짧게 두 번만 확인한다.
+"""
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from loguru import logger
+
+from .file_handler import FileHandler
+
+
+# 입력 stem 바로 뒤에 올 수 있는 구분 문자 (suffix 목록에 없는 suffix를 이름 앞부분으로 배정할 때)
+STEM_SEPARATORS = '-_ .'
+
+
+def compile_suffix_pattern(suffixes: Iterable[str]) -> Optional['re.Pattern']:
+    """
+    앱이 붙이는 suffix 중 하나와 일치하는 정규식 (긴 suffix 우선, 대소문자 무시)
+    
+    Args:
+        suffixes: PROCESSED_SUFFIXES
+    
+    Returns:
+        컴파일된 정규식 (suffix가 없으면 None)
+    """
+    alternatives = sorted({s for s in suffixes if s}, key=len, reverse=True)
+    if not alternatives:
+        return None
+    return re.compile('|'.join(re.escape(s) for s in alternatives), re.IGNORECASE)
+
+
+def source_stems(suffix_pattern: Optional['re.Pattern'], output_name: str) -> List[str]:
+    """
+    결과 파일명에서 앱이 붙인 suffix 앞부분 후보 (소문자, 긴 것부터)
+    
+    입력 이름 자체에 suffix 문자열이 들어 있을 수 있으므로(mountain_4x-gigapixel.jpg)
+    suffix가 나오는 모든 위치에서 자른 앞부분을 돌려준다.
+    
+    Args:
+        suffix_pattern: compile_suffix_pattern() 결과
+        output_name: 결과 파일명
+    
+    Returns:
+        입력 stem 후보 리스트 (suffix가 없으면 빈 리스트)
+    """
+    if suffix_pattern is None:
+        return []
+    stem = output_name[:output_name.rfind('.')] if '.' in output_name else output_name
+    starts = [match.start() for match in suffix_pattern.finditer(stem) if match.start() > 0]
+    return [stem[:start].lower() for start in reversed(starts)]
+
+
+class OutputLocator:
+    """저장 전후 스냅샷 비교로 결과 파일을 찾고 인덱스에 기록"""
+    
+    def __init__(
+        self,
+        suffixes: Iterable[str],
+        candidate_dirs: Iterable[Path] = (),
+        index_path: Path = None,
+        miss_limit: int = 3
+    ):
+        """
+        Args:
+            suffixes: 앱이 결과 파일명에 붙이는 suffix 목록 (PROCESSED_SUFFIXES)
+            candidate_dirs: 원본 폴더 외에 결과 파일이 생길 수 있는 폴더
+            index_path: 입력 ↔ 결과 인덱스 파일 (None이면 기록하지 않음)
+            miss_limit: 연속으로 이 횟수만큼 못 찾으면 이후 대기 없이 확인만 함
+        """
+        self.suffix_pattern = compile_suffix_pattern(suffixes)
+        self.candidate_dirs = [Path(d) for d in candidate_dirs if d]
+        self.index_path = None
+        self.miss_limit = miss_limit
+        self._misses = 0
+        
+        # 입력 경로 -> 인덱스 항목, 결과 경로 -> 입력 경로
+        self.outputs: Dict[str, dict] = {}
+        self.sources: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._file = None
+        
+        self.stats = {'located': 0, 'not_found': 0, 'by_suffix': 0, 'by_prefix': 0}
+        
+        if index_path:
+            self.open_index(index_path)
+    
+    @staticmethod
+    def _key(path) -> str:
+        return str(Path(path).absolute())
+    
+    def open_index(self, index_path: Path):
+        """
+        인덱스 파일 열기 - 기존 기록 재생 (같은 입력은 마지막 기록이 유효), 낡은 줄이 많으면 압축
+        
+        Args:
+            index_path: 입력 ↔ 결과 인덱스 파일 (JSONL)
+        """
+        self.close()
+        self.index_path = Path(index_path)
+        lines = 0
+        if self.index_path.exists():
+            with open(self.index_path, 'r', encoding='utf-8', errors='replace') as f:
+                for line in f:
+                    try:
+                        self._remember(json.loads(line))
+                    except (ValueError, KeyError, TypeError):
+                        continue
+                    lines += 1
+        
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        if lines > 2 * len(self.outputs) + 100:
+            self._compact()
+        self._file = open(self.index_path, 'a', encoding='utf-8')
+    
+    def _remember(self, entry: dict):
+        previous = self.outputs.get(entry['input'])
+        if previous is not None:
+            self.sources.pop(previous['output'], None)
+        self.outputs[entry['input']] = entry
+        self.sources[entry['output']] = entry['input']
+    
+    def _compact(self):
+        """입력별 마지막 항목만 남겨 인덱스 다시 쓰기"""
+        temp_path = self.index_path.with_suffix('.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for entry in self.outputs.values():
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        os.replace(temp_path, self.index_path)
+        logger.debug(f"Output index compacted: {len(self.outputs)} entries")
+    
+    def directories_for(self, *input_paths: Path) -> List[Path]:
+        """입력 이미지들의 결과 파일이 생길 수 있는 폴더 (중복 제거, 순서 유지)"""
+        directories = []
+        for directory in [*self.candidate_dirs, *(Path(path).parent for path in input_paths)]:
+            if directory not in directories:
+                directories.append(directory)
+        return directories
+    
+    def snapshot(self, *input_paths: Path) -> Dict[Path, dict]:
+        """
+        저장 전 후보 폴더 스냅샷 (여러 폴더의 이미지를 한 번에 Export하는 경우 모두 전달)
+        
+        Returns:
+            {폴더: {파일명: 크기}}
+        """
+        return {directory: FileHandler.snapshot_directory(directory) for directory in self.directories_for(*input_paths)}
+    
+    def source_stems(self, output_name: str) -> List[str]:
+        """결과 파일명에서 앱이 붙인 suffix 앞부분 후보 (소문자, 긴 것부터)"""
+        return source_stems(self.suffix_pattern, output_name)
+    
+    def owner(self, output_name: str, stems: Dict[str, Path]) -> Optional[Path]:
+        """
+        결과 파일명을 입력에 배정
+        
+        Args:
+            output_name: 결과 파일명
+            stems: {입력 stem 소문자: 입력 경로}
+        
+        Returns:
+            배정된 입력 경로 (없으면 None)
+        """
+        for stem in self.source_stems(output_name):
+            if stem in stems:
+                return stems[stem]
+        
+        # 앱이 붙인 suffix가 PROCESSED_SUFFIXES에 없는 경우: stem 바로 뒤가 구분 문자여야 함
+        # (img1이 img10-gigapixel.jpg를 가져가지 않도록)
+        name = Path(output_name).stem.lower()
+        owners = [
+            key for key in stems
+            if name.startswith(key) and (len(name) == len(key) or name[len(key)] in STEM_SEPARATORS)
+        ]
+        if owners:
+            return stems[max(owners, key=len)]
+        return None
+    
+    def locate(self, input_path: Path, before: Dict[Path, dict], timeout: float = 10, interval: float = 0.25) -> Optional[Path]:
+        """
+        저장 후 후보 폴더에서 입력 이미지의 새 결과 파일 찾기 (크기가 두 번 같으면 완료)
+        
+        Args:
+            input_path: 입력 이미지 경로
+            before: snapshot() 결과
+            timeout: 최대 대기 시간 (초)
+            interval: 다시 확인하기 전 대기 시간 (초)
+        
+        Returns:
+            결과 파일 경로 (찾지 못하면 None)
+        """
+        input_path = Path(input_path)
+        stems = {input_path.stem.lower(): input_path}
+        last_sizes = {}
+        if self._misses >= self.miss_limit:
+            timeout = interval
+        deadline = time.time() + timeout
+        
+        while True:
+            for directory, previous in before.items():
+                for name, size in FileHandler.snapshot_directory(directory).items():
+                    if name in previous or name == input_path.name or size == 0:
+                        continue
+                    if self.owner(name, stems) is None:
+                        continue
+                    candidate = directory / name
+                    if last_sizes.get(candidate) == size:
+                        self._misses = 0
+                        self.record(input_path, candidate, size)
+                        return candidate
+                    last_sizes[candidate] = size
+            
+            if time.time() >= deadline:
+                break
+            time.sleep(interval)
+        
+        self.stats['not_found'] += 1
+        self._misses += 1
+        logger.info(f"  Output for {input_path.name} not found in {', '.join(str(d) for d in before)}")
+        if self._misses == self.miss_limit:
+            logger.warning(f"Outputs not found {self.miss_limit} times in a row; "
+                           f"no longer waiting for them (set OUTPUT_SEARCH_DIRS to the Topaz output folder)")
+        return None
+    
+    def record(self, input_path: Path, output_path: Path, size: int = None):
+        """
+        입력 ↔ 결과 인덱스에 기록
+        
+        Args:
+            input_path: 입력 이미지 경로
+            output_path: 결과 파일 경로
+            size: 결과 파일 크기 (바이트)
+        """
+        entry = {
+            'input': self._key(input_path),
+            'output': self._key(output_path),
+            'size': size,
+            'recorded_at': datetime.now().isoformat(),
+        }
+        by_suffix = Path(input_path).stem.lower() in self.source_stems(Path(output_path).name)
+        with self._lock:
+            self.stats['located'] += 1
+            self.stats['by_suffix' if by_suffix else 'by_prefix'] += 1
+            self._append(entry)
+        logger.debug(f"  Output located: {Path(input_path).name} -> {output_path}")
+    
+    def moved(self, input_path: Path, output_path: Path):
+        """
+        후처리로 결과 파일이 옮겨진 경우 인덱스 갱신 (찾은 횟수에는 포함하지 않음)
+        
+        Args:
+            input_path: 입력 이미지 경로
+            output_path: 옮겨진 결과 파일 경로
+        """
+        previous = self.outputs.get(self._key(input_path))
+        if previous is None or previous['output'] == self._key(output_path):
+            return
+        entry = dict(previous, output=self._key(output_path), recorded_at=datetime.now().isoformat())
+        with self._lock:
+            self._append(entry)
+    
+    def _append(self, entry: dict):
+        """항목 반영 후 인덱스 파일에 한 줄 추가 (self._lock 안에서 호출)"""
+        self._remember(entry)
+        if self._file is not None:
+            self._file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            self._file.flush()
+    
+    def output_of(self, input_path) -> Optional[str]:
+        """입력 이미지의 마지막 결과 파일 경로"""
+        entry = self.outputs.get(self._key(input_path))
+        return entry['output'] if entry else None
+    
+    def source_of(self, output_path) -> Optional[str]:
+        """결과 파일의 원본 입력 경로"""
+        return self.sources.get(self._key(output_path))
+    
+    def get_stats(self) -> dict:
+        """찾은/못 찾은 횟수, 배정 방식별 횟수, 인덱스 크기"""
+        stats = dict(self.stats)
+        stats['indexed'] = len(self.outputs)
+        return stats
+    
+    def close(self):
+        """인덱스 파일 닫기"""
+        if self._file is not None and not self._file.closed:
+            self._file.close()
@@ -0,0 +1,158 @@
+"""지각 해시(perceptual hash) 기반 유사 이미지 그룹화
+
+재인코딩이나 메타데이터만 다른 이미지는 내용 해시가 달라도 dHash가 거의 같다.
+모든 입력의 dHash를 프로세스 풀에서 계산하고, 해밍 거리가 임계값 이하인
+이미지끼리 묶어 그룹마다 대표 한 장만 Topaz로 보낸다.
+
+그룹화는 다중 인덱스 해시 테이블로 후보만 비교하므로 전체 쌍 비교(O(n²)) 없이
+10만 장 규모도 처리할 수 있다.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+from loguru import logger
+from PIL import Image
+
+# dHash 크기 (hash_size × hash_size 비트)
+HASH_SIZE = 8
+
+
+def dhash(image_path: Path, hash_size: int = HASH_SIZE) -> Optional[int]:
+    """
+    차이 해시(dHash) 계산
+    
+    흑백으로 (hash_size+1) × hash_size 크기로 줄인 뒤 가로로 인접한 픽셀의
+    밝기 대소 관계를 비트로 만든다. JPEG는 draft 모드로 축소 디코딩한다.
+    
+    Args:
+        image_path: 이미지 경로
+        hash_size: 해시 한 변의 크기
+    
+    Returns:
+        hash_size² 비트 정수 (읽기 실패 시 None)
+    """
+    try:
+        with Image.open(image_path) as img:
+            img.draft('L', (hash_size * 8, hash_size * 8))
+            small = img.convert('L').resize((hash_size + 1, hash_size), Image.LANCZOS)
+            pixels = list(small.getdata())
+    except Exception:
+        return None
+    
+    value = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+
+def hamming(a: int, b: int) -> int:
+    """두 해시의 해밍 거리"""
+    return bin(a ^ b).count('1')
+
+
+def compute_hashes(image_paths: List[Path], workers: int = None) -> Dict[Path, Optional[int]]:
+    """
+    여러 이미지의 dHash를 프로세스 풀에서 계산
+    
+    Args:
+        image_paths: 이미지 경로 리스트
+        workers: 프로세스 수 (None이면 CPU 수)
+    
+    Returns:
+        {이미지 경로: 해시 또는 None}
+    """
+    image_paths = list(image_paths)
+    chunksize = max(1, len(image_paths) // ((workers or 4) * 8))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        hashes = executor.map(dhash, image_paths, chunksize=chunksize)
+        return dict(zip(image_paths, hashes))
+
+
+class MultiIndexHashTable:
+    """
+    해밍 거리 검색용 다중 인덱스 해시 테이블
+    
+    해시를 (threshold + 1)개 구간으로 나누면, 거리가 threshold 이하인 두 해시는
+    비둘기집 원리에 따라 적어도 한 구간이 정확히 같다. 구간별 딕셔너리에서
+    같은 값을 가진 후보만 모아 실제 거리를 확인하므로 전체 비교가 필요 없다.
+    """
+    
+    def __init__(self, threshold: int, bits: int = HASH_SIZE * HASH_SIZE):
+        """
+        Args:
+            threshold: 검색할 최대 해밍 거리
+            bits: 해시 비트 수
+        """
+        self.threshold = threshold
+        segments = min(threshold + 1, bits)
+        
+        # (시프트, 마스크) - 구간 폭은 최대한 균등하게
+        self.segments = []
+        start = 0
+        for idx in range(segments):
+            width = bits // segments + (1 if idx < bits % segments else 0)
+            self.segments.append((start, (1 << width) - 1))
+            start += width
+        
+        self.tables: List[Dict[int, list]] = [{} for _ in self.segments]
+    
+    def add(self, value: int, item):
+        """해시와 항목 추가"""
+        for table, (shift, mask) in zip(self.tables, self.segments):
+            table.setdefault((value >> shift) & mask, []).append((value, item))
+    
+    def search(self, value: int) -> list:
+        """해밍 거리가 threshold 이하인 항목 검색 (중복 제거)"""
+        found = {}
+        for table, (shift, mask) in zip(self.tables, self.segments):
+            for candidate, item in table.get((value >> shift) & mask, ()):
+                if id(item) not in found and hamming(value, candidate) <= self.threshold:
+                    found[id(item)] = item
+        return list(found.values())
+
+
+def group_near_duplicates(
+    image_paths: List[Path],
+    hashes: Dict[Path, Optional[int]],
+    threshold: int
+) -> Dict[Path, List[Path]]:
+    """
+    유사 이미지 그룹화 (입력 순서상 먼저 나온 이미지가 대표)
+    
+    대표 이미지와의 거리만 비교하므로 그룹이 사슬처럼 번지지 않는다.
+    해시를 계산하지 못한 이미지는 항상 단독 그룹이다.
+    
+    Args:
+        image_paths: 이미지 경로 리스트 (처리 순서)
+        hashes: compute_hashes() 결과
+        threshold: 같은 그룹으로 볼 최대 해밍 거리
+    
+    Returns:
+        {대표 이미지: [중복 이미지, ...]} (중복이 없으면 빈 리스트)
+    """
+    index = MultiIndexHashTable(threshold)
+    groups: Dict[Path, List[Path]] = {}
+    order = {path: idx for idx, path in enumerate(image_paths)}
+    
+    for path in image_paths:
+        value = hashes.get(path)
+        if value is None:
+            groups[path] = []
+            continue
+        
+        matches = index.search(value)
+        if matches:
+            # 가장 먼저 나온 대표에 배정
+            representative = min(matches, key=order.get)
+            groups[representative].append(path)
+        else:
+            index.add(value, path)
+            groups[path] = []
+    
+    duplicates = sum(len(members) for members in groups.values())
+    if duplicates:
+        logger.info(f"Near-duplicate check: {duplicates} duplicates in "
+                    f"{sum(1 for members in groups.values() if members)} groups (threshold {threshold})")
+    return groups
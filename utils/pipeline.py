@@ -0,0 +1,139 @@
+"""asyncio 단계 파이프라인
+
+이미지를 여러 단계(검사 → 준비 → GUI 조작 → 완료 감지 → 검증 → 기록)에 흘려보낸다.
+단계 사이는 크기가 제한된 큐로 연결되어 앞 단계가 GUI보다 너무 앞서 나가지 않고,
+각 단계는 동시에 처리할 수 있는 개수(concurrency)만큼 작업을 겹쳐 실행하되
+출력은 입력 순서를 유지한다.
+
+GUI 단계는 concurrency=1로 두어 직렬로 실행하고, 나머지 CPU/IO 단계는 그 앞뒤에서
+동시에 진행되므로 전체 처리량은 앱 처리 속도에만 묶인다.
+단계 함수는 코루틴이며, 블로킹 작업은 스레드/프로세스 풀(run_in_executor)로 넘겨야 한다.
+"""
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+from loguru import logger
+
+# 스트림 끝 표시
+_STOP = object()
+
+
+class Stage:
+    """파이프라인 단계"""
+    
+    def __init__(self, name: str, func: Callable[[dict], Awaitable[Optional[dict]]], concurrency: int = 1):
+        """
+        Args:
+            name: 단계 이름 (통계용)
+            func: 항목을 받아 다음 단계로 넘길 항목을 반환하는 코루틴 함수 (None이면 항목 제외)
+            concurrency: 동시에 처리할 최대 항목 수
+        """
+        self.name = name
+        self.func = func
+        self.concurrency = max(1, concurrency)
+        
+        self.items = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+
+
+class Pipeline:
+    """순서를 유지하는 비동기 단계 파이프라인"""
+    
+    def __init__(
+        self,
+        stages: List[Stage],
+        queue_size: int = 4,
+        on_error: Callable[[str, dict, Exception], None] = None
+    ):
+        """
+        Args:
+            stages: 단계 리스트 (처리 순서)
+            queue_size: 단계 사이 큐의 최대 크기
+            on_error: 단계 함수가 예외를 낸 항목을 받을 함수 on_error(단계 이름, 항목, 예외)
+        """
+        self.stages = stages
+        self.queue_size = max(1, queue_size)
+        self.on_error = on_error
+        self.wall_seconds = 0.0
+    
+    async def run(self, items: Iterable[dict]):
+        """
+        모든 항목을 파이프라인에 흘려보내고 마지막 단계까지 끝나면 반환
+        
+        Args:
+            items: 첫 단계에 넣을 항목들
+        """
+        queues = [asyncio.Queue(maxsize=self.queue_size) for _ in self.stages]
+        outboxes = queues[1:] + [None]
+        
+        async def feed():
+            for item in items:
+                await queues[0].put(item)
+            await queues[0].put(_STOP)
+        
+        start_time = time.perf_counter()
+        await asyncio.gather(
+            feed(),
+            *(self._run_stage(stage, inbox, outbox) for stage, inbox, outbox in zip(self.stages, queues, outboxes))
+        )
+        self.wall_seconds = time.perf_counter() - start_time
+    
+    async def _run_stage(self, stage: Stage, inbox: asyncio.Queue, outbox: Optional[asyncio.Queue]):
+        """단계 하나 실행: 최대 concurrency개를 겹쳐 실행하고 입력 순서대로 내보냄"""
+        semaphore = asyncio.Semaphore(stage.concurrency)
+        in_flight = asyncio.Queue(maxsize=stage.concurrency)
+        
+        async def launch():
+            while True:
+                item = await inbox.get()
+                if item is _STOP:
+                    await in_flight.put(_STOP)
+                    return
+                await in_flight.put(asyncio.ensure_future(self._call(stage, semaphore, item)))
+        
+        async def collect():
+            while True:
+                task = await in_flight.get()
+                if task is _STOP:
+                    break
+                result = await task
+                if result is not None and outbox is not None:
+                    await outbox.put(result)
+            if outbox is not None:
+                await outbox.put(_STOP)
+        
+        await asyncio.gather(launch(), collect())
+    
+    async def _call(self, stage: Stage, semaphore: asyncio.Semaphore, item: dict) -> Optional[dict]:
+        """단계 함수 호출 (예외는 on_error로 넘기고 항목 제외)"""
+        async with semaphore:
+            start_time = time.perf_counter()
+            try:
+                return await stage.func(item)
+            except Exception as e:
+                stage.errors += 1
+                logger.error(f"[pipeline] {stage.name} failed for {item.get('path')}: {e}")
+                logger.exception("Full traceback:")
+                if self.on_error:
+                    self.on_error(stage.name, item, e)
+                return None
+            finally:
+                stage.items += 1
+                stage.busy_seconds += time.perf_counter() - start_time
+    
+    def get_stats(self) -> Dict[str, dict]:
+        """
+        단계별 처리 항목 수, 작업 시간, 가동률 (작업 시간 / 전체 시간)
+        
+        GUI 단계 가동률이 100%에 가까우면 처리량이 앱 속도에만 묶여 있다는 뜻이다.
+        """
+        stats = {}
+        for stage in self.stages:
+            stats[stage.name] = {
+                'items': stage.items,
+                'errors': stage.errors,
+                'busy_seconds': round(stage.busy_seconds, 1),
+                'utilization': round(stage.busy_seconds / self.wall_seconds, 3) if self.wall_seconds else 0.0,
+            }
+        return stats
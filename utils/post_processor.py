@@ -0,0 +1,175 @@
+"""결과물 후처리 (GUI 루프와 겹쳐 실행)
+
+Export가 끝난 결과물의 검증, 체크섬, 메타데이터 복사, 최종 위치 이동을 스레드 풀에서 처리한다.
+메인 스레드는 작업을 넘기자마자 다음 이미지의 GUI 조작으로 넘어가므로 이미지당 처리 시간이
+늘어나지 않고, 결과는 완료되는 대로 콜백으로 실행 기록에 반영된다.
+
+메타데이터 복사는 원본 파일의 접근/수정 시각만 결과물에 옮긴다.
+(EXIF를 다시 넣으려면 JPEG를 재인코딩해야 하므로 하지 않는다)
+"""
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+from loguru import logger
+from PIL import Image
+
+from . import image_info  # noqa: F401  (대형 결과물 검증용 decompression bomb 한도)
+from .result_cache import hash_file
+
+
+def match_outputs(image_paths: List[Path], output_paths: List[Path]) -> Dict[Path, Path]:
+    """
+    결과 파일을 파일명이 가장 길게 일치하는 입력에 배정 (a.jpg -> a_upscaled.jpg)
+    
+    Args:
+        image_paths: 입력 이미지 경로 리스트
+        output_paths: 결과 파일 경로 리스트
+    
+    Returns:
+        {입력 경로: 결과 파일 경로}
+    """
+    stems = {path.stem.lower(): path for path in image_paths}
+    matched = {}
+    for output_path in output_paths:
+        owners = [stem for stem in stems if output_path.stem.lower().startswith(stem)]
+        if owners:
+            matched.setdefault(stems[max(owners, key=len)], output_path)
+    return matched
+
+
+class PostProcessor:
+    """결과물 후처리 스레드 풀"""
+    
+    def __init__(
+        self,
+        workers: int = 2,
+        destination_dir: Path = None,
+        checksum: bool = True,
+        copy_times: bool = True
+    ):
+        """
+        Args:
+            workers: 후처리 스레드 수
+            destination_dir: 검증된 결과물을 옮길 최종 폴더 (None이면 이동 안 함)
+            checksum: 결과물 체크섬(BLAKE2b) 계산 여부
+            copy_times: 원본의 접근/수정 시각을 결과물에 복사할지 여부
+        """
+        self.destination_dir = Path(destination_dir) if destination_dir else None
+        self.checksum = checksum
+        self.copy_times = copy_times
+        
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='postprocess')
+        self._futures: List[Future] = []
+        self._lock = threading.Lock()
+        self.stats = {'verified': 0, 'failed': 0, 'moved': 0}
+    
+    def submit(
+        self,
+        input_path: Path,
+        output: Union[Path, Callable[[], Optional[Path]]],
+        on_result: Callable[[dict], None] = None
+    ) -> Future:
+        """
+        결과물 후처리 등록 (바로 반환)
+        
+        Args:
+            input_path: 입력 이미지 경로
+            output: 결과 파일 경로, 또는 결과 파일을 찾아 반환하는 함수 (후처리 스레드에서 호출)
+            on_result: 후처리가 끝나면 결과 딕셔너리로 호출할 함수
+        
+        Returns:
+            Future (결과 딕셔너리)
+        """
+        future = self._executor.submit(self._process, Path(input_path), output)
+        if on_result is not None:
+            future.add_done_callback(lambda f: on_result(f.result()))
+        with self._lock:
+            self._futures.append(future)
+        return future
+    
+    def _process(self, input_path: Path, output) -> dict:
+        """
+        결과물 하나 후처리 (검증 → 체크섬 → 시각 복사 → 이동)
+        
+        Returns:
+            {'input', 'output', 'ok', 'error', 'size', 'dimensions', 'checksum', 'seconds'}
+        """
+        start_time = time.time()
+        result = {
+            'input': str(input_path), 'output': None, 'ok': False, 'error': None,
+            'size': None, 'dimensions': None, 'checksum': None, 'seconds': None,
+        }
+        
+        try:
+            output_path = output() if callable(output) else output
+            if output_path is None:
+                raise FileNotFoundError("output not found")
+            output_path = Path(output_path)
+            result['output'] = str(output_path)
+            
+            # 검증: 비어 있지 않고 이미지로 읽히는지
+            result['size'] = output_path.stat().st_size
+            if result['size'] == 0:
+                raise ValueError("output is empty")
+            with Image.open(output_path) as img:
+                result['dimensions'] = img.size
+                img.verify()
+            
+            if self.checksum:
+                result['checksum'] = hash_file(output_path)
+            
+            if self.copy_times:
+                stat = input_path.stat()
+                os.utime(output_path, (stat.st_atime, stat.st_mtime))
+            
+            if self.destination_dir:
+                output_path = self._move(output_path)
+                result['output'] = str(output_path)
+            
+            result['ok'] = True
+        except Exception as e:
+            result['error'] = f"{type(e).__name__}: {e}"
+        
+        result['seconds'] = round(time.time() - start_time, 3)
+        with self._lock:
+            self.stats['verified' if result['ok'] else 'failed'] += 1
+        
+        if result['ok']:
+            logger.debug(f"  [post] {input_path.name}: verified {Path(result['output']).name}")
+        else:
+            logger.warning(f"  [post] {input_path.name}: {result['error']}")
+        return result
+    
+    def _move(self, output_path: Path) -> Path:
+        """결과물을 최종 폴더로 이동 (같은 이름이 있으면 번호를 붙임)"""
+        self.destination_dir.mkdir(parents=True, exist_ok=True)
+        destination = self.destination_dir / output_path.name
+        counter = 1
+        while destination.exists():
+            destination = self.destination_dir / f"{output_path.stem}_{counter}{output_path.suffix}"
+            counter += 1
+        shutil.move(str(output_path), str(destination))
+        with self._lock:
+            self.stats['moved'] += 1
+        return destination
+    
+    def pending_count(self) -> int:
+        """아직 끝나지 않은 후처리 수"""
+        with self._lock:
+            return sum(1 for future in self._futures if not future.done())
+    
+    def get_stats(self) -> dict:
+        """검증 성공/실패/이동 횟수"""
+        with self._lock:
+            return dict(self.stats)
+    
+    def close(self):
+        """남은 후처리를 모두 마치고 스레드 풀 종료"""
+        pending = self.pending_count()
+        if pending:
+            logger.info(f"Waiting for {pending} post-processing tasks...")
+        self._executor.shutdown(wait=True)
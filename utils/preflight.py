@@ -0,0 +1,169 @@
+"""입력 이미지 사전 검사 (pre-flight)
+
+손상되었거나 지원하지 않는 파일은 GUI에서 열기를 시도하고 로드 확인 타임아웃(15초)까지
+기다린 뒤에야 실패가 드러난다. GUI 루프 전에 프로세스 풀에서 헤더를 읽어
+형식, 크기, 잘림(truncation), 색상 모드를 확인하고 문제가 있는 파일은 사유와 함께 제외한다.
+
+결과는 입력 순서대로 스트리밍되므로 앞쪽 파일이 검사되는 즉시 GUI 처리를 시작할 수 있다.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator
+from PIL import Image
+
+# 대형 이미지용 decompression bomb 한도(IMAGE_MAX_PIXELS)를 워커 프로세스에도 적용
+from . import image_info  # noqa: F401
+
+# Topaz 앱이 여는 형식 (PIL 형식 이름)
+SUPPORTED_FORMATS = {'JPEG', 'MPO', 'PNG', 'TIFF', 'BMP', 'WEBP'}
+
+# 형식별 파일 끝 표식 (끝부분에 없으면 전송/복사 중 잘렸을 수 있음 → 실제 디코딩으로 확인)
+# 모션 포토/제조사 트레일러처럼 끝 표식 뒤에 데이터가 붙은 정상 JPEG도 있다
+END_MARKERS = {
+    'JPEG': b'\xff\xd9',
+    'MPO': b'\xff\xd9',
+    'PNG': b'IEND',
+}
+TAIL_BYTES = 4096
+
+
+def _tiff_data_end(img) -> int:
+    """TIFF 스트립/타일 데이터가 끝나는 위치 (첫 페이지 기준)"""
+    tags = img.tag_v2
+    for offsets_tag, counts_tag in ((273, 279), (324, 325)):  # Strip, Tile
+        offsets, counts = tags.get(offsets_tag), tags.get(counts_tag)
+        if offsets and counts:
+            if isinstance(offsets, int):
+                offsets, counts = (offsets,), (counts,)
+            return max(offset + count for offset, count in zip(offsets, counts))
+    return 0
+
+
+def inspect_image(
+    image_path: Path,
+    min_side: int = 16,
+    reject_modes: tuple = ()
+) -> dict:
+    """
+    이미지 파일 한 개 검사 (프로세스 풀 작업 함수)
+    
+    Args:
+        image_path: 이미지 경로
+        min_side: 허용하는 최소 너비/높이 (픽셀)
+        reject_modes: 제외할 PIL 색상 모드 (예: ('1', 'P'))
+    
+    Returns:
+        {'path', 'ok', 'reason', 'format', 'size', 'mode', 'warning'}
+    """
+    data_end = 0
+    result = {
+        'path': image_path, 'ok': False, 'reason': None, 'format': None, 'size': None, 'mode': None, 'warning': None
+    }
+    
+    try:
+        file_size = os.path.getsize(image_path)
+    except OSError as e:
+        result['reason'] = f"unreadable ({e.strerror})"
+        return result
+    if file_size == 0:
+        result['reason'] = "empty file"
+        return result
+    
+    try:
+        with Image.open(image_path) as img:
+            result['format'] = img.format
+            result['size'] = img.size
+            result['mode'] = img.mode
+            if img.format == 'TIFF':
+                data_end = _tiff_data_end(img)
+            elif img.format not in END_MARKERS:
+                # 끝 표식이 없는 형식은 구조 검사로 잘림 확인
+                img.verify()
+    except Exception as e:
+        result['reason'] = f"cannot decode header ({type(e).__name__}: {e})"
+        return result
+    
+    if result['format'] not in SUPPORTED_FORMATS:
+        result['reason'] = f"unsupported format {result['format']}"
+        return result
+    
+    width, height = result['size']
+    if min(width, height) < min_side:
+        result['reason'] = f"too small ({width}x{height})"
+        return result
+    
+    if result['mode'] in reject_modes:
+        result['reason'] = f"unsupported color mode {result['mode']}"
+        return result
+    
+    if result['format'] == 'TIFF' and data_end > file_size:
+        result['reason'] = f"truncated (image data ends at {data_end}, file is {file_size} bytes)"
+        return result
+    
+    marker = END_MARKERS.get(result['format'])
+    if marker:
+        with open(image_path, 'rb') as f:
+            f.seek(max(0, file_size - TAIL_BYTES))
+            tail = f.read()
+        if marker not in tail:
+            # 끝부분에 표식이 없을 때만 전체 디코딩 (잘린 파일이면 load()가 실패)
+            try:
+                with Image.open(image_path) as img:
+                    img.load()
+            except Exception as e:
+                result['reason'] = f"truncated (end marker missing, decode failed: {e})"
+                return result
+            result['warning'] = f"end marker not in last {TAIL_BYTES} bytes (trailing data after image)"
+    
+    result['ok'] = True
+    return result
+
+
+class Preflight:
+    """프로세스 풀로 입력 이미지를 검사하고 결과를 입력 순서대로 스트리밍"""
+    
+    def __init__(self, workers: int = None, min_side: int = 16, reject_modes: tuple = ()):
+        """
+        Args:
+            workers: 프로세스 수 (None이면 CPU 수)
+            min_side: 허용하는 최소 너비/높이 (픽셀)
+            reject_modes: 제외할 PIL 색상 모드
+        """
+        self.workers = workers
+        self.min_side = min_side
+        self.reject_modes = tuple(reject_modes)
+    
+    def stream(self, image_paths: Iterable[Path]) -> Iterator[dict]:
+        """
+        검사 결과를 입력 순서대로 하나씩 반환
+        
+        모든 작업을 먼저 제출하고 앞쪽 결과가 준비되는 대로 내보내므로,
+        호출 측은 첫 결과를 받자마자 처리를 시작할 수 있다.
+        
+        Args:
+            image_paths: 이미지 경로들
+        
+        Yields:
+            inspect_image() 결과
+        """
+        image_paths = list(image_paths)
+        if not image_paths:
+            return
+        
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = [
+                executor.submit(inspect_image, path, self.min_side, self.reject_modes)
+                for path in image_paths
+            ]
+            try:
+                for path, future in zip(image_paths, futures):
+                    try:
+                        yield future.result()
+                    except Exception as e:
+                        yield {'path': path, 'ok': False, 'reason': f"inspection failed ({e})",
+                               'format': None, 'size': None, 'mode': None, 'warning': None}
+            finally:
+                # 중간에 멈추면 남은 검사는 취소
+                for future in futures:
+                    future.cancel()
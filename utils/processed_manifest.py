@@ -0,0 +1,237 @@
+"""처리 기록 (processed manifest)
+
+"이미 처리한 파일인가"를 파일명 suffix가 아니라 파일 자체(절대 경로 + 크기 + 수정 시각)로 판별한다.
+처리를 마친 입력과 찾은 결과물을 기록해 두면 다음 실행에서 둘 다 제외되므로
+"mountain_ai_4x.jpg" 같은 정상 이름을 결과물로 오인하지 않고, 결과물이 원본 옆에 없어도 된다.
+
+키는 (경로, 크기, 수정 시각)의 BLAKE2b 16바이트 다이제스트이며, 파일에는 다이제스트만 이어 붙인다
+(항목당 16바이트, append-only). 메모리에서는
+    - 정확한 집합: 항목 수가 max_exact 이하일 때 사용 (오탐 없음)
+    - Bloom filter: 항상 유지, 항목이 max_exact를 넘으면 집합을 버리고 이것만으로 판별
+      (새 파일을 처리된 것으로 잘못 볼 확률 false_positive_rate, 항목당 약 3.6바이트(1e-6 기준))
+둘 다 조회 비용이 항목 수와 무관하다.
+
+파일이 수정되면(크기/수정 시각 변경) 키가 달라지므로 다시 처리 대상이 된다.
+기록이 없는 예전 결과물은 같은 폴더에 원본(suffix 앞부분과 이름이 같은 이미지)이 있을 때만 제외한다.
+"""
+import hashlib
+import math
+import os
+import threading
+from pathlib import Path
+from typing import Iterable, List, Optional
+from loguru import logger
+
+from .output_locator import source_stems
+
+DIGEST_SIZE = 16
+
+
+def manifest_key(path, size: int, mtime_ns: int) -> bytes:
+    """
+    파일 키 (절대 경로는 normcase로 정규화 - Windows에서 대소문자 무시)
+    
+    Args:
+        path: 파일 경로
+        size: 파일 크기 (바이트)
+        mtime_ns: 수정 시각 (ns)
+    
+    Returns:
+        16바이트 다이제스트
+    """
+    text = f"{os.path.normcase(os.path.abspath(path))}\0{size}\0{mtime_ns}"
+    return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=DIGEST_SIZE).digest()
+
+
+class BloomFilter:
+    """고정 크기 Bloom filter (키가 이미 균일한 다이제스트이므로 이중 해싱으로 위치 계산)"""
+    
+    def __init__(self, capacity: int, error_rate: float):
+        """
+        Args:
+            capacity: 예상 항목 수
+            error_rate: capacity개를 넣었을 때의 오탐률
+        """
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+    
+    def _positions(self, digest: bytes):
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:16], 'little') | 1
+        size = self.size
+        return [(h1 + i * h2) % size for i in range(self.hashes)]
+    
+    def add(self, digest: bytes):
+        bits = self.bits
+        for position in self._positions(digest):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+    
+    def __contains__(self, digest: bytes) -> bool:
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(digest))
+
+
+class ProcessedManifest:
+    """처리한 입력/결과물 기록 (정확한 집합 + Bloom filter)"""
+    
+    def __init__(self, path: Path, max_exact: int = 1_000_000, false_positive_rate: float = 1e-6):
+        """
+        Args:
+            path: 기록 파일 경로 (다이제스트를 이어 붙인 바이너리)
+            max_exact: 정확한 집합을 유지할 최대 항목 수 (넘으면 Bloom filter만 사용)
+            false_positive_rate: Bloom filter 오탐률
+        """
+        self.path = Path(path)
+        self.max_exact = max_exact
+        self.false_positive_rate = false_positive_rate
+        self._lock = threading.Lock()
+        
+        self.exact: Optional[set] = set()
+        self.entries = 0
+        self.stats = {'lookups': 0, 'recorded': 0, 'skipped_recorded': 0, 'skipped_derived': 0}
+        
+        digests = self._read_digests()
+        self.entries = len(digests)
+        self._build_bloom(max(2 * self.entries, 100_000), digests)
+        if self.entries <= max_exact:
+            self.exact.update(digests)
+        else:
+            self.exact = None
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'ab')
+        logger.debug(f"Processed manifest: {self.entries} entries ({'exact' if self.exact is not None else 'bloom only'})")
+    
+    def _read_digests(self) -> List[bytes]:
+        if not self.path.exists():
+            return []
+        data = self.path.read_bytes()
+        usable = len(data) - len(data) % DIGEST_SIZE  # 쓰다 끊긴 마지막 항목은 무시
+        return [data[i:i + DIGEST_SIZE] for i in range(0, usable, DIGEST_SIZE)]
+    
+    def _build_bloom(self, capacity: int, digests: Iterable[bytes]):
+        self.bloom = BloomFilter(capacity, self.false_positive_rate)
+        for digest in digests:
+            self.bloom.add(digest)
+    
+    def _contains(self, digest: bytes) -> bool:
+        self.stats['lookups'] += 1
+        if self.exact is not None:
+            return digest in self.exact
+        return digest in self.bloom
+    
+    def contains_entry(self, entry: os.DirEntry) -> bool:
+        """scandir 항목이 기록에 있는지 (DirEntry/ScanCache 항목에 캐시된 stat 사용)"""
+        stat = entry.stat()
+        return self._contains(manifest_key(entry.path, stat.st_size, stat.st_mtime_ns))
+    
+    def contains(self, path) -> bool:
+        """파일이 기록에 있는지 (파일이 없으면 False)"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        return self._contains(manifest_key(path, stat.st_size, stat.st_mtime_ns))
+    
+    def add_many(self, paths: Iterable) -> int:
+        """
+        파일들을 현재 크기/수정 시각으로 기록 (없는 파일과 이미 있는 항목은 건너뜀)
+        
+        Args:
+            paths: 파일 경로들
+        
+        Returns:
+            새로 기록한 항목 수
+        """
+        digests = []
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            digests.append(manifest_key(path, stat.st_size, stat.st_mtime_ns))
+        
+        with self._lock:
+            new = [digest for digest in digests if not self._contains(digest)]
+            if not new:
+                return 0
+            self._file.write(b''.join(new))
+            self._file.flush()
+            for digest in new:
+                self._remember(digest)
+            self.stats['recorded'] += len(new)
+        return len(new)
+    
+    def add(self, path) -> bool:
+        """파일 하나 기록 (새로 기록했으면 True)"""
+        return self.add_many([path]) > 0
+    
+    def _remember(self, digest: bytes):
+        """메모리 구조에 반영 (self._lock 안에서 호출)"""
+        self.entries += 1
+        if self.exact is not None:
+            self.exact.add(digest)
+            if self.entries > self.max_exact:
+                logger.info(f"Processed manifest over {self.max_exact} entries, switching to Bloom filter only")
+                self.exact = None
+        
+        if self.bloom.count >= self.bloom.capacity:
+            # 오탐률 유지를 위해 두 배 크기로 다시 만듦 (방금 쓴 항목까지 기록 파일에서 재생)
+            self._build_bloom(max(2 * self.bloom.capacity, 2 * self.entries), self._read_digests())
+        else:
+            self.bloom.add(digest)
+    
+    def filter_unprocessed(self, entries: Iterable[os.DirEntry], suffix_pattern=None) -> List[str]:
+        """
+        scandir 항목 중 처리 대상만 남김
+        
+        1. 기록에 있는 파일(처리한 입력, 찾은 결과물) 제외
+        2. 기록이 없는 예전 결과물: 이름에서 suffix 앞부분을 잘랐을 때 같은 폴더의 다른 이미지와 같으면 제외
+        
+        Args:
+            entries: 이미지 파일 DirEntry들 (ScanCache.scan 항목도 가능)
+            suffix_pattern: compile_suffix_pattern(PROCESSED_SUFFIXES) (None이면 2단계 생략)
+        
+        Returns:
+            처리 대상 경로 문자열 리스트 (나열 순서)
+        """
+        entries = list(entries)
+        stems = set()
+        if suffix_pattern is not None:
+            for entry in entries:
+                name = entry.name
+                stems.add((os.path.dirname(entry.path), name[:name.rfind('.')].lower()))
+        
+        remaining = []
+        for entry in entries:
+            if self.contains_entry(entry):
+                self.stats['skipped_recorded'] += 1
+                continue
+            if suffix_pattern is not None:
+                folder = os.path.dirname(entry.path)
+                if any((folder, stem) in stems for stem in source_stems(suffix_pattern, entry.name)):
+                    self.stats['skipped_derived'] += 1
+                    continue
+            remaining.append(entry.path)
+        return remaining
+    
+    def get_stats(self) -> dict:
+        """항목 수, 판별 방식, 조회/기록/제외 횟수"""
+        stats = dict(self.stats)
+        stats.update({
+            'entries': self.entries,
+            'mode': 'exact' if self.exact is not None else 'bloom',
+            'bloom_bytes': len(self.bloom.bits),
+            'bloom_hashes': self.bloom.hashes,
+        })
+        return stats
+    
+    def close(self):
+        """기록 파일 닫기"""
+        if not self._file.closed:
+            self._file.close()
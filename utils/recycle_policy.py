@@ -0,0 +1,201 @@
+"""앱 재활용(주기적 재시작) 정책
+
+장시간 실행에서 앱 메모리가 늘어나면 이미지당 처리 시간도 점점 길어진다.
+최근 이미지들의 처리 시간과 앱 메모리(RSS)를 슬라이딩 윈도우로 추적하다가
+실행 초반(새로 띄운 앱)의 기준값보다 정해진 비율 이상 나빠지면 이미지 사이에서 앱을 재시작한다.
+
+처리 시간은 해상도에 비례하므로 메가픽셀당 처리 시간(초/MP)으로 비교한다
+(--schedule sjf처럼 작은 이미지부터 처리하면 이미지당 시간은 건강한 앱에서도 계속 늘어남).
+
+재시작마다 직전 윈도우와 재시작 후 같은 개수 이미지의 평균 처리 시간을 기록해
+재시작이 처리량에 준 효과를 실행 기록에 남긴다.
+"""
+import statistics
+from collections import deque
+from typing import Iterable, List, Optional, Tuple
+from loguru import logger
+
+from .app_process import ProcessBackend
+
+
+def _per_hour(seconds: Optional[float]) -> Optional[float]:
+    """이미지당 평균 처리 시간 → 시간당 처리량"""
+    return round(3600 / seconds, 1) if seconds else None
+
+
+def _seconds_per_mp(costs: Iterable[Tuple[float, float]]) -> Optional[float]:
+    """(처리 시간, 메가픽셀) 목록의 메가픽셀당 처리 시간 (합계끼리 나눔, 없으면 None)"""
+    costs = list(costs)
+    megapixels = sum(mp for _, mp in costs)
+    if not megapixels:
+        return None
+    return sum(seconds for seconds, _ in costs) / megapixels
+
+
+class RecyclePolicy:
+    """처리 시간/메모리 증가를 감지해 앱 재시작 시점을 알려줌"""
+    
+    def __init__(
+        self,
+        backend: ProcessBackend = None,
+        window: int = 10,
+        baseline_images: int = 5,
+        slowdown: float = 0.3,
+        rss_growth: float = 0.5,
+        rss_limit_mb: float = 0,
+        max_restarts: int = 20
+    ):
+        """
+        Args:
+            backend: 앱 메모리를 읽을 프로세스 백엔드 (None이면 처리 시간만 추적)
+            window: 슬라이딩 윈도우 크기 (이미지 수)
+            baseline_images: 기준값을 잡을 실행 초반 이미지 수
+            slowdown: 윈도우의 메가픽셀당 처리 시간이 기준보다 이 비율 이상 길어지면 재시작 (0.3 = 30%)
+            rss_growth: 윈도우 평균 RSS가 기준보다 이 비율 이상 늘어나면 재시작 (0이면 사용 안 함)
+            rss_limit_mb: 윈도우 평균 RSS가 이 값(MB)을 넘으면 재시작 (0이면 사용 안 함)
+            max_restarts: 실행 한 번에 허용할 최대 재시작 횟수
+        """
+        self.backend = backend
+        self.window = max(1, window)
+        self.baseline_images = max(1, baseline_images)
+        self.slowdown = slowdown
+        self.rss_growth = rss_growth
+        self.rss_limit_mb = rss_limit_mb
+        self.max_restarts = max_restarts
+        
+        self.images = 0
+        self._baseline_durations: List[float] = []
+        self._baseline_costs: List[Tuple[float, float]] = []  # (처리 시간, 메가픽셀)
+        self._baseline_rss: List[int] = []
+        self._durations = deque(maxlen=self.window)
+        self._costs = deque(maxlen=self.window)
+        self._rss = deque(maxlen=self.window)
+        self._after: List[float] = []
+        
+        self.restarts: List[dict] = []
+    
+    @property
+    def can_restart(self) -> bool:
+        return len(self.restarts) < self.max_restarts
+    
+    @property
+    def baseline_seconds(self) -> Optional[float]:
+        """기준 이미지당 처리 시간 (중앙값)"""
+        if len(self._baseline_durations) < self.baseline_images:
+            return None
+        return statistics.median(self._baseline_durations)
+    
+    @property
+    def baseline_seconds_per_mp(self) -> Optional[float]:
+        """기준 메가픽셀당 처리 시간 (해상도를 아는 기준 이미지 합계 기준)"""
+        if len(self._baseline_durations) < self.baseline_images:
+            return None
+        return _seconds_per_mp(self._baseline_costs)
+    
+    @property
+    def baseline_rss_mb(self) -> Optional[float]:
+        """기준 앱 메모리 (MB, 중앙값)"""
+        if len(self._baseline_durations) < self.baseline_images or not self._baseline_rss:
+            return None
+        return statistics.median(self._baseline_rss) / (1024 * 1024)
+    
+    def _sample_rss(self) -> Optional[int]:
+        if self.backend is None:
+            return None
+        try:
+            sample = self.backend.sample()
+        except Exception as e:
+            logger.debug(f"RSS sample failed: {e}")
+            return None
+        return sample['rss'] if sample else None
+    
+    def observe(self, duration: float, megapixels: Optional[float] = None) -> Optional[str]:
+        """
+        성공한 이미지 하나의 처리 시간 기록 (앱 메모리는 백엔드에서 읽음)
+        
+        Args:
+            duration: 이미지 처리 시간 (초)
+            megapixels: 이미지 해상도 (None이면 처리 시간 비교에서 제외)
+        
+        Returns:
+            재시작이 필요하면 사유, 아니면 None
+        """
+        self.images += 1
+        rss = self._sample_rss()
+        
+        # 직전 재시작의 효과 측정 (재시작 후 window개)
+        if self.restarts and len(self._after) < self.window:
+            self._after.append(duration)
+            self._update_after()
+        
+        # 1. 실행 초반: 기준값 수집
+        cost = (duration, megapixels) if megapixels else None
+        if len(self._baseline_durations) < self.baseline_images:
+            self._baseline_durations.append(duration)
+            if cost:
+                self._baseline_costs.append(cost)
+            if rss:
+                self._baseline_rss.append(rss)
+            return None
+        
+        # 2. 슬라이딩 윈도우가 찰 때까지 대기 (재시작 직후에도 다시 채움)
+        self._durations.append(duration)
+        self._costs.append(cost)
+        if rss:
+            self._rss.append(rss)
+        if len(self._durations) < self.window:
+            return None
+        
+        current = _seconds_per_mp(cost for cost in self._costs if cost)
+        baseline = self.baseline_seconds_per_mp
+        if current and baseline and current > baseline * (1 + self.slowdown):
+            return (f"time per megapixel {current:.2f}s/MP is {current / baseline - 1:.0%} "
+                    f"over baseline {baseline:.2f}s/MP")
+        
+        if self._rss:
+            rss_mb = statistics.mean(self._rss) / (1024 * 1024)
+            if self.rss_limit_mb and rss_mb > self.rss_limit_mb:
+                return f"app memory {rss_mb:.0f}MB over limit {self.rss_limit_mb:.0f}MB"
+            baseline_rss = self.baseline_rss_mb
+            if self.rss_growth and baseline_rss and rss_mb > baseline_rss * (1 + self.rss_growth):
+                return f"app memory {rss_mb:.0f}MB is {rss_mb / baseline_rss - 1:.0%} over baseline {baseline_rss:.0f}MB"
+        return None
+    
+    def recycled(self, reason: str):
+        """앱 재시작 후 호출 - 재시작 기록 추가 및 윈도우 초기화"""
+        before = statistics.mean(self._durations) if self._durations else None
+        self.restarts.append({
+            'after_image': self.images,
+            'reason': reason,
+            'rss_before_mb': round(statistics.mean(self._rss) / (1024 * 1024), 1) if self._rss else None,
+            'before_avg_seconds': round(before, 2) if before else None,
+            'after_avg_seconds': None,
+            'after_images': 0,
+            'throughput_before_per_hour': _per_hour(before),
+            'throughput_after_per_hour': None,
+        })
+        self._durations.clear()
+        self._costs.clear()
+        self._rss.clear()
+        self._after = []
+    
+    def _update_after(self):
+        """마지막 재시작 기록의 재시작 후 평균 처리 시간 갱신"""
+        after = statistics.mean(self._after)
+        self.restarts[-1].update({
+            'after_avg_seconds': round(after, 2),
+            'after_images': len(self._after),
+            'throughput_after_per_hour': _per_hour(after),
+        })
+    
+    def get_stats(self) -> dict:
+        """기준값과 재시작 기록 (재시작 전후 처리량 포함)"""
+        baseline_rss = self.baseline_rss_mb
+        baseline_per_mp = self.baseline_seconds_per_mp
+        return {
+            'baseline_seconds': round(self.baseline_seconds, 2) if self.baseline_seconds else None,
+            'baseline_seconds_per_mp': round(baseline_per_mp, 3) if baseline_per_mp else None,
+            'baseline_rss_mb': round(baseline_rss, 1) if baseline_rss else None,
+            'images': self.images,
+            'restarts': [dict(entry) for entry in self.restarts],
+        }
@@ -0,0 +1,295 @@
+"""내용 해시 기반 결과 캐시
+
+같은 원본 이미지가 다른 파일명으로 다시 들어오는 경우 Topaz를 다시 구동하지 않고
+이전 결과물을 하드링크(불가능하면 복사)로 재사용한다.
+
+캐시 키 = 설정 지문 + 파일 내용 해시
+    설정 지문: 모드, 대기 시간 설정, 앱 버전, RESULT_CACHE_TAG
+    앱 안의 모델/배율 설정은 자동화에서 읽을 수 없으므로, 앱 설정을 바꿨다면
+    RESULT_CACHE_TAG 값을 바꿔 이전 결과가 재사용되지 않게 해야 한다.
+
+해시는 청크 단위로 스트리밍 계산하며, 스레드 풀에서 GUI 루프보다 먼저
+계산해 두므로 처리 흐름을 지연시키지 않는다.
+
+인덱스는 append-only JSONL이다 (저장/삭제마다 한 줄 추가, 같은 키는 마지막 줄이 유효).
+파이프라인 모드에서는 여러 스레드가 lookup/store를 동시에 호출하므로 인덱스 변경은 잠금 안에서 한다.
+"""
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+from loguru import logger
+
+from .staging import link_or_copy
+
+try:
+    import win32api
+    WIN32_AVAILABLE = True
+except ImportError:
+    WIN32_AVAILABLE = False
+
+# 해시 계산 시 한 번에 읽을 크기
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(path: Path, chunk_size: int = HASH_CHUNK_SIZE) -> str:
+    """
+    파일 내용 해시 (BLAKE2b, 스트리밍)
+    
+    Args:
+        path: 파일 경로
+        chunk_size: 읽기 단위 (바이트)
+    
+    Returns:
+        16진수 해시 문자열
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(chunk_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def app_version(app_path) -> Optional[str]:
+    """
+    앱 실행 파일 버전 (Windows 파일 버전 정보)
+    
+    버전 정보를 읽을 수 없으면 실행 파일의 크기/수정 시각으로 대신한다.
+    
+    Args:
+        app_path: 실행 파일 경로
+    
+    Returns:
+        버전 문자열 (파일이 없으면 None)
+    """
+    app_path = Path(app_path)
+    if WIN32_AVAILABLE:
+        try:
+            info = win32api.GetFileVersionInfo(str(app_path), '\\')
+            ms, ls = info['FileVersionMS'], info['FileVersionLS']
+            return f"{ms >> 16}.{ms & 0xFFFF}.{ls >> 16}.{ls & 0xFFFF}"
+        except Exception:
+            pass
+    
+    try:
+        stat = app_path.stat()
+        return f"size{stat.st_size}-mtime{int(stat.st_mtime)}"
+    except OSError:
+        return None
+
+
+class ResultCache:
+    """설정 지문 + 내용 해시 -> 결과 파일 경로 인덱스"""
+    
+    def __init__(self, index_path: Path, settings: dict, workers: int = 4):
+        """
+        Args:
+            index_path: 인덱스 JSONL 파일 경로
+            settings: 결과에 영향을 주는 설정 (지문 계산용)
+            workers: 해시 계산 스레드 수
+        """
+        self.index_path = Path(index_path)
+        self.settings = settings
+        self.fingerprint = hashlib.sha1(
+            json.dumps(settings, sort_keys=True, default=str).encode('utf-8')
+        ).hexdigest()[:12]
+        
+        self._lock = threading.Lock()
+        self.entries: Dict[str, dict] = {}
+        self._lines = self._load()
+        
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        if self._needs_compaction():
+            self._compact()
+        self._file = open(self.index_path, 'a', encoding='utf-8')
+        
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='hash')
+        self._digests: Dict[Path, Future] = {}
+        
+        self.stats = {'hits': 0, 'misses': 0, 'stored': 0, 'stale': 0}
+    
+    def _load(self) -> int:
+        """
+        인덱스 재생 (손상된 줄은 무시)
+        
+        Returns:
+            읽은 줄 수
+        """
+        if not self.index_path.exists():
+            return 0
+        
+        lines = 0
+        with open(self.index_path, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                lines += 1
+                if not isinstance(record, dict) or 'key' not in record:
+                    continue
+                key = record.pop('key')
+                if record.get('dropped'):
+                    self.entries.pop(key, None)
+                else:
+                    self.entries[key] = record
+        return lines
+    
+    def _needs_compaction(self) -> bool:
+        """덮어쓰이거나 삭제된 줄이 유효 항목보다 훨씬 많아졌는지"""
+        return self._lines > 2 * len(self.entries) + 100
+    
+    def _compact(self):
+        """키별 마지막 항목만 남겨 인덱스 다시 쓰기 (임시 파일에 쓴 뒤 교체)"""
+        temp_path = self.index_path.with_suffix('.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for key, entry in self.entries.items():
+                f.write(json.dumps({'key': key, **entry}, ensure_ascii=False) + '\n')
+        os.replace(temp_path, self.index_path)
+        self._lines = len(self.entries)
+        logger.debug(f"Result cache index compacted: {len(self.entries)} entries")
+    
+    def _append(self, key: str, entry: dict):
+        """인덱스 파일에 한 줄 추가 (self._lock 안에서 호출)"""
+        if not self._file.closed:
+            self._file.write(json.dumps({'key': key, **entry}, ensure_ascii=False) + '\n')
+            self._file.flush()
+            self._lines += 1
+    
+    def prefetch(self, image_paths: list):
+        """
+        해시 계산을 백그라운드 스레드 풀에 미리 등록
+        
+        Args:
+            image_paths: 이미지 경로 리스트 (처리 순서대로)
+        """
+        with self._lock:
+            for path in image_paths:
+                path = Path(path)
+                if path not in self._digests:
+                    self._digests[path] = self._executor.submit(hash_file, path)
+    
+    def digest(self, image_path: Path) -> Optional[str]:
+        """
+        이미지의 내용 해시 (미리 계산 중이면 완료를 기다림)
+        
+        Returns:
+            해시 문자열 (읽기 실패 시 None)
+        """
+        image_path = Path(image_path)
+        self.prefetch([image_path])
+        try:
+            return self._digests[image_path].result()
+        except OSError as e:
+            logger.warning(f"Failed to hash {image_path.name}: {e}")
+            return None
+    
+    def _key(self, digest: str) -> str:
+        return f"{self.fingerprint}:{digest}"
+    
+    def lookup(self, image_path: Path) -> Optional[dict]:
+        """
+        같은 내용 + 같은 설정으로 만든 결과가 있으면 인덱스 항목 반환
+        
+        결과 파일이 사라진 항목은 인덱스에서 제거한다.
+        """
+        digest = self.digest(image_path)
+        if digest is None:
+            return None
+        
+        key = self._key(digest)
+        entry = self.entries.get(key)
+        if entry and not Path(entry['output']).exists():
+            with self._lock:
+                # 다른 스레드가 이미 지웠거나 새 결과를 저장했을 수 있음
+                if self.entries.get(key) is entry:
+                    logger.info(f"  Cached output missing, dropping entry: {entry['output']}")
+                    del self.entries[key]
+                    self._append(key, {'dropped': True})
+                    self.stats['stale'] += 1
+            entry = None
+        
+        with self._lock:
+            self.stats['hits' if entry else 'misses'] += 1
+        return entry
+    
+    def materialize(self, image_path: Path, entry: dict, output_dir: Path) -> Optional[Path]:
+        """
+        캐시된 결과를 이 입력의 결과물 위치에 링크/복사
+        
+        출력 파일명은 캐시된 결과 파일명에서 원본 이름 부분을 이 입력의 이름으로 바꿔 만든다.
+        (예: a.jpg -> a_upscaled.jpg 였다면 b.jpg -> b_upscaled.jpg)
+        
+        Args:
+            image_path: 입력 이미지 경로
+            entry: lookup() 결과
+            output_dir: 결과물을 둘 디렉토리
+        
+        Returns:
+            생성된 결과 파일 경로 (실패 시 None)
+        """
+        image_path = Path(image_path)
+        cached_output = Path(entry['output'])
+        source_stem = entry.get('source_stem', '')
+        
+        name = cached_output.name
+        if source_stem and name.lower().startswith(source_stem.lower()):
+            name = image_path.stem + name[len(source_stem):]
+        else:
+            name = f"{image_path.stem}{cached_output.suffix}"
+        
+        target = Path(output_dir) / name
+        if target.exists():
+            logger.info(f"  Output already present: {target.name}")
+            return target
+        
+        try:
+            method = link_or_copy(cached_output, target)
+        except OSError as e:
+            logger.warning(f"Failed to reuse cached output for {image_path.name}: {e}")
+            return None
+        
+        logger.info(f"  Reused cached output ({method}): {cached_output.name} -> {target.name}")
+        return target
+    
+    def store(self, image_path: Path, output_path: Path):
+        """
+        처리 결과를 인덱스에 기록
+        
+        Args:
+            image_path: 입력 이미지 경로
+            output_path: Topaz가 만든 결과 파일 경로
+        """
+        digest = self.digest(image_path)
+        if digest is None:
+            return
+        
+        key = self._key(digest)
+        entry = {
+            'output': str(Path(output_path).absolute()),
+            'source': str(Path(image_path).absolute()),
+            'source_stem': Path(image_path).stem,
+            'stored_at': datetime.now().isoformat(),
+        }
+        with self._lock:
+            self.entries[key] = entry
+            self._append(key, entry)
+            self.stats['stored'] += 1
+    
+    def get_stats(self) -> dict:
+        """적중/미적중/저장 횟수"""
+        return dict(self.stats)
+    
+    def close(self):
+        """해시 스레드 풀 종료 (남은 계산은 취소), 인덱스 파일 닫기 (많이 쌓였으면 압축)"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.close()
+            if self._needs_compaction():
+                self._compact()
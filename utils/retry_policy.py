@@ -0,0 +1,146 @@
+"""단계별 재시도 정책과 앱 재시작 서킷 브레이커
+
+재시도 정책:
+    열기/처리 대기/저장/다이얼로그 닫기 같은 단계가 실패하면 되돌리기(예: Esc) 후
+    지수 백오프로 기다렸다가 같은 단계만 다시 시도한다. 단계별 최대 시도 횟수를 따로 지정할 수 있다.
+
+서킷 브레이커:
+    이미지(청크)가 K번 연속 실패하면 앱이 멈춘 것으로 보고 앱을 종료 후 다시 실행한 뒤
+    마지막으로 실패한 이미지를 한 번 다시 처리한다. 앱이 멈춘 채로 남은 이미지가
+    모두 실패하는 것을 막는다.
+"""
+import time
+from typing import Callable, Dict, Optional, Tuple, Type
+from loguru import logger
+
+
+class RetryPolicy:
+    """단계 실행 -> 실패 시 되돌리기 후 백오프 재시도"""
+    
+    def __init__(
+        self,
+        attempts: int = 3,
+        step_attempts: Dict[str, int] = None,
+        base_delay: float = 1.0,
+        backoff: float = 2.0,
+        max_delay: float = 15.0,
+        fatal: Tuple[Type[BaseException], ...] = ()
+    ):
+        """
+        Args:
+            attempts: 단계별 기본 최대 시도 횟수
+            step_attempts: 단계 이름별 최대 시도 횟수 (기본값 대신 사용)
+            base_delay: 첫 재시도 전 대기 시간 (초)
+            backoff: 재시도마다 곱할 배율
+            max_delay: 재시도 대기 시간 상한 (초)
+            fatal: 재시도하지 않고 그대로 올릴 예외 타입 (예: 앱 멈춤)
+        """
+        self.attempts = max(1, attempts)
+        self.step_attempts = dict(step_attempts or {})
+        self.base_delay = base_delay
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.fatal = tuple(fatal)
+        
+        # 단계별 통계
+        self.stats: Dict[str, Dict[str, int]] = {}
+    
+    def attempts_for(self, name: str) -> int:
+        """단계의 최대 시도 횟수"""
+        return max(1, self.step_attempts.get(name, self.attempts))
+    
+    def run(self, name: str, step: Callable[[], Optional[bool]], rollback: Callable[[], None] = None) -> bool:
+        """
+        단계 실행
+        
+        Args:
+            name: 단계 이름 (로그/통계용)
+            step: 단계 함수. False를 반환하거나 예외가 나면 실패
+            rollback: 실패 후 재시도 전에 실행할 되돌리기 동작
+        
+        Returns:
+            성공 여부
+        """
+        stat = self.stats.setdefault(name, {'runs': 0, 'retries': 0, 'failures': 0})
+        stat['runs'] += 1
+        
+        attempts = self.attempts_for(name)
+        delay = self.base_delay
+        for attempt in range(1, attempts + 1):
+            if attempt > 1:
+                stat['retries'] += 1
+                logger.info(f"  Retrying step '{name}' in {delay:.1f}s (attempt {attempt}/{attempts})")
+                time.sleep(delay)
+                delay = min(delay * self.backoff, self.max_delay)
+            
+            try:
+                if step() is not False:
+                    return True
+                logger.warning(f"Step '{name}' failed (attempt {attempt}/{attempts})")
+            except Exception as e:
+                if isinstance(e, self.fatal):
+                    stat['failures'] += 1
+                    raise
+                logger.warning(f"Step '{name}' raised (attempt {attempt}/{attempts}): {e}")
+            
+            if rollback and attempt < attempts:
+                try:
+                    rollback()
+                except Exception as e:
+                    logger.debug(f"Rollback for '{name}' raised: {e}")
+        
+        stat['failures'] += 1
+        logger.error(f"Step '{name}' failed after {attempts} attempts")
+        return False
+    
+    def get_stats(self) -> dict:
+        """단계별 실행/재시도/실패 횟수"""
+        return {name: dict(stat) for name, stat in self.stats.items()}
+
+
+class CircuitBreaker:
+    """연속 실패 횟수를 세어 앱 재시작 시점을 알려줌"""
+    
+    def __init__(self, threshold: int = 3, max_restarts: int = 5):
+        """
+        Args:
+            threshold: 앱을 재시작할 연속 실패 횟수 (K)
+            max_restarts: 실행 한 번에 허용할 최대 재시작 횟수
+        """
+        self.threshold = max(1, threshold)
+        self.max_restarts = max_restarts
+        
+        self.consecutive_failures = 0
+        self.restarts = 0
+        self.replays = {'success': 0, 'failed': 0}
+    
+    @property
+    def can_restart(self) -> bool:
+        return self.restarts < self.max_restarts
+    
+    def record(self, success: bool) -> bool:
+        """
+        처리 결과 기록
+        
+        Returns:
+            연속 실패가 threshold에 도달했으면 True (앱 재시작 필요)
+        """
+        if success:
+            self.consecutive_failures = 0
+            return False
+        self.consecutive_failures += 1
+        return self.consecutive_failures >= self.threshold
+    
+    def restarted(self):
+        """앱 재시작 후 연속 실패 횟수 초기화"""
+        self.restarts += 1
+        self.consecutive_failures = 0
+    
+    def get_stats(self) -> dict:
+        """재시작 횟수와 재시작 후 다시 처리한 결과"""
+        return {
+            'threshold': self.threshold,
+            'restarts': self.restarts,
+            'replay_success': self.replays['success'],
+            'replay_failed': self.replays['failed'],
+        }
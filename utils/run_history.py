@@ -1,5 +1,6 @@
 """실행 기록 저장 유틸리티"""
 import json
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any
@@ -30,6 +31,7 @@ class RunHistory:
             "input_directory": None,
             "total_images": 0,
             "processed_images": [],
+            "metrics": {},
             "summary": {
                 "success": 0,
                 "failed": 0,
@@ -38,6 +40,11 @@ class RunHistory:
         }
         
         self.start_time = datetime.now()
+        
+        # 후처리 결과는 다른 스레드에서 들어오므로 잠금 사용
+        self._lock = threading.Lock()
+        # 이미지 결과보다 먼저 도착한 후처리 결과 {이미지 경로: 결과}
+        self._early_postprocess: Dict[str, Dict[str, Any]] = {}
     
     def set_config(self, config: Dict[str, Any]):
         """실행 설정 저장"""
@@ -51,12 +58,23 @@ class RunHistory:
         """전체 이미지 개수 저장"""
         self.run_data["total_images"] = total
     
+    def set_metrics(self, name: str, metrics: Dict[str, Any]):
+        """
+        실행 단위 측정값 저장 (예: 포커스 추적 통계)
+        
+        Args:
+            name: 측정 항목 이름
+            metrics: 측정값 딕셔너리
+        """
+        self.run_data["metrics"][name] = metrics
+    
     def add_image_result(
         self, 
         image_path: str, 
         success: bool, 
         duration: float = None,
-        error: str = None
+        error: str = None,
+        output_path: str = None
     ):
         """
         이미지 처리 결과 추가
@@ -66,6 +84,7 @@ class RunHistory:
             success: 성공 여부
             duration: 처리 시간 (초)
             error: 에러 메시지 (실패 시)
+            output_path: 결과 파일 경로 (찾은 경우)
         """
         result = {
             "image_path": str(image_path),
@@ -73,16 +92,41 @@ class RunHistory:
             "success": success,
             "duration_seconds": duration,
             "error": error,
+            "output_path": str(output_path) if output_path else None,
             "timestamp": datetime.now().isoformat()
         }
         
-        self.run_data["processed_images"].append(result)
+        with self._lock:
+            postprocess = self._early_postprocess.pop(str(image_path), None)
+            if postprocess is not None:
+                result["postprocess"] = postprocess
+            
+            self.run_data["processed_images"].append(result)
+            
+            # 요약 업데이트
+            if success:
+                self.run_data["summary"]["success"] += 1
+            else:
+                self.run_data["summary"]["failed"] += 1
+    
+    def add_postprocess_result(self, image_path: str, postprocess: Dict[str, Any]):
+        """
+        이미지의 후처리(결과물 검증 등) 결과 추가 (후처리 스레드에서 호출)
         
-        # 요약 업데이트
-        if success:
-            self.run_data["summary"]["success"] += 1
-        else:
-            self.run_data["summary"]["failed"] += 1
+        Args:
+            image_path: 입력 이미지 경로
+            postprocess: PostProcessor 결과 딕셔너리
+        """
+        with self._lock:
+            if not postprocess.get("ok"):
+                summary = self.run_data["summary"]
+                summary["postprocess_failed"] = summary.get("postprocess_failed", 0) + 1
+            
+            for result in reversed(self.run_data["processed_images"]):
+                if result["image_path"] == str(image_path):
+                    result["postprocess"] = postprocess
+                    return
+            self._early_postprocess[str(image_path)] = postprocess
     
     def finalize(self):
         """실행 종료 - 시간 계산 및 저장"""
@@ -94,7 +138,7 @@ class RunHistory:
         filename = f"run_{self.run_data['run_id']}.json"
         filepath = self.history_dir / filename
         
-        with open(filepath, 'w', encoding='utf-8') as f:
+        with self._lock, open(filepath, 'w', encoding='utf-8') as f:
             json.dump(self.run_data, f, indent=2, ensure_ascii=False)
         
         logger.info(f"  Run history saved: {filepath}")
@@ -0,0 +1,220 @@
+"""입력 폴더 탐색 캐시 (디렉토리 수정 시각 기준 증분 탐색)
+
+cron 등으로 같은 입력 트리를 반복 실행하면 바뀐 것이 없어도 매번 전체를 다시 나열한다.
+디렉토리에 파일이 생기거나 지워지거나 이름이 바뀌면 그 디렉토리의 수정 시각(mtime)이 바뀌므로
+디렉토리마다 (mtime, 하위 폴더, 이미지 파일 이름/크기/수정 시각)을 저장해 두고
+다음 탐색에서는 디렉토리마다 stat 한 번으로 mtime을 비교해 바뀐 디렉토리만 다시 나열한다.
+
+주의:
+    - 파일 내용만 덮어쓴 경우(같은 이름)는 디렉토리 mtime이 바뀌지 않으므로 캐시된 크기/수정 시각이
+      남는다. 디렉토리 목록은 max_age가 지나면 바뀌지 않았어도 다시 나열한다.
+    - 나열 직후 같은 mtime 단위 안에 생긴 변경을 놓치지 않도록, mtime이 나열 시각과
+      RACY_WINDOW_NS 이내인 디렉토리는 목록만 저장하고 다음 탐색에서 다시 나열한다.
+
+캐시 파일은 zlib으로 압축한 JSON 한 덩어리다 (디렉토리 경로만 전체 경로, 파일은 이름/크기/수정 시각).
+탐색을 끝까지 마친 뒤 바뀐 내용이 있을 때만 임시 파일에 쓰고 교체한다.
+"""
+import json
+import os
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterator, NamedTuple
+from loguru import logger
+
+FORMAT_VERSION = 1
+RACY_WINDOW_NS = 2_000_000_000  # FAT/SMB의 mtime 단위(2초)까지 고려
+
+
+class CachedStat(NamedTuple):
+    """ProcessedManifest 등이 쓰는 stat 값만 담은 결과"""
+    st_size: int
+    st_mtime_ns: int
+
+
+class CachedEntry:
+    """캐시에서 꺼낸 이미지 파일 항목 (os.DirEntry의 name/path/stat()만 제공)"""
+    
+    __slots__ = ('name', 'path', 'size', 'mtime_ns')
+    
+    def __init__(self, name: str, path: str, size: int, mtime_ns: int):
+        self.name = name
+        self.path = path
+        self.size = size
+        self.mtime_ns = mtime_ns
+    
+    def stat(self) -> CachedStat:
+        return CachedStat(self.size, self.mtime_ns)
+    
+    def is_file(self) -> bool:
+        return True
+    
+    def __repr__(self):
+        return f"<CachedEntry {self.name!r}>"
+
+
+class ScanCache:
+    """디렉토리별 mtime과 목록을 저장해 바뀐 디렉토리만 다시 나열"""
+    
+    def __init__(self, path: Path, extensions: FrozenSet[str], max_age: float = 24 * 3600):
+        """
+        Args:
+            path: 캐시 파일 경로
+            extensions: 소문자 확장자 집합 (바뀌면 기존 캐시를 버림)
+            max_age: 디렉토리 목록을 믿을 최대 시간 (초, 0이면 mtime이 같으면 계속 사용)
+        """
+        self.path = Path(path)
+        self.extensions = frozenset(extensions)
+        self.max_age = max_age
+        
+        # 절대 경로 -> [mtime_ns (None이면 다음에 다시 나열), 나열 시각(초), [하위 폴더 이름], [[이름, 크기, mtime_ns]]]
+        self.dirs: Dict[str, list] = {}
+        self._dirty = False
+        self.stats = {'scans': 0, 'dirs_cached': 0, 'dirs_listed': 0, 'dirs_missing': 0, 'files': 0, 'saved_bytes': 0}
+        
+        self._load()
+    
+    def _load(self):
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(zlib.decompress(self.path.read_bytes()))
+        except (OSError, ValueError, zlib.error) as e:
+            logger.warning(f"Scan cache unreadable, starting empty: {e}")
+            return
+        if data.get('version') != FORMAT_VERSION or frozenset(data.get('extensions', ())) != self.extensions:
+            logger.info("Scan cache format or image extensions changed, starting empty")
+            return
+        self.dirs = data.get('dirs', {})
+        logger.debug(f"Scan cache: {len(self.dirs)} directories")
+    
+    def _list(self, directory: str, key: str, mtime_ns: int) -> list:
+        """디렉토리 나열 후 레코드 저장 (나열 실패 시 None)"""
+        started_ns = time.time_ns()
+        try:
+            subdirs, files = [], []
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith('.'):
+                        continue
+                    try:
+                        if entry.is_file():
+                            dot = name.rfind('.')
+                            if dot > 0 and name[dot:].lower() in self.extensions:
+                                stat = entry.stat()
+                                files.append([name, stat.st_size, stat.st_mtime_ns])
+                        elif entry.is_dir(follow_symlinks=False):
+                            subdirs.append(name)
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.debug(f"Cannot list {directory}: {e}")
+            return None
+        
+        # 나열하는 동안이나 직후(같은 mtime 단위)에 바뀌었을 수 있으면 다음에 다시 나열
+        if mtime_ns >= started_ns - RACY_WINDOW_NS:
+            mtime_ns = None
+        record = [mtime_ns, int(started_ns // 1_000_000_000), sorted(subdirs), files]
+        self.dirs[key] = record
+        self._dirty = True
+        self.stats['dirs_listed'] += 1
+        return record
+    
+    def _record(self, directory: str, key: str):
+        """캐시된 레코드 (mtime이 같고 max_age 이내면) 또는 새로 나열한 레코드"""
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            if self.dirs.pop(key, None) is not None:
+                self._dirty = True
+            self.stats['dirs_missing'] += 1
+            return None
+        
+        record = self.dirs.get(key)
+        if (
+            record is not None and record[0] == mtime_ns
+            and (not self.max_age or time.time() - record[1] < self.max_age)
+        ):
+            self.stats['dirs_cached'] += 1
+            return record
+        return self._list(directory, key, mtime_ns)
+    
+    def scan(self, directory: Path, recursive: bool = False) -> Iterator[CachedEntry]:
+        """
+        이미지 파일 항목 생성 (scan_image_entries와 같은 항목/순서, 바뀐 디렉토리만 다시 나열)
+        
+        끝까지 탐색하면 사라진 하위 폴더 레코드를 지우고 바뀐 내용이 있으면 캐시 파일에 쓴다.
+        
+        Args:
+            directory: 검색할 디렉토리
+            recursive: 하위 폴더까지 검색 (심볼릭 링크 폴더는 따라가지 않음)
+        
+        Yields:
+            CachedEntry (stat()은 나열할 때의 크기/수정 시각)
+        """
+        self.stats['scans'] += 1
+        root = os.fspath(directory)
+        root_key = os.path.abspath(root)
+        visited = set()
+        pending = [(root, root_key)]
+        
+        while pending:
+            current, key = pending.pop()
+            visited.add(key)
+            record = self._record(current, key)
+            if record is None:
+                continue
+            
+            prefix = os.path.join(current, '')
+            self.stats['files'] += len(record[3])
+            for name, size, mtime_ns in record[3]:
+                yield CachedEntry(name, prefix + name, size, mtime_ns)
+            
+            if recursive:
+                # 이름순에 가깝게 처리되도록 뒤집어서 스택에 넣음
+                pending.extend(
+                    (os.path.join(current, name), os.path.join(key, name)) for name in reversed(record[2])
+                )
+        
+        if recursive:
+            self._prune(root_key, visited)
+        self.save()
+    
+    def _prune(self, root_key: str, visited: set):
+        """root 아래에서 이번 탐색에 나오지 않은(삭제/이동된) 폴더 레코드 제거"""
+        prefix = os.path.join(root_key, '')
+        stale = [key for key in self.dirs if key.startswith(prefix) and key not in visited]
+        for key in stale:
+            del self.dirs[key]
+        if stale:
+            self._dirty = True
+            logger.debug(f"Scan cache: dropped {len(stale)} removed directories")
+    
+    def save(self):
+        """바뀐 내용이 있으면 캐시 파일 다시 쓰기 (임시 파일에 쓴 뒤 교체)"""
+        if not self._dirty:
+            return
+        data = {'version': FORMAT_VERSION, 'extensions': sorted(self.extensions), 'dirs': self.dirs}
+        payload = zlib.compress(json.dumps(data, separators=(',', ':')).encode('ascii'))
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix('.tmp')
+        try:
+            temp_path.write_bytes(payload)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Cannot write scan cache {self.path}: {e}")
+            return
+        self._dirty = False
+        self.stats['saved_bytes'] = len(payload)
+    
+    def get_stats(self) -> dict:
+        """캐시/새로 나열한 디렉토리 수, 생성한 파일 항목 수, 캐시 크기"""
+        stats = dict(self.stats)
+        stats['directories'] = len(self.dirs)
+        return stats
+    
+    def close(self):
+        """남은 변경 저장 (끝까지 탐색하지 않은 경우)"""
+        self.save()
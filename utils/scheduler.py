@@ -0,0 +1,150 @@
+"""배치 처리 순서 스케줄러
+
+이름순 처리에서는 200MP 이미지 한 장이 뒤에 있는 수십 장의 썸네일을 막을 수 있다.
+헤더에서 읽은 해상도로 이미지별 예상 처리 시간을 추정하고, 선택한 정책으로
+작업 순서를 바꾼다.
+
+정책:
+    name: 파일명 순서 (기존 동작)
+    sjf:  예상 시간이 짧은 이미지부터 (평균 대기 시간 최소화)
+    ljf:  예상 시간이 긴 이미지부터 (긴 작업을 먼저 끝내 꼬리 지연 감소)
+    dims: 같은 크기끼리 묶어서 (앱 내부 캐시/설정 재사용)
+
+예상 처리 시간 = base_seconds + seconds_per_mp × 메가픽셀
+
+하위 폴더까지 검색한 경우 정책은 폴더 안에서만 적용하고 폴더 순서는 유지한다
+(배치 큐/Photo AI 청크는 폴더가 바뀌면 새 청크를 시작하므로 폴더가 섞이면 청크가 작아짐).
+"""
+import time
+from pathlib import Path
+from typing import Dict, List
+from loguru import logger
+
+from .image_info import read_dimensions
+
+POLICIES = ('name', 'sjf', 'ljf', 'dims')
+
+
+class JobScheduler:
+    """정책에 따라 작업 순서를 정하고 예상/실제 처리량을 비교"""
+    
+    def __init__(
+        self,
+        policy: str = 'name',
+        base_seconds: float = 30.0,
+        seconds_per_mp: float = 1.0,
+        unknown_megapixels: float = 24.0
+    ):
+        """
+        Args:
+            policy: 'name', 'sjf', 'ljf', 'dims'
+            base_seconds: 이미지당 고정 처리 시간 추정치 (초)
+            seconds_per_mp: 메가픽셀당 추가 처리 시간 추정치 (초)
+            unknown_megapixels: 헤더를 읽지 못한 이미지에 가정할 메가픽셀
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown schedule policy: {policy} (choose from {', '.join(POLICIES)})")
+        
+        self.policy = policy
+        self.base_seconds = base_seconds
+        self.seconds_per_mp = seconds_per_mp
+        self.unknown_megapixels = unknown_megapixels
+        
+        self.estimates: Dict[Path, float] = {}
+        self.order: List[Path] = []
+        self.started_at = None
+        self.completions: Dict[Path, float] = {}
+    
+    def estimate(self, megapixels: float) -> float:
+        """메가픽셀로 예상 처리 시간 계산 (초)"""
+        return self.base_seconds + self.seconds_per_mp * megapixels
+    
+    def schedule(self, image_paths: list) -> list:
+        """
+        정책에 따라 처리 순서 결정 (이 시점부터 실제 처리 시간 측정 시작)
+        
+        Args:
+            image_paths: 이미지 경로 리스트 (이름순, 폴더별로 이어져 있음)
+        
+        Returns:
+            정렬된 이미지 경로 리스트 (폴더 순서는 그대로)
+        """
+        folders = {}
+        dimensions = {}
+        for path in image_paths:
+            size = read_dimensions(path)
+            dimensions[path] = size
+            megapixels = size[0] * size[1] / 1_000_000 if size else self.unknown_megapixels
+            self.estimates[path] = self.estimate(megapixels)
+            folders.setdefault(path.parent, len(folders))
+        
+        if self.policy == 'sjf':
+            ordered = sorted(image_paths, key=lambda p: (folders[p.parent], self.estimates[p]))
+        elif self.policy == 'ljf':
+            ordered = sorted(image_paths, key=lambda p: (folders[p.parent], -self.estimates[p]))
+        elif self.policy == 'dims':
+            # 크기를 모르는 이미지는 폴더의 마지막에
+            ordered = sorted(
+                image_paths,
+                key=lambda p: (folders[p.parent], dimensions[p] is None, dimensions[p] or (0, 0))
+            )
+        else:
+            ordered = list(image_paths)
+        
+        self.order = ordered
+        self.started_at = time.time()
+        self.completions = {}
+        
+        expected = self.expected_stats()
+        logger.info(f"Schedule policy '{self.policy}': {len(ordered)} images, "
+                    f"expected {expected['throughput_per_hour']:.0f} img/h, "
+                    f"mean latency {expected['mean_latency']:.0f}s")
+        return ordered
+    
+    def record(self, image_path: Path):
+        """이미지 처리 완료 시각 기록"""
+        if self.started_at is not None:
+            self.completions[Path(image_path)] = time.time() - self.started_at
+    
+    def expected_stats(self) -> dict:
+        """
+        예상 처리량과 평균 지연 시간 (모든 작업이 시작 시점에 대기열에 있다고 가정)
+        
+        Returns:
+            {'total_seconds', 'throughput_per_hour', 'mean_latency'}
+        """
+        elapsed = 0.0
+        latencies = []
+        for path in self.order:
+            elapsed += self.estimates[path]
+            latencies.append(elapsed)
+        
+        return {
+            'total_seconds': round(elapsed, 1),
+            'throughput_per_hour': round(len(latencies) / elapsed * 3600, 1) if elapsed else 0.0,
+            'mean_latency': round(sum(latencies) / len(latencies), 1) if latencies else 0.0,
+        }
+    
+    def achieved_stats(self) -> dict:
+        """
+        실제 처리량과 평균 지연 시간 (완료된 이미지 기준)
+        
+        Returns:
+            {'completed', 'total_seconds', 'throughput_per_hour', 'mean_latency'}
+        """
+        latencies = list(self.completions.values())
+        elapsed = max(latencies) if latencies else 0.0
+        return {
+            'completed': len(latencies),
+            'total_seconds': round(elapsed, 1),
+            'throughput_per_hour': round(len(latencies) / elapsed * 3600, 1) if elapsed else 0.0,
+            'mean_latency': round(sum(latencies) / len(latencies), 1) if latencies else 0.0,
+        }
+    
+    def summary(self) -> dict:
+        """정책, 예상/실제 통계"""
+        return {
+            'policy': self.policy,
+            'expected': self.expected_stats(),
+            'achieved': self.achieved_stats(),
+        }
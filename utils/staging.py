@@ -0,0 +1,152 @@
+"""스테이징 디렉토리 유틸리티
+
+파일 다이얼로그에서 "디렉토리 이동 → Ctrl+A"로 여는 방식은 폴더 안의 모든 파일을
+불러오므로, 대상 이미지만 링크한 임시 디렉토리를 만들어 그 폴더를 열게 한다.
+
+링크 방식은 하드링크 → 심볼릭 링크 → 복사 순으로 시도한다.
+하드링크는 같은 볼륨에서만 가능하므로 기본 위치는 원본 폴더 아래의 숨김 폴더이다.
+"""
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Dict, List
+from loguru import logger
+
+# 스테이징 폴더 이름 접두사 (이미지 검색 시 제외용)
+STAGING_PREFIX = '.topaz_staging_'
+
+
+def link_or_copy(source: Path, target: Path) -> str:
+    """
+    source를 target 위치에 하드링크 → 심볼릭 링크 → 복사 순으로 생성
+    
+    Args:
+        source: 원본 파일
+        target: 만들 경로
+    
+    Returns:
+        사용한 방식 ('hardlink', 'symlink', 'copy')
+    """
+    try:
+        os.link(source, target)
+        return 'hardlink'
+    except OSError:
+        pass
+    
+    try:
+        os.symlink(source, target)
+        return 'symlink'
+    except OSError:
+        pass
+    
+    shutil.copy2(source, target)
+    return 'copy'
+
+
+class StagingDirectory:
+    """대상 이미지만 담은 임시 디렉토리 (with 문으로 사용)"""
+    
+    def __init__(self, image_paths: List[Path], root: Path = None, replacements: Dict[Path, Path] = None):
+        """
+        Args:
+            image_paths: 스테이징할 이미지 경로 리스트
+            root: 스테이징 폴더를 만들 위치 (None이면 첫 이미지의 폴더)
+            replacements: {원본 경로: 대신 링크할 파일} (사전 정규화된 파일 등)
+        """
+        self.image_paths = [Path(p) for p in image_paths]
+        self.replacements = {Path(k): Path(v) for k, v in (replacements or {}).items()}
+        self.root = Path(root) if root else self.image_paths[0].parent
+        self.path = self.root / f"{STAGING_PREFIX}{uuid.uuid4().hex[:8]}"
+        
+        # 스테이징 경로 -> 원본 경로
+        self.mapping: Dict[Path, Path] = {}
+        self.methods: Dict[str, int] = {}
+        
+        # 정리할 때 원본 폴더로 옮긴 결과물
+        self.outputs: List[Path] = []
+    
+    @property
+    def staged_paths(self) -> List[Path]:
+        """스테이징된 파일 경로 리스트 (원본 순서 유지)"""
+        return list(self.mapping)
+    
+    def original_of(self, staged_path: Path) -> Path:
+        """스테이징 경로의 원본 경로"""
+        return self.mapping[Path(staged_path)]
+    
+    def create(self) -> List[Path]:
+        """
+        스테이징 폴더 생성 및 링크
+        
+        Returns:
+            스테이징된 파일 경로 리스트
+        """
+        self.path.mkdir(parents=True, exist_ok=False)
+        
+        for source in self.image_paths:
+            linked = self.replacements.get(source, source)
+            target = self.path / linked.name
+            counter = 1
+            while target.exists():
+                target = self.path / f"{linked.stem}_{counter}{linked.suffix}"
+                counter += 1
+            
+            method = link_or_copy(linked.absolute(), target)
+            self.methods[method] = self.methods.get(method, 0) + 1
+            self.mapping[target] = source
+        
+        logger.info(f"Staged {len(self.mapping)} images in {self.path} {self.methods}")
+        return self.staged_paths
+    
+    def cleanup(self):
+        """
+        스테이징 폴더 정리
+        
+        앱이 스테이징 폴더에 저장한 결과물(원본과 같은 폴더로 Export한 경우)은
+        원본 이미지의 폴더로 옮긴 뒤 링크와 폴더를 삭제한다.
+        앱이 파일을 잡고 있어 지우지 못한 항목은 경고만 남긴다.
+        """
+        if not self.path.exists():
+            return
+        
+        fallback_dir = self.image_paths[0].parent
+        
+        for entry in list(self.path.iterdir()):
+            if entry in self.mapping:
+                try:
+                    entry.unlink()
+                except OSError as e:
+                    logger.warning(f"Failed to remove staged file {entry.name}: {e}")
+                continue
+            
+            # 앱이 만든 결과물 → 원본 폴더로 이동
+            destination = fallback_dir / entry.name
+            if destination.exists():
+                counter = 1
+                while destination.exists():
+                    destination = fallback_dir / f"{entry.stem}_{counter}{entry.suffix}"
+                    counter += 1
+            try:
+                shutil.move(str(entry), str(destination))
+                self.outputs.append(destination)
+                logger.info(f"  Moved output out of staging: {destination.name}")
+            except OSError as e:
+                logger.warning(f"Failed to move {entry.name} out of staging: {e}")
+        
+        try:
+            self.path.rmdir()
+        except OSError as e:
+            logger.warning(f"Staging directory not removed ({e}): {self.path}")
+    
+    def __enter__(self) -> 'StagingDirectory':
+        try:
+            self.create()
+        except Exception:
+            self.cleanup()
+            raise
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.cleanup()
+        return False
@@ -25,6 +25,22 @@ class UIDetector:
         logger.debug(f"UIDetector initialized (confidence={confidence})")
         logger.debug(f"Template directory: {self.template_dir}")
     
+    def template_path(self, template_name: str) -> Optional[Path]:
+        """
+        템플릿 이미지 파일 경로 (png, jpg 지원)
+        
+        Args:
+            template_name: 템플릿 이미지 파일명 (확장자 제외)
+        
+        Returns:
+            파일 경로 (없으면 None)
+        """
+        for ext in ['.png', '.jpg', '.jpeg']:
+            path = self.template_dir / f"{template_name}{ext}"
+            if path.exists():
+                return path
+        return None
+    
     def find_button(self, template_name: str, confidence: float = None) -> Optional[Tuple[int, int]]:
         """
         화면에서 버튼 찾기
@@ -47,12 +63,7 @@ class UIDetector:
             confidence = low_confidence_templates.get(template_name, self.confidence)
         
         # 템플릿 파일 찾기 (png, jpg 지원)
-        template_path = None
-        for ext in ['.png', '.jpg', '.jpeg']:
-            path = self.template_dir / f"{template_name}{ext}"
-            if path.exists():
-                template_path = path
-                break
+        template_path = self.template_path(template_name)
         
         if not template_path:
             logger.warning(f"Template not found: {template_name}")
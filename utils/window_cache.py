@@ -0,0 +1,137 @@
+"""윈도우 핸들 캐시
+
+EnumWindows로 모든 최상위 윈도우를 순회하는 비용을 줄이기 위해
+타이틀 패턴별로 찾은 핸들을 캐시하고, 다음 조회 시에는 저렴한 검증
+(핸들 유효성 + 가시성 + 타이틀 포함 여부)만 수행한다.
+검증에 실패한 경우에만 전체 재열거를 한다.
+
+플랫폼 API는 WindowBackend 인터페이스 뒤에 숨겨져 있으므로
+Linux에서도 가짜 백엔드로 캐시 동작을 검증할 수 있다.
+"""
+from typing import Dict, List
+from loguru import logger
+
+try:
+    import win32gui
+    WIN32_AVAILABLE = True
+except ImportError:
+    WIN32_AVAILABLE = False
+
+
+class WindowBackend:
+    """플랫폼 독립적인 윈도우 조회 인터페이스"""
+
+    def is_window(self, hwnd: int) -> bool:
+        """핸들이 아직 유효한 윈도우를 가리키는지 확인"""
+        raise NotImplementedError
+
+    def is_visible(self, hwnd: int) -> bool:
+        """윈도우가 화면에 보이는지 확인"""
+        raise NotImplementedError
+
+    def get_title(self, hwnd: int) -> str:
+        """윈도우 타이틀 반환"""
+        raise NotImplementedError
+
+    def enum_windows(self) -> List[int]:
+        """모든 최상위 윈도우 핸들을 Z-order 순으로 반환"""
+        raise NotImplementedError
+
+    def get_foreground_window(self) -> int:
+        """현재 포그라운드 윈도우 핸들 반환 (없으면 0)"""
+        raise NotImplementedError
+
+
+class Win32WindowBackend(WindowBackend):
+    """pywin32 기반 윈도우 백엔드"""
+
+    def is_window(self, hwnd: int) -> bool:
+        return bool(hwnd) and bool(win32gui.IsWindow(hwnd))
+
+    def is_visible(self, hwnd: int) -> bool:
+        return bool(win32gui.IsWindowVisible(hwnd))
+
+    def get_title(self, hwnd: int) -> str:
+        return win32gui.GetWindowText(hwnd)
+
+    def enum_windows(self) -> List[int]:
+        handles = []
+
+        def callback(hwnd, param):
+            handles.append(hwnd)
+            return True
+
+        win32gui.EnumWindows(callback, None)
+        return handles
+
+    def get_foreground_window(self) -> int:
+        return win32gui.GetForegroundWindow() or 0
+
+
+class WindowHandleCache:
+    """타이틀 패턴별 윈도우 핸들 캐시"""
+
+    def __init__(self, backend: WindowBackend):
+        """
+        Args:
+            backend: 윈도우 조회 백엔드
+        """
+        self.backend = backend
+        self._handles: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _matches(self, hwnd: int, pattern: str) -> bool:
+        """핸들이 패턴과 일치하는 보이는 윈도우인지 확인 (pattern은 소문자)"""
+        try:
+            if not self.backend.is_window(hwnd) or not self.backend.is_visible(hwnd):
+                return False
+            return pattern in self.backend.get_title(hwnd).lower()
+        except Exception as e:
+            logger.debug(f"Window validation failed for {hwnd}: {e}")
+            return False
+
+    def find(self, title_pattern: str) -> int:
+        """
+        제목 패턴으로 윈도우 핸들 조회 (캐시 우선)
+
+        Args:
+            title_pattern: 윈도우 제목에 포함될 문자열 (대소문자 무시)
+
+        Returns:
+            윈도우 핸들 (찾지 못하면 0)
+        """
+        key = title_pattern.lower()
+
+        # 1. 캐시된 핸들의 저렴한 검증
+        hwnd = self._handles.get(key)
+        if hwnd and self._matches(hwnd, key):
+            self.hits += 1
+            return hwnd
+
+        # 2. 미스: 전체 재열거
+        self.misses += 1
+        self._handles.pop(key, None)
+
+        for candidate in self.backend.enum_windows():
+            if self._matches(candidate, key):
+                self._handles[key] = candidate
+                return candidate
+
+        return 0
+
+    def invalidate(self, title_pattern: str = None):
+        """
+        캐시 무효화
+
+        Args:
+            title_pattern: 무효화할 패턴 (None이면 전체)
+        """
+        if title_pattern is None:
+            self._handles.clear()
+        else:
+            self._handles.pop(title_pattern.lower(), None)
+
+    def get_stats(self) -> dict:
+        """캐시 적중 통계 반환"""
+        return {'hits': self.hits, 'misses': self.misses}
@@ -13,15 +13,22 @@ except ImportError:
     WIN32_AVAILABLE = False
     logger.warning("pywin32 not available - some features may be limited")
 
+from .window_cache import WindowHandleCache, Win32WindowBackend
+
 
 class WindowManager:
     """윈도우 관리 유틸리티"""
     
+    # 타이틀 패턴별 핸들 캐시 (모든 호출자가 공유)
+    handle_cache = WindowHandleCache(Win32WindowBackend())
+    
     @staticmethod
     def find_window_by_title(title_pattern: str) -> int:
         """
         제목으로 윈도우 찾기
         
+        캐시된 핸들이 여전히 유효하면 EnumWindows 없이 바로 반환한다.
+        
         Args:
             title_pattern: 윈도우 제목에 포함될 문자열
         
@@ -32,30 +39,23 @@ class WindowManager:
             logger.warning("win32gui not available")
             return 0
         
-        def callback(hwnd, windows):
-            if win32gui.IsWindowVisible(hwnd):
-                title = win32gui.GetWindowText(hwnd)
-                if title_pattern.lower() in title.lower():
-                    windows.append(hwnd)
-            return True
+        hwnd = WindowManager.handle_cache.find(title_pattern)
         
-        windows = []
-        win32gui.EnumWindows(callback, windows)
-        
-        if windows:
-            logger.debug(f"Found window with title containing '{title_pattern}': {windows[0]}")
-            return windows[0]
+        if hwnd:
+            logger.debug(f"Found window with title containing '{title_pattern}': {hwnd}")
+            return hwnd
         
         logger.warning(f"Window not found with title pattern: {title_pattern}")
         return 0
     
     @staticmethod
-    def activate_window(hwnd: int) -> bool:
+    def activate_window(hwnd: int, settle: float = 0.5) -> bool:
         """
         윈도우 활성화
         
         Args:
             hwnd: 윈도우 핸들
+            settle: 활성화 후 대기 시간 (초)
         
         Returns:
             성공 여부
@@ -70,7 +70,7 @@ class WindowManager:
             
             # 윈도우를 맨 앞으로
             win32gui.SetForegroundWindow(hwnd)
-            time.sleep(0.5)  # 활성화 대기
+            time.sleep(settle)  # 활성화 대기
             
             logger.debug(f"Window activated: {hwnd}")
             return True
@@ -99,6 +99,36 @@ class WindowManager:
         
         return False
     
+    @staticmethod
+    def terminate_process(process_name: str, timeout: float = 10) -> bool:
+        """
+        프로세스 종료 (정상 종료 요청 후 timeout 안에 끝나지 않으면 강제 종료)
+        
+        Args:
+            process_name: 프로세스 이름
+            timeout: 정상 종료 대기 시간 (초)
+        
+        Returns:
+            실행 중인 프로세스가 남지 않았으면 True
+        """
+        try:
+            procs = [
+                proc for proc in psutil.process_iter(['name'])
+                if proc.info['name'] and process_name.lower() in proc.info['name'].lower()
+            ]
+            for proc in procs:
+                proc.terminate()
+            _, alive = psutil.wait_procs(procs, timeout=timeout)
+            for proc in alive:
+                logger.warning(f"Killing unresponsive process {proc.pid}")
+                proc.kill()
+            psutil.wait_procs(alive, timeout=timeout)
+        except Exception as e:
+            logger.error(f"Error terminating process: {e}")
+            return False
+        
+        return not WindowManager.is_process_running(process_name)
+    
     @staticmethod
     def wait_for_window(title_pattern: str, timeout: int = 30) -> int:
         """